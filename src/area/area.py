@@ -58,12 +58,13 @@ class Area:
                                  conf.INITIAL_SEQUENCE_NUMBER, version)
         router_lsa.create_router_lsa_body(False, False, is_abr, options, version)
         if version == conf.VERSION_IPV4:
-            for i in range(len(physical_ids)):
-                identifier = physical_ids[i]
-                prefix = utils.Utils.interface_name_to_ipv4_prefix_and_length(identifier)[0]
-                netmask = utils.Utils.interface_name_to_ipv4_network_mask(identifier)
-                cost = interface_costs[i]
-                router_lsa.add_link_info_v2(prefix, netmask, conf.LINK_TO_STUB_NETWORK, conf.DEFAULT_TOS, cost)
+            with router_lsa.edit():
+                for i in range(len(physical_ids)):
+                    identifier = physical_ids[i]
+                    prefix = utils.Utils.interface_name_to_ipv4_prefix_and_length(identifier)[0]
+                    netmask = utils.Utils.interface_name_to_ipv4_network_mask(identifier)
+                    cost = interface_costs[i]
+                    router_lsa.add_link_info_v2(prefix, netmask, conf.LINK_TO_STUB_NETWORK, conf.DEFAULT_TOS, cost)
         database.add_lsa(router_lsa, None)
 
         if version == conf.VERSION_IPV6:
@@ -76,15 +77,16 @@ class Area:
                 conf.INITIAL_SEQUENCE_NUMBER, version)
             intra_area_prefix_lsa.create_intra_area_prefix_lsa_body(referenced_ls_type, referenced_link_state_id,
                                                                     referenced_advertising_router)
-            for i in range(len(physical_ids)):
-                identifier = physical_ids[i]
-                prefix_data = utils.Utils.interface_name_to_ipv6_prefix_and_length(identifier)
-                prefix_length = prefix_data[1]
-                prefix_options = conf.PREFIX_OPTIONS
-                metric = interface_costs[i]
-                prefix = prefix_data[0]
-                intra_area_prefix_lsa.add_prefix_info(
-                    prefix_length, prefix_options, metric, prefix, conf.LSA_TYPE_INTRA_AREA_PREFIX)
+            with intra_area_prefix_lsa.edit():
+                for i in range(len(physical_ids)):
+                    identifier = physical_ids[i]
+                    prefix_data = utils.Utils.interface_name_to_ipv6_prefix_and_length(identifier)
+                    prefix_length = prefix_data[1]
+                    prefix_options = conf.PREFIX_OPTIONS
+                    metric = interface_costs[i]
+                    prefix = prefix_data[0]
+                    intra_area_prefix_lsa.add_prefix_info(
+                        prefix_length, prefix_options, metric, prefix, conf.LSA_TYPE_INTRA_AREA_PREFIX)
             database.add_lsa(intra_area_prefix_lsa, None)
         return database
 
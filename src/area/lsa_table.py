@@ -0,0 +1,177 @@
+import array
+
+import conf.conf as conf
+import general.utils as utils
+import lsa.header as header
+
+try:  # Optional - Used to scan large tables
+    import numpy
+except ImportError:
+    numpy = None
+
+'''
+This class stores the header fields of the LSAs in an area LSDB as columns, one row per LSA, so that the whole LSDB
+can be aged and searched with vectorized operations when NumPy is available
+'''
+
+NUMPY_TABLE_THRESHOLD = 64  # Minimum number of rows or LSA headers for table to be scanned with NumPy
+#  Column name -> Type code of the array storing the column
+#  H - Unsigned short (2 bytes), I - Unsigned int (4 bytes), i - Signed int (4 bytes), d - Double (8 bytes)
+COLUMNS = {'ls_type': 'H', 'advertising_router': 'I', 'ls_sequence_number': 'i', 'ls_checksum': 'H', 'options': 'I',
+           'installation_age': 'H', 'ls_age': 'H', 'installation_time': 'd'}
+
+
+class LsaTable:
+
+    def __init__(self):
+        self.keys = []  # LSA index key of each row
+        self.rows = {}  # LSA index key -> Row
+        self.columns = {}
+        for name in COLUMNS:
+            self.columns[name] = array.array(COLUMNS[name])
+
+    def __len__(self):
+        return len(self.keys)
+
+    #  Adds a row with the header fields of provided LSA, or updates the row if LSA is already in the table
+    def add_lsa(self, key, lsa_instance):
+        lsa_header = lsa_instance.header
+        values = {'ls_type': lsa_header.ls_type,
+                  'advertising_router': utils.Utils.ipv4_to_decimal(lsa_header.advertising_router),
+                  'ls_sequence_number': LsaTable.to_signed_sequence_number(lsa_header.ls_sequence_number),
+                  'ls_checksum': lsa_header.ls_checksum, 'options': lsa_header.options,
+                  'installation_age': lsa_header.ls_age, 'ls_age': lsa_header.ls_age,
+                  'installation_time': lsa_instance.system_time}  # Time at which LS Age was last set
+        row = self.rows.get(key)
+        if row is None:
+            self.rows[key] = len(self.keys)
+            self.keys.append(key)
+            for name in COLUMNS:
+                self.columns[name].append(values[name])
+        else:
+            for name in COLUMNS:
+                self.columns[name][row] = values[name]
+
+    #  Deletes the row of provided LSA, if present, by moving the last row into its place
+    def delete_lsa(self, key):
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        last_key = self.keys.pop()
+        for name in COLUMNS:
+            last_value = self.columns[name].pop()
+            if row < len(self.keys):
+                self.columns[name][row] = last_value
+        if row < len(self.keys):
+            self.keys[row] = last_key
+            self.rows[last_key] = row
+
+    #  Sets LS Age of all rows according to provided time, and returns the keys and new LS Age of rows that changed
+    def update_ls_ages(self, current_time):
+        changed_rows = []
+        if self.is_numpy_scan(len(self.keys)):
+            installation_ages = self.get_numpy_column('installation_age').astype(numpy.int64)
+            elapsed_times = (current_time - self.get_numpy_column('installation_time')).astype(numpy.int64)
+            ls_ages = numpy.minimum(installation_ages + elapsed_times, conf.MAX_AGE)
+            stored_ls_ages = self.get_numpy_column('ls_age')
+            rows = numpy.flatnonzero(ls_ages != stored_ls_ages)
+            stored_ls_ages[rows] = ls_ages[rows]
+            for row, ls_age in zip(rows.tolist(), ls_ages[rows].tolist()):
+                changed_rows.append((self.keys[row], ls_age))
+        else:
+            stored_ls_ages = self.columns['ls_age']
+            for row in range(len(self.keys)):
+                ls_age = min(self.columns['installation_age'][row] + int(
+                    current_time - self.columns['installation_time'][row]), conf.MAX_AGE)
+                if ls_age != stored_ls_ages[row]:
+                    stored_ls_ages[row] = ls_age
+                    changed_rows.append((self.keys[row], ls_age))
+        return changed_rows
+
+    #  Returns keys of LSAs with at least provided LS Age and, if provided, with given Advertising Router
+    def get_keys(self, minimum_ls_age, advertising_router):
+        if advertising_router is not None:
+            advertising_router = utils.Utils.ipv4_to_decimal(advertising_router)
+        if self.is_numpy_scan(len(self.keys)):
+            mask = self.get_numpy_column('ls_age') >= minimum_ls_age
+            if advertising_router is not None:
+                mask &= self.get_numpy_column('advertising_router') == advertising_router
+            return [self.keys[row] for row in numpy.flatnonzero(mask).tolist()]
+        keys = []
+        for row in range(len(self.keys)):
+            if self.columns['ls_age'][row] >= minimum_ls_age:
+                if (advertising_router is None) | (self.columns['advertising_router'][row] == advertising_router):
+                    keys.append(self.keys[row])
+        return keys
+
+    #  Returns number of LSAs with provided LS Type, or of all LSAs if no LS Type is provided
+    def get_lsa_count(self, ls_type):
+        if ls_type is None:
+            return len(self.keys)
+        ls_type = header.Header.get_ls_type(ls_type)
+        if self.is_numpy_scan(len(self.keys)):
+            return int(numpy.count_nonzero(header.Header.get_ls_type(self.get_numpy_column('ls_type')) == ls_type))
+        lsa_count = 0
+        for query_ls_type in self.columns['ls_type']:
+            if header.Header.get_ls_type(query_ls_type) == ls_type:
+                lsa_count += 1
+        return lsa_count
+
+    #  Returns positions of provided LSA headers whose instance is fresher than the one in the table, or is not present
+    #  Keys must match the LSA headers, and each instance is compared through Sequence Number, checksum and LS Age
+    def get_fresher_positions(self, keys, lsa_headers):
+        if self.is_numpy_scan(len(lsa_headers)):
+            header_number = len(lsa_headers)
+            rows = numpy.fromiter((self.rows.get(key, -1) for key in keys), dtype=numpy.int64, count=header_number)
+            is_present = rows >= 0
+            present_rows = rows[is_present]
+            is_fresher = numpy.logical_not(is_present)
+            is_fresher[is_present] = LsaTable.is_fresher(
+                numpy.fromiter((LsaTable.to_signed_sequence_number(h.ls_sequence_number) for h in lsa_headers),
+                               dtype=numpy.int64, count=header_number)[is_present],
+                numpy.fromiter((h.ls_checksum for h in lsa_headers), dtype=numpy.int64, count=header_number)[
+                    is_present],
+                numpy.fromiter((h.ls_age for h in lsa_headers), dtype=numpy.int64, count=header_number)[is_present],
+                self.get_numpy_column('ls_sequence_number').astype(numpy.int64)[present_rows],
+                self.get_numpy_column('ls_checksum').astype(numpy.int64)[present_rows],
+                self.get_numpy_column('ls_age').astype(numpy.int64)[present_rows])
+            return numpy.flatnonzero(is_fresher).tolist()
+        positions = []
+        for position in range(len(lsa_headers)):
+            row = self.rows.get(keys[position])
+            lsa_header = lsa_headers[position]
+            if row is None:
+                positions.append(position)
+            elif LsaTable.is_fresher(
+                    LsaTable.to_signed_sequence_number(lsa_header.ls_sequence_number), lsa_header.ls_checksum,
+                    lsa_header.ls_age, self.columns['ls_sequence_number'][row], self.columns['ls_checksum'][row],
+                    self.columns['ls_age'][row]):
+                positions.append(position)
+        return positions
+
+    #  Returns True where first LSA instance is fresher than second one - Receives either NumPy arrays or integers
+    #  Follows the rules of get_fresher_lsa_header in the LSA header class, with signed Sequence Numbers
+    @staticmethod
+    def is_fresher(first_sequence_number, first_checksum, first_age, second_sequence_number, second_checksum,
+                   second_age):
+        is_age_fresher = ((first_age == conf.MAX_AGE) & (second_age < conf.MAX_AGE)) | (
+                (first_age < conf.MAX_AGE) & (second_age < conf.MAX_AGE) & (second_age - first_age > conf.MAX_AGE_DIFF))
+        return (first_sequence_number > second_sequence_number) | (
+                (first_sequence_number == second_sequence_number) & (
+                    (first_checksum > second_checksum) | ((first_checksum == second_checksum) & is_age_fresher)))
+
+    #  Returns Sequence Number as a signed 32-bit integer, which orders Sequence Numbers from 0x80000001 to 0x7FFFFFFF
+    @staticmethod
+    def to_signed_sequence_number(ls_sequence_number):
+        if ls_sequence_number >= 0x80000000:
+            return ls_sequence_number - conf.MAX_VALUE_32_BITS - 1
+        return ls_sequence_number
+
+    #  Returns a NumPy array sharing memory with provided column
+    def get_numpy_column(self, name):
+        return numpy.frombuffer(self.columns[name], dtype=COLUMNS[name])
+
+    #  Returns True if a scan over provided number of elements should be performed with NumPy
+    @staticmethod
+    def is_numpy_scan(element_number):
+        return (numpy is not None) and (element_number >= NUMPY_TABLE_THRESHOLD)
@@ -6,6 +6,7 @@ import conf.conf as conf
 import lsa.lsa as lsa
 import lsa.header as header
 import general.utils as utils
+import area.lsa_table as lsa_table
 
 '''
 This class represents the OSPF Link State Database and contains its data and operations
@@ -21,6 +22,8 @@ class Lsdb:
         self.inter_area_prefix_lsa_list = []  # Only for OSPFv3
         self.intra_area_prefix_lsa_list = []  # Only for OSPFv3
         #  Link-LSAs are stored in the appropriate interface instance
+        self.lsa_index = {}  # (LS Type without S1, S2 and U bits, Link State ID, Advertising Router) -> Stored LSA
+        self.lsa_table = lsa_table.LsaTable()  # Header fields of stored LSAs as columns
 
         self.router_lock = threading.RLock()
         self.network_lock = threading.RLock()
@@ -28,6 +31,7 @@ class Lsdb:
         self.inter_area_lock = threading.RLock()
         self.intra_area_lock = threading.RLock()
         self.time_lock = threading.RLock()
+        self.index_lock = threading.RLock()
         self.version = version
         self.area_id = area_id
         self.is_modified = threading.Event()  # Set if LSDB was changed and change has not yet been processed
@@ -38,6 +42,20 @@ class Lsdb:
 
     #  Atomically returns full LSDB or part of it as a single list
     def get_lsdb(self, interfaces, identifiers):
+        #  If no identifier list is provided, all LSAs are returned, otherwise only requested LSAs are copied
+        if identifiers is not None:
+            requested_lsa_list = []
+            with self.index_lock:
+                for identifier in identifiers:
+                    query_lsa = self.lsa_index.get(Lsdb.get_index_key(identifier[0], identifier[1], identifier[2]))
+                    if query_lsa is not None:
+                        if query_lsa.header.ls_type == identifier[0]:
+                            requested_lsa_list.append(copy.deepcopy(query_lsa))
+            for i in interfaces:
+                for query_lsa in i.get_link_local_lsa_list():
+                    if query_lsa.get_lsa_identifier() in identifiers:
+                        requested_lsa_list.append(query_lsa)
+            return requested_lsa_list
         self.acquire_all_locks()
         lsa_list = []
         lsa_list.extend(self.router_lsa_list)
@@ -49,43 +67,20 @@ class Lsdb:
         self.release_all_locks()
         for i in interfaces:
             list_copy.extend(i.get_link_local_lsa_list())
-        requested_lsa_list = []
-        for query_lsa in list_copy:
-            #  If no identifier list is provided, all LSAs are returned
-            if identifiers is None:
-                requested_lsa_list.append(query_lsa)
-            elif query_lsa.get_lsa_identifier() in identifiers:
-                requested_lsa_list.append(query_lsa)
-        return requested_lsa_list
-
-    #  Atomically returns a LSA given its identifier, if present
+        return list_copy
+
+    #  Atomically returns a copy of a LSA given its identifier, if present
     def get_lsa(self, ls_type, link_state_id, advertising_router, interfaces):
         if not utils.Utils.is_ipv4_address(link_state_id):
             link_state_id = utils.Utils.decimal_to_ipv4(int(link_state_id))
         flooding_scope = header.Header.get_s1_s2_bits(ls_type)
         u_bit = header.Header.get_u_bit(ls_type)
         ls_type = header.Header.get_ls_type(ls_type)  # Removes S1, S2 and U bits in OSPFv3 LS Type
-        list_to_search = []
-        if ls_type == conf.LSA_TYPE_ROUTER:
-            self.router_lock.acquire()
-            list_to_search = copy.deepcopy(self.router_lsa_list)
-            self.router_lock.release()
-        elif ls_type == conf.LSA_TYPE_NETWORK:
-            self.network_lock.acquire()
-            list_to_search = copy.deepcopy(self.network_lsa_list)
-            self.network_lock.release()
-        elif (ls_type == conf.LSA_TYPE_SUMMARY_TYPE_3) & (self.version == conf.VERSION_IPV4):
-            self.summary_lock.acquire()
-            list_to_search = copy.deepcopy(self.summary_lsa_type_3_list)
-            self.summary_lock.release()
-        elif (ls_type == conf.LSA_TYPE_INTER_AREA_PREFIX) & (self.version == conf.VERSION_IPV6):
-            self.inter_area_lock.acquire()
-            list_to_search = copy.deepcopy(self.inter_area_prefix_lsa_list)
-            self.inter_area_lock.release()
-        elif ls_type == conf.LSA_TYPE_INTRA_AREA_PREFIX:
-            self.intra_area_lock.acquire()
-            list_to_search = copy.deepcopy(self.intra_area_prefix_lsa_list)
-            self.intra_area_lock.release()
+        if self.is_area_ls_type(ls_type):
+            with self.index_lock:  # Only the requested LSA is copied
+                query_lsa = self.lsa_index.get(Lsdb.get_index_key(ls_type, link_state_id, advertising_router))
+                if query_lsa is not None:
+                    return copy.deepcopy(query_lsa)
         #  Link-local scope or unknown LSA types
         elif (flooding_scope == conf.LINK_LOCAL_SCOPING) | (
                 (not lsa.Lsa.is_ls_type_valid(ls_type, self.version)) & (not u_bit)):
@@ -93,32 +88,95 @@ class Lsdb:
                 requested_lsa = query_interface.get_link_local_lsa(ls_type, link_state_id, advertising_router)
                 if requested_lsa is not None:
                     return requested_lsa
-        else:
-            pass
-        for query_lsa in list_to_search:
-            if query_lsa.is_lsa_identifier_equal(ls_type, link_state_id, advertising_router):
-                return query_lsa
         return None
 
-    #  Atomically returns headers of full LSDB or part of it as a single list
+    #  Atomically returns copies of the headers of full LSDB or part of it as a single list, without copying LSA bodies
     def get_lsa_headers(self, interfaces, identifiers):
-        lsa_list = self.get_lsdb(interfaces, None)
         lsa_headers = []
-        for query_lsa in lsa_list:
-            #  If no identifier list is provided, all LSA headers are returned
-            if identifiers is None:
-                lsa_headers.append(query_lsa.header)
-            elif query_lsa.get_lsa_identifier() in identifiers:
-                lsa_headers.append(query_lsa.header)
+        if identifiers is None:
+            self.acquire_all_locks()
+            for lsa_list in [self.router_lsa_list, self.network_lsa_list, self.summary_lsa_type_3_list,
+                             self.inter_area_prefix_lsa_list, self.intra_area_prefix_lsa_list]:
+                for query_lsa in lsa_list:
+                    lsa_headers.append(copy.copy(query_lsa.header))
+            self.release_all_locks()
+        else:
+            with self.index_lock:
+                for identifier in identifiers:
+                    query_lsa = self.lsa_index.get(Lsdb.get_index_key(identifier[0], identifier[1], identifier[2]))
+                    if query_lsa is not None:
+                        if query_lsa.header.ls_type == identifier[0]:
+                            lsa_headers.append(copy.copy(query_lsa.header))
+        for i in interfaces:
+            lsa_headers.extend(i.get_link_local_lsa_headers(identifiers))
         return lsa_headers
 
-    #  Atomically returns a LSA header given its identifier, if present
+    #  Atomically returns a copy of a LSA header given its identifier, if present
     def get_lsa_header(self, ls_type, link_state_id, advertising_router, interfaces):
-        query_lsa = self.get_lsa(ls_type, link_state_id, advertising_router, interfaces)
-        if query_lsa is not None:
-            return query_lsa.header
+        if not utils.Utils.is_ipv4_address(link_state_id):
+            link_state_id = utils.Utils.decimal_to_ipv4(int(link_state_id))
+        flooding_scope = header.Header.get_s1_s2_bits(ls_type)
+        u_bit = header.Header.get_u_bit(ls_type)
+        ls_type = header.Header.get_ls_type(ls_type)
+        if self.is_area_ls_type(ls_type):
+            with self.index_lock:
+                query_lsa = self.lsa_index.get(Lsdb.get_index_key(ls_type, link_state_id, advertising_router))
+                if query_lsa is not None:
+                    return copy.copy(query_lsa.header)
+        #  Link-local scope or unknown LSA types
+        elif (flooding_scope == conf.LINK_LOCAL_SCOPING) | (
+                (not lsa.Lsa.is_ls_type_valid(ls_type, self.version)) & (not u_bit)):
+            for query_interface in interfaces:
+                requested_header = query_interface.get_link_local_lsa_header(
+                    ls_type, link_state_id, advertising_router)
+                if requested_header is not None:
+                    return requested_header
         return None
 
+    #  Atomically returns identifiers of LSAs with at least provided LS Age and, if provided, with given Advertising Router
+    def get_lsa_identifiers(self, interfaces, minimum_ls_age, advertising_router):
+        with self.index_lock:
+            lsa_identifiers = []
+            for lsa_key in self.lsa_table.get_keys(minimum_ls_age, advertising_router):
+                lsa_identifiers.append(self.lsa_index[lsa_key].get_lsa_identifier())
+        for i in interfaces:
+            for lsa_header in i.get_link_local_lsa_headers(None):
+                if (lsa_header.ls_age >= minimum_ls_age) & (
+                        (advertising_router is None) | (lsa_header.advertising_router == advertising_router)):
+                    lsa_identifiers.append(lsa_header.get_lsa_identifier())
+        return lsa_identifiers
+
+    #  Atomically returns number of LSAs in area LSA lists with provided LS Type, or of all of them if it is None
+    def get_lsa_count(self, ls_type):
+        with self.index_lock:
+            return self.lsa_table.get_lsa_count(ls_type)
+
+    #  Atomically returns provided LSA headers, of LSAs stored in area LSA lists, that are fresher than the LSDB instance
+    #  or do not have one
+    def get_fresher_lsa_headers(self, lsa_headers):
+        lsa_keys = []
+        for lsa_header in lsa_headers:
+            lsa_keys.append(Lsdb.get_index_key(
+                lsa_header.ls_type, lsa_header.link_state_id, lsa_header.advertising_router))
+        with self.index_lock:
+            positions = self.lsa_table.get_fresher_positions(lsa_keys, lsa_headers)
+        fresher_headers = []
+        for position in positions:
+            fresher_headers.append(lsa_headers[position])
+        return fresher_headers
+
+    #  Returns True if LSAs with provided LS Type are stored in the area LSA lists
+    def is_area_ls_type(self, ls_type):
+        ls_type = header.Header.get_ls_type(ls_type)
+        return (ls_type in [conf.LSA_TYPE_ROUTER, conf.LSA_TYPE_NETWORK, conf.LSA_TYPE_INTRA_AREA_PREFIX]) | (
+                (ls_type == conf.LSA_TYPE_SUMMARY_TYPE_3) & (self.version == conf.VERSION_IPV4)) | (
+                (ls_type == conf.LSA_TYPE_INTER_AREA_PREFIX) & (self.version == conf.VERSION_IPV6))
+
+    #  Returns key of the LSA index for provided LSA identifier
+    @staticmethod
+    def get_index_key(ls_type, link_state_id, advertising_router):
+        return header.Header.get_ls_type(ls_type), link_state_id, advertising_router
+
     #  Atomically deletes a LSA from the LSDB, if present
     def delete_lsa(self, ls_type, link_state_id, advertising_router, interfaces):
         if not utils.Utils.is_ipv4_address(link_state_id):
@@ -160,6 +218,10 @@ class Lsdb:
         for query_lsa in list_to_search:
             if query_lsa.is_lsa_identifier_equal(ls_type, link_state_id, advertising_router):
                 list_to_search.remove(query_lsa)
+                with self.index_lock:
+                    lsa_key = Lsdb.get_index_key(ls_type, link_state_id, advertising_router)
+                    self.lsa_index.pop(lsa_key, None)
+                    self.lsa_table.delete_lsa(lsa_key)
                 self.lsdb_modified()
         lock.release()
 
@@ -211,6 +273,10 @@ class Lsdb:
         self.delete_lsa(lsa_identifier[0], lsa_identifier[1], lsa_identifier[2], interfaces)
 
         list_to_search.append(lsa_to_add)
+        with self.index_lock:
+            lsa_key = Lsdb.get_index_key(lsa_identifier[0], lsa_identifier[1], lsa_identifier[2])
+            self.lsa_index[lsa_key] = lsa_to_add
+            self.lsa_table.add_lsa(lsa_key, lsa_to_add)
         self.lsdb_modified()
         lock.release()
 
@@ -221,28 +287,23 @@ class Lsdb:
         self.summary_lsa_type_3_list = []
         self.inter_area_prefix_lsa_list = []
         self.intra_area_prefix_lsa_list = []
+        with self.index_lock:
+            self.lsa_index = {}
+            self.lsa_table = lsa_table.LsaTable()
         self.release_all_locks()
         for i in interfaces:
             i.clean_link_local_lsa_list()
         self.lsdb_modified()
 
     #  For each LSA, increases LS Age field if enough time has passed
+    #  Only LSAs whose LS Age changed since previous call are written, as found by a single scan of the LSA table
     def increase_lsa_age(self, interfaces):
-        with self.router_lock:
-            for query_lsa in self.router_lsa_list:
-                query_lsa.increase_lsa_age()
-        with self.network_lock:
-            for query_lsa in self.network_lsa_list:
-                query_lsa.increase_lsa_age()
-        with self.summary_lock:
-            for query_lsa in self.summary_lsa_type_3_list:
-                query_lsa.increase_lsa_age()
-        with self.inter_area_lock:
-            for query_lsa in self.inter_area_prefix_lsa_list:
-                query_lsa.increase_lsa_age()
-        with self.intra_area_lock:
-            for query_lsa in self.intra_area_prefix_lsa_list:
-                query_lsa.increase_lsa_age()
+        current_time = time.perf_counter()
+        with self.index_lock:
+            for lsa_key, ls_age in self.lsa_table.update_ls_ages(current_time):
+                query_lsa = self.lsa_index[lsa_key]
+                query_lsa.header.ls_age = ls_age
+                query_lsa.system_time = current_time
         for i in interfaces:
             i.increase_link_local_lsa_age()
 
@@ -422,6 +483,23 @@ class Lsdb:
                         nodes_to_analyse[destination][0] = potential_new_cost
                         nodes_to_analyse[destination][1] = closest_node
 
+    #  Atomically rebuilds the LSA index and the LSA table from the LSA lists
+    def build_lsa_index(self):
+        self.acquire_all_locks()
+        lsa_index = {}
+        table = lsa_table.LsaTable()
+        for lsa_list in [self.router_lsa_list, self.network_lsa_list, self.summary_lsa_type_3_list,
+                         self.inter_area_prefix_lsa_list, self.intra_area_prefix_lsa_list]:
+            for query_lsa in lsa_list:
+                lsa_identifier = query_lsa.get_lsa_identifier()
+                lsa_key = Lsdb.get_index_key(lsa_identifier[0], lsa_identifier[1], lsa_identifier[2])
+                lsa_index[lsa_key] = query_lsa
+                table.add_lsa(lsa_key, query_lsa)
+        with self.index_lock:
+            self.lsa_index = lsa_index
+            self.lsa_table = table
+        self.release_all_locks()
+
     def acquire_all_locks(self):
         self.router_lock.acquire()
         self.network_lock.acquire()
@@ -447,4 +525,5 @@ class Lsdb:
         lsdb_copy.inter_area_prefix_lsa_list = copy.deepcopy(self.inter_area_prefix_lsa_list)
         lsdb_copy.intra_area_prefix_lsa_list = copy.deepcopy(self.intra_area_prefix_lsa_list)
         self.release_all_locks()
+        lsdb_copy.build_lsa_index()
         return lsdb_copy
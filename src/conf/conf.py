@@ -12,6 +12,12 @@ INTERFACE_COSTS = [10]
 INTERFACE_NAMES = ["eth0"]  # Must match interface names in the machine
 INTERFACE_AREAS = ['0.0.0.0']
 KERNEL_UPDATE_INTERVAL = 0  # Implementation-specific - Minimum time between updates of kernel routing table
+RECEIVING_PROCESSES = 1  # Implementation-specific - Number of processes listening to packets from the interfaces
+RECEIVING_BUFFER_SIZE = 4 * 1024 * 1024  # Implementation-specific - Bytes of shared memory per receiving process
+RECEIVING_PROCESS_VALIDATION = False  # Implementation-specific - If receiving processes drop invalid packets
+RECEIVING_KERNEL_FILTER = False  # Implementation-specific - If kernel drops packets from other areas or from itself
+KERNEL_CHECKSUM_IPV6 = False  # Implementation-specific - If kernel computes and verifies OSPFv3 checksums
+SEND_CHECKSUM_VERIFICATION = False  # Implementation-specific - If checksum of packets is verified before sending them
 
 #  Only applicable if program is running inside provided GNS3 networks - Replaces default parameters
 
@@ -93,6 +99,13 @@ OPAQUE_TYPE_ASBR_LSA = 13
 
 HELLO_INTERVAL = 10
 ROUTER_DEAD_INTERVAL = 40
+#  Hello and Router Dead intervals of specific interfaces, in seconds, replacing the defaults - Ex: {'ens33': [2, 8]}
+INTERFACE_TIMER_INTERVALS = {}
+#  Interfaces in minimal Hello mode, with Router Dead Interval of 1 s and provided number of Hellos per second
+INTERFACE_HELLO_MULTIPLIERS = {}  # Ex: {'ens33': 4}
+MINIMAL_ROUTER_DEAD_INTERVAL = 1
+MIN_HELLO_MULTIPLIER = 3
+MAX_HELLO_MULTIPLIER = 20
 
 ALL_OSPF_ROUTERS_IPV4 = '224.0.0.5'
 ALL_DR_IPV4 = '224.0.0.6'
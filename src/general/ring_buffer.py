@@ -0,0 +1,172 @@
+import struct
+import socket
+from multiprocessing import shared_memory
+
+'''
+This class implements a single-producer single-consumer ring buffer in shared memory, used to carry received packets
+from a receiving process to the router process without pickling them
+'''
+
+#  Format strings indicate the format of the byte objects to be created, or converted to other object types
+#  = - Native byte order, no alignment
+#  B - Unsigned char (1 byte)
+#  I - Unsigned int (4 bytes)
+#  Q - Unsigned long long (8 bytes)
+CURSOR_FORMAT_STRING = "= Q"
+RECORD_FORMAT_STRING = "= I B B"  # Packet length, interface name length, source address length
+
+WRITE_CURSOR_OFFSET = 0  # Bytes written so far - Only changed by the producer
+DROPPED_COUNTER_OFFSET = 8  # Packets dropped for lack of space so far - Only changed by the producer
+READ_CURSOR_OFFSET = 64  # Bytes released so far - Only changed by the consumer - Kept in its own cache line
+DATA_OFFSET = 128
+RECORD_HEADER_LENGTH = struct.calcsize(RECORD_FORMAT_STRING)
+WRAP_MARKER = 0xFFFFFFFF  # Stored as packet length when the record does not fit at the end of the buffer
+ENCODING = "UTF-8"
+
+
+class RingBuffer:
+
+    def __init__(self, capacity, name=None):
+        if int(capacity) <= RECORD_HEADER_LENGTH:
+            raise ValueError("Ring buffer capacity is too small")
+        self.capacity = int(capacity)
+        if name is None:  # Creates the shared memory block - Cursors start at 0
+            self.shared_memory = shared_memory.SharedMemory(create=True, size=DATA_OFFSET + self.capacity)
+            struct.pack_into(CURSOR_FORMAT_STRING, self.shared_memory.buf, WRITE_CURSOR_OFFSET, 0)
+            struct.pack_into(CURSOR_FORMAT_STRING, self.shared_memory.buf, READ_CURSOR_OFFSET, 0)
+            struct.pack_into(CURSOR_FORMAT_STRING, self.shared_memory.buf, DROPPED_COUNTER_OFFSET, 0)
+        else:  # Attaches to existing shared memory block
+            self.shared_memory = shared_memory.SharedMemory(name=name)
+        self.buffer = self.shared_memory.buf
+        self.data = self.buffer[DATA_OFFSET:DATA_OFFSET + self.capacity]
+        self.pending_read_cursor = self.get_cursor(READ_CURSOR_OFFSET)  # Records read but not yet released
+
+    #  #  #  #  #  #  #  #
+    #  Producer methods  #
+    #  #  #  #  #  #  #  #
+
+    #  Writes batch of [interface_name, packet_byte_stream, source_ip_address] entries to the buffer
+    #  Returns number of entries written - Entries that do not fit are dropped, as the kernel does with full sockets
+    def put(self, batch):
+        written = 0
+        for entry in batch:
+            if self.put_packet(entry[0], entry[1], entry[2]):
+                written += 1
+        return written
+
+    #  Adds provided number of packets to the count of packets dropped because the buffer was full
+    def add_dropped(self, packet_number):
+        self.set_cursor(DROPPED_COUNTER_OFFSET, self.get_cursor(DROPPED_COUNTER_OFFSET) + packet_number)
+
+    #  Writes one packet to the buffer - Returns False if buffer is full or packet could never fit in it
+    def put_packet(self, interface_name, packet_bytes, source_address):
+        interface_bytes = interface_name.encode(ENCODING)
+        if ':' in source_address:
+            address_bytes = socket.inet_pton(socket.AF_INET6, source_address)
+        else:
+            address_bytes = socket.inet_pton(socket.AF_INET, source_address)
+        record_length = RECORD_HEADER_LENGTH + len(interface_bytes) + len(address_bytes) + len(packet_bytes)
+        if record_length > self.capacity:  # Dropped as the kernel does with datagrams larger than the socket buffer
+            return False
+
+        write_cursor = self.get_cursor(WRITE_CURSOR_OFFSET)
+        read_cursor = self.get_cursor(READ_CURSOR_OFFSET)
+        position = write_cursor % self.capacity
+        contiguous_space = self.capacity - position
+        if record_length > contiguous_space:  # Record is written at the start of the buffer
+            required_space = contiguous_space + record_length
+        else:
+            required_space = record_length
+        if (write_cursor - read_cursor) + required_space > self.capacity:
+            return False
+
+        if record_length > contiguous_space:
+            if contiguous_space >= RECORD_HEADER_LENGTH:
+                struct.pack_into(RECORD_FORMAT_STRING, self.data, position, WRAP_MARKER, 0, 0)
+            write_cursor += contiguous_space
+            position = 0
+        struct.pack_into(RECORD_FORMAT_STRING, self.data, position, len(packet_bytes), len(interface_bytes),
+                         len(address_bytes))
+        position += RECORD_HEADER_LENGTH
+        self.data[position:position + len(interface_bytes)] = interface_bytes
+        position += len(interface_bytes)
+        self.data[position:position + len(address_bytes)] = address_bytes
+        position += len(address_bytes)
+        self.data[position:position + len(packet_bytes)] = packet_bytes
+
+        #  Record only becomes visible to the consumer after being completely written
+        self.set_cursor(WRITE_CURSOR_OFFSET, write_cursor + record_length)
+        return True
+
+    #  #  #  #  #  #  #  #
+    #  Consumer methods  #
+    #  #  #  #  #  #  #  #
+
+    #  Returns True if there are no unread records in the buffer
+    def empty(self):
+        return self.get_cursor(WRITE_CURSOR_OFFSET) == self.pending_read_cursor
+
+    #  Returns all unread records as a batch of [interface_name, packet_memoryview, source_ip_address] entries
+    #  Packet memoryviews point to the shared memory and are only valid until release() is called
+    def get(self):
+        batch = []
+        write_cursor = self.get_cursor(WRITE_CURSOR_OFFSET)
+        while self.pending_read_cursor < write_cursor:
+            position = self.pending_read_cursor % self.capacity
+            contiguous_space = self.capacity - position
+            if contiguous_space < RECORD_HEADER_LENGTH:  # No room for record header - Producer wrapped around
+                self.pending_read_cursor += contiguous_space
+                continue
+            packet_length, interface_length, address_length = struct.unpack_from(
+                RECORD_FORMAT_STRING, self.data, position)
+            if packet_length == WRAP_MARKER:
+                self.pending_read_cursor += contiguous_space
+                continue
+
+            position += RECORD_HEADER_LENGTH
+            interface_name = str(self.data[position:position + interface_length], ENCODING)
+            position += interface_length
+            address_bytes = self.data[position:position + address_length]
+            if address_length == 16:
+                source_address = socket.inet_ntop(socket.AF_INET6, address_bytes)
+            else:
+                source_address = socket.inet_ntop(socket.AF_INET, address_bytes)
+            position += address_length
+            batch.append([interface_name, self.data[position:position + packet_length], source_address])
+            self.pending_read_cursor += RECORD_HEADER_LENGTH + interface_length + address_length + packet_length
+        return batch
+
+    #  Returns number of packets the producer dropped so far because the buffer was full
+    def get_dropped(self):
+        return self.get_cursor(DROPPED_COUNTER_OFFSET)
+
+    #  Returns space of all records read so far to the producer
+    def release(self):
+        self.set_cursor(READ_CURSOR_OFFSET, self.pending_read_cursor)
+
+    #  #  #  #  #  #  #  #
+    #  Auxiliary methods  #
+    #  #  #  #  #  #  #  #
+
+    def get_cursor(self, offset):
+        return struct.unpack_from(CURSOR_FORMAT_STRING, self.buffer, offset)[0]
+
+    def set_cursor(self, offset, value):
+        struct.pack_into(CURSOR_FORMAT_STRING, self.buffer, offset, value)
+
+    #  Detaches from the shared memory block - Memoryviews returned by get() must not be in use
+    def close(self):
+        self.data.release()
+        self.buffer = None
+        self.shared_memory.close()
+
+    #  Destroys the shared memory block - Must be called once, by the process that created the buffer
+    def unlink(self):
+        self.shared_memory.unlink()
+
+    #  Allows buffer to be sent to a process started with the spawn or forkserver methods
+    def __getstate__(self):
+        return {'capacity': self.capacity, 'name': self.shared_memory.name}
+
+    def __setstate__(self, state):
+        self.__init__(state['capacity'], state['name'])
@@ -1,5 +1,7 @@
 import socket
+import selectors
 import struct
+import ctypes
 import queue
 import multiprocessing
 
@@ -15,6 +17,24 @@ PORT = 0  # Has no effect and should be 0 - Still must be included
 MULTICAST_STRING_FORMAT_IPV4 = "4sL"  # Required when joining multicast groups (4s - 4 letter string; L - Signed long)
 MULTICAST_STRING_FORMAT_IPV6 = "=I"  # Required when joining multicast groups (= - Native byte order; I - Unsigned int)
 ENCODING = "UTF-8"
+SELECT_TIMEOUT = 0.1  # Maximum time in seconds the receiving process blocks before checking for shutdown
+MAX_BATCH_SIZE = 256  # Maximum number of datagrams read from a socket at once
+
+OSPFV3_CHECKSUM_OFFSET = 12  # Offset of the checksum field in the OSPFv3 packet header
+OSPFV3_INSTANCE_ID_OFFSET = 14  # Offset of the Instance ID field in the OSPFv3 packet header
+
+#  Classic BPF socket filters - Values from linux/filter.h
+SO_ATTACH_FILTER = 26
+BPF_LOAD_WORD_ABSOLUTE = 0x20  # A <- P[k:4]
+BPF_LOAD_BYTE_ABSOLUTE = 0x30  # A <- P[k:1]
+BPF_LOAD_WORD_INDIRECT = 0x40  # A <- P[X+k:4]
+BPF_LOAD_BYTE_INDIRECT = 0x50  # A <- P[X+k:1]
+BPF_LOAD_IPV4_HEADER_LENGTH = 0xB1  # X <- 4*(P[k:1]&0xf)
+BPF_JUMP_IF_EQUAL = 0x15  # pc += (A == k) ? jt : jf
+BPF_RETURN = 0x06  # Returns number of bytes of the packet to keep - 0 drops the packet
+BPF_ACCEPT_LENGTH = 0xFFFF
+FILTER_INSTRUCTION_FORMAT_STRING = "= H B B L"  # Code, jump if true, jump if false, constant
+FILTER_PROGRAM_FORMAT_STRING = "@ H P"  # Number of instructions, pointer to instructions - Native alignment
 
 
 class Socket:
@@ -43,27 +63,19 @@ class Socket:
         if interface.strip() == '':
             raise ValueError("Empty interface to bind provided")
 
-        #  Creates socket and binds it to interface
+        #  Creates socket, binds it to interface and joins multicast groups
         self.is_dr = is_dr
-        s = socket.socket(socket.AF_INET, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, str(interface + '\0').encode(ENCODING))
+        s = Socket.create_receive_socket(interface, conf.VERSION_IPV4)
+        buffer_size = utils.Utils.interface_name_to_mtu(interface)
 
-        #  Joins multicast groups and listens to packets from the network
+        #  Listens to packets from the network
         flag = False
-        Socket.join_multicast_group(s, interface, conf.ALL_OSPF_ROUTERS_IPV4, conf.VERSION_IPV4)
         while not shutdown.is_set():
-            if is_dr.is_set() != flag:  # Interface state has just changed to or from DR/BDR
-                if is_dr.is_set():  # DR/BDR
-                    Socket.join_multicast_group(s, interface, conf.ALL_DR_IPV4, conf.VERSION_IPV4)
-                else:  # Non-DR/BDR
-                    Socket.leave_multicast_group(s, interface, conf.ALL_DR_IPV4, conf.VERSION_IPV4)
-                flag = is_dr.is_set()
+            flag = Socket.update_dr_membership(s, interface, conf.VERSION_IPV4, is_dr, flag)
             s.settimeout(0.1)
             try:
-                data = s.recvfrom(conf.MTU)  # Includes IP header
-                array = Socket.process_ipv4_data(data[0])  # [packet_byte_stream, source_ip_address]
-                #  If packet is not from itself OR if packets from itself are allowed
-                if (array[1] != utils.Utils.interface_name_to_ipv4_address(interface)) | accept_self_packets:
+                array = Socket.read_packet(s, interface, conf.VERSION_IPV4, accept_self_packets, buffer_size)
+                if array is not None:
                     pipeline.put(array)
             except socket.timeout:
                 pass  # Required since program will block until packet is received
@@ -83,35 +95,97 @@ class Socket:
         if interface.strip() == '':
             raise ValueError("Empty interface to bind provided")
 
-        #  Creates socket and binds it to interface
+        #  Creates socket, binds it to interface and joins multicast groups
         self.is_dr = is_dr
-        s = socket.socket(socket.AF_INET6, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, str(interface + '\0').encode(ENCODING))
+        s = Socket.create_receive_socket(interface, conf.VERSION_IPV6)
+        buffer_size = utils.Utils.interface_name_to_mtu(interface)
 
-        #  Joins multicast groups and listens to packets from the network
+        #  Listens to packets from the network
         flag = False
-        Socket.join_multicast_group(s, interface, conf.ALL_OSPF_ROUTERS_IPV6, conf.VERSION_IPV6)
         while not shutdown.is_set():
-            if is_dr.is_set() != flag:  # Interface state has just changed to or from DR/BDR
-                if is_dr.is_set():  # DR/BDR
-                    Socket.join_multicast_group(s, interface, conf.ALL_DR_IPV6, conf.VERSION_IPV6)
-                else:  # Non-DR/BDR
-                    Socket.leave_multicast_group(s, interface, conf.ALL_DR_IPV6, conf.VERSION_IPV6)
-                flag = is_dr.is_set()
+            flag = Socket.update_dr_membership(s, interface, conf.VERSION_IPV6, is_dr, flag)
             s.settimeout(0.1)
             try:
-                data = s.recvfrom(conf.MTU)  # Does not include IP header
-                packet_bytes = data[0]
-                source_ip_address = data[1][0].split('%')[0]
-                link_local_address = utils.Utils.interface_name_to_ipv6_link_local_address(interface)
-                global_address = utils.Utils.interface_name_to_ipv6_global_address(interface)
-                #  If packet is not from itself OR if packets from itself are allowed
-                if (source_ip_address not in [link_local_address, global_address]) | accept_self_packets:
-                    pipeline.put([packet_bytes, source_ip_address])
+                array = Socket.read_packet(s, interface, conf.VERSION_IPV6, accept_self_packets, buffer_size)
+                if array is not None:
+                    pipeline.put(array)
             except socket.timeout:
                 pass
         s.close()
 
+    #  Listens to packets in the network from all provided interfaces until signaled to stop
+    #  A single process multiplexes the sockets of all interfaces, instead of having one process per interface
+    #  Packets are placed in the pipeline in batches - Lists of [interface_name, packet_byte_stream, source_ip_address]
+    #  If interface areas are provided, packets may be filtered by the kernel and decoded and validated here
+    def receive_interfaces(self, pipeline, shutdown, interfaces, accept_self_packets, is_dr_events, version,
+                           localhost, router_id=None, interface_areas=None):
+        if localhost:  # No sockets will be used in the integration tests
+            return
+
+        if pipeline is None:
+            raise ValueError("No pipeline provided")
+        if shutdown is None:
+            raise ValueError("No shutdown event provided")
+        if (interfaces is None) or (len(interfaces) == 0):
+            raise ValueError("No interfaces to bind provided")
+        for interface in interfaces:
+            if (interface is None) or (interface.strip() == ''):
+                raise ValueError("Empty interface to bind provided")
+            if interface not in is_dr_events:
+                raise ValueError("No DR event provided for interface " + interface)
+        if version not in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+            raise ValueError("Invalid OSPF version")
+        if interface_areas is not None:
+            if router_id is None:
+                raise ValueError("No router ID provided")
+            for interface in interfaces:
+                if interface not in interface_areas:
+                    raise ValueError("No area provided for interface " + interface)
+
+        kernel_filter = (interface_areas is not None) & conf.RECEIVING_KERNEL_FILTER
+        validation = (interface_areas is not None) & conf.RECEIVING_PROCESS_VALIDATION
+
+        #  Creates one socket per interface and registers all of them in the same selector
+        selector = selectors.DefaultSelector()
+        flags = {}
+        verify_checksums = {}
+        buffer_sizes = {}  # Largest packet that can be received in each interface
+        for interface in interfaces:
+            s = Socket.create_receive_socket(interface, version)
+            buffer_sizes[interface] = utils.Utils.interface_name_to_mtu(interface)
+            verify_checksums[interface] = not Socket.is_kernel_checksum_enabled(s)
+            if kernel_filter:  # Kernel drops packets from other areas or from itself before they reach the socket
+                Socket.attach_filter(s, Socket.create_filter_program(
+                    version, interface_areas[interface], router_id, accept_self_packets))
+            s.setblocking(False)
+            selector.register(s, selectors.EVENT_READ, interface)
+            flags[interface] = False
+
+        #  Listens to packets from the network - Process only wakes up when packets arrive or timeout is reached
+        while not shutdown.is_set():
+            for key in selector.get_map().values():
+                interface = key.data
+                flags[interface] = Socket.update_dr_membership(
+                    key.fileobj, interface, version, is_dr_events[interface], flags[interface])
+            #  All datagrams waiting in the ready sockets are read and sent to the router as a single batch
+            batch = []
+            for key, _ in selector.select(SELECT_TIMEOUT):
+                packets = Socket.drain_socket(
+                    key.fileobj, key.data, version, accept_self_packets, buffer_sizes[key.data])
+                if validation:
+                    packets = Socket.validate_packets(packets, version, router_id, interface_areas[key.data],
+                                                      accept_self_packets, verify_checksums[key.data])
+                batch.extend(packets)
+            if len(batch) > 0:
+                written = pipeline.put(batch)
+                if written < len(batch):  # Buffer is full - Count is kept so that buffer size can be tuned
+                    pipeline.add_dropped(len(batch) - written)
+
+        for key in list(selector.get_map().values()):
+            selector.unregister(key.fileobj)
+            key.fileobj.close()
+        selector.close()
+
     #  Sends the supplied IPv4 packet to the supplied address through the supplied interface
     def send_ipv4(self, packet_bytes, destination_address, interface, localhost):
         if packet_bytes is None:
@@ -126,7 +200,8 @@ class Socket:
             raise ValueError("No interface to bind provided")
         if interface.strip() == '':
             raise ValueError("Empty interface to bind provided")
-        packet_bytes = self.is_packet_checksum_valid(packet_bytes, conf.VERSION_IPV4, '', '')
+        if conf.SEND_CHECKSUM_VERIFICATION:  # Packets finalized by the packet class are otherwise sent as they are
+            packet_bytes = self.is_packet_checksum_valid(packet_bytes, conf.VERSION_IPV4, '', '')
 
         if localhost:  # Socket will not be used in integration tests
             source_address = utils.Utils.interface_name_to_ipv4_address(interface)
@@ -157,10 +232,13 @@ class Socket:
         if interface.strip() == '':
             raise ValueError("Empty interface to bind provided")
         source_address = utils.Utils.interface_name_to_ipv6_link_local_address(interface)
-        packet_bytes = self.is_packet_checksum_valid(
-            packet_bytes, conf.VERSION_IPV6, source_address, destination_address)
+        if conf.SEND_CHECKSUM_VERIFICATION & (not conf.KERNEL_CHECKSUM_IPV6):  # Otherwise packets are sent as they are
+            packet_bytes = self.is_packet_checksum_valid(
+                packet_bytes, conf.VERSION_IPV6, source_address, destination_address)
 
         if localhost:  # Socket will not be used in integration tests
+            if conf.KERNEL_CHECKSUM_IPV6:  # There is no kernel to compute the checksum
+                packet_bytes = Socket.set_ospfv3_checksum(packet_bytes, source_address, destination_address)
             data = [packet_bytes, source_address, destination_address]
             self.exit_pipeline_v3.put(data)
             return
@@ -168,6 +246,9 @@ class Socket:
         #  Creates socket and binds it to interface - Default TTL is 1 and is the required TTL, so it remains unchanged
         s = socket.socket(socket.AF_INET6, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
         s.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, str(interface + '\0').encode(ENCODING))
+        if conf.KERNEL_CHECKSUM_IPV6:
+            if not Socket.enable_kernel_checksum(s):  # Checksum is computed here if kernel cannot compute it
+                packet_bytes = Socket.set_ospfv3_checksum(packet_bytes, source_address, destination_address)
 
         #  Sends packet
         s.sendto(packet_bytes, (destination_address, PORT))
@@ -217,6 +298,221 @@ class Socket:
     #  Auxiliary methods  #
     #  #  #  #  #  #  #  #
 
+    #  Creates raw OSPF socket bound to provided interface and joins the AllSPFRouters multicast group
+    @staticmethod
+    def create_receive_socket(interface, version):
+        if version == conf.VERSION_IPV4:
+            s = socket.socket(socket.AF_INET, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
+            multicast_address = conf.ALL_OSPF_ROUTERS_IPV4
+        elif version == conf.VERSION_IPV6:
+            s = socket.socket(socket.AF_INET6, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
+            multicast_address = conf.ALL_OSPF_ROUTERS_IPV6
+            if conf.KERNEL_CHECKSUM_IPV6:  # Kernel drops packets with invalid checksum before they reach the socket
+                Socket.enable_kernel_checksum(s)
+        else:
+            raise ValueError("Invalid OSPF version")
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_BINDTODEVICE, str(interface + '\0').encode(ENCODING))
+        Socket.join_multicast_group(s, interface, multicast_address, version)
+        return s
+
+    #  Joins or leaves the AllDRouters multicast group if interface state changed to or from DR/BDR
+    #  Returns the new value of the flag stating whether the socket is in the AllDRouters multicast group
+    @staticmethod
+    def update_dr_membership(s, interface, version, is_dr, flag):
+        if is_dr.is_set() != flag:  # Interface state has just changed to or from DR/BDR
+            if version == conf.VERSION_IPV4:
+                multicast_address = conf.ALL_DR_IPV4
+            else:
+                multicast_address = conf.ALL_DR_IPV6
+            if is_dr.is_set():  # DR/BDR
+                Socket.join_multicast_group(s, interface, multicast_address, version)
+            else:  # Non-DR/BDR
+                Socket.leave_multicast_group(s, interface, multicast_address, version)
+            flag = is_dr.is_set()
+        return flag
+
+    #  Reads all datagrams available in non-blocking socket, up to a limit to avoid starving the other sockets
+    #  Returns list of [interface_name, packet_byte_stream, source_ip_address]
+    @staticmethod
+    def drain_socket(s, interface, version, accept_self_packets, buffer_size=conf.MTU):
+        packets = []
+        own_addresses = []
+        if not accept_self_packets:  # Interface addresses are looked up once for the whole batch
+            own_addresses = Socket.get_own_addresses(interface, version)
+        for _ in range(MAX_BATCH_SIZE):
+            try:
+                array = Socket.read_packet(s, interface, version, accept_self_packets, buffer_size, own_addresses)
+            except BlockingIOError:
+                break  # No more datagrams waiting in the socket
+            if array is not None:
+                packets.append([interface] + array)
+        return packets
+
+    #  Reads one packet from the socket - Returns [packet_byte_stream, source_ip_address] or None if packet is dropped
+    #  Addresses of the interface are looked up if not provided
+    @staticmethod
+    def read_packet(s, interface, version, accept_self_packets, buffer_size=conf.MTU, own_addresses=None):
+        data = s.recvfrom(buffer_size)
+        if own_addresses is None:
+            own_addresses = Socket.get_own_addresses(interface, version)
+        if version == conf.VERSION_IPV4:
+            array = Socket.process_ipv4_data(data[0])  # IPv4 socket returns packets with IP header
+            #  If packet is not from itself OR if packets from itself are allowed
+            if (array[1] not in own_addresses) | accept_self_packets:
+                return array
+        else:
+            packet_bytes = data[0]  # IPv6 socket does not include IP header
+            source_ip_address = data[1][0].split('%')[0]
+            if (source_ip_address not in own_addresses) | accept_self_packets:
+                return [packet_bytes, source_ip_address]
+        return None
+
+    #  Returns the addresses of the interface that packets sent by the router itself have as source
+    @staticmethod
+    def get_own_addresses(interface, version):
+        if version == conf.VERSION_IPV4:
+            return [utils.Utils.interface_name_to_ipv4_address(interface)]
+        else:
+            return [utils.Utils.interface_name_to_ipv6_link_local_address(interface),
+                    utils.Utils.interface_name_to_ipv6_global_address(interface)]
+
+    #  Makes the kernel compute the checksum of sent OSPFv3 packets and drop received ones with invalid checksum
+    #  Returns False if the kernel does not support it
+    @staticmethod
+    def enable_kernel_checksum(s):
+        try:
+            s.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_CHECKSUM, OSPFV3_CHECKSUM_OFFSET)
+            return True
+        except (OSError, AttributeError):
+            return False
+
+    #  Returns True if the kernel computes and verifies the OSPFv3 checksum for the socket
+    @staticmethod
+    def is_kernel_checksum_enabled(s):
+        if s.family != socket.AF_INET6:
+            return False
+        try:
+            return s.getsockopt(socket.IPPROTO_IPV6, socket.IPV6_CHECKSUM) == OSPFV3_CHECKSUM_OFFSET
+        except (OSError, AttributeError):
+            return False
+
+    #  Returns OSPFv3 packet byte stream with its checksum computed for provided addresses
+    @staticmethod
+    def set_ospfv3_checksum(packet_bytes, source_address, destination_address):
+        packet_bytes = bytearray(packet_bytes)
+        struct.pack_into("> H", packet_bytes, OSPFV3_CHECKSUM_OFFSET, 0)  # Checksum field is 0 during calculation
+        checksum = utils.Utils.create_checksum_ospfv3(bytes(packet_bytes), source_address, destination_address)
+        struct.pack_into("> H", packet_bytes, OSPFV3_CHECKSUM_OFFSET, checksum)
+        return bytes(packet_bytes)
+
+    #  Returns classic BPF program accepting only OSPF packets with provided version and area, and not from itself
+    #  IPv4 sockets see the IP header before the OSPF packet, while IPv6 sockets only see the OSPF packet
+    @staticmethod
+    def create_filter_program(version, area_id, router_id, accept_self_packets):
+        #  Each check is a [load instruction, OSPF header offset, value, True if packet is dropped on equality]
+        if version == conf.VERSION_IPV4:
+            program = [[BPF_LOAD_IPV4_HEADER_LENGTH, 0, 0, 0]]  # OSPF header is read relative to IPv4 header length
+            checks = [[BPF_LOAD_BYTE_INDIRECT, 0, conf.VERSION_IPV4, False],
+                      [BPF_LOAD_WORD_INDIRECT, 8, utils.Utils.ipv4_to_decimal(area_id), False]]
+            router_id_check = [BPF_LOAD_WORD_INDIRECT, 4, utils.Utils.ipv4_to_decimal(router_id), True]
+        elif version == conf.VERSION_IPV6:
+            program = []
+            checks = [[BPF_LOAD_BYTE_ABSOLUTE, 0, conf.VERSION_IPV6, False],
+                      [BPF_LOAD_WORD_ABSOLUTE, 8, utils.Utils.ipv4_to_decimal(area_id), False],
+                      [BPF_LOAD_BYTE_ABSOLUTE, OSPFV3_INSTANCE_ID_OFFSET, 0, False]]  # Interfaces use instance 0
+            router_id_check = [BPF_LOAD_WORD_ABSOLUTE, 4, utils.Utils.ipv4_to_decimal(router_id), True]
+        else:
+            raise ValueError("Invalid OSPF version")
+        if not accept_self_packets:
+            checks.append(router_id_check)
+
+        #  Every failed check jumps to the last instruction, which drops the packet
+        drop_index = len(program) + 2 * len(checks) + 1
+        for check in checks:
+            program.append([check[0], 0, 0, check[1]])
+            jump = drop_index - len(program) - 1
+            if check[3]:
+                program.append([BPF_JUMP_IF_EQUAL, jump, 0, check[2]])
+            else:
+                program.append([BPF_JUMP_IF_EQUAL, 0, jump, check[2]])
+        program.append([BPF_RETURN, 0, 0, BPF_ACCEPT_LENGTH])
+        program.append([BPF_RETURN, 0, 0, 0])
+
+        program_bytes = b''
+        for instruction in program:
+            program_bytes += struct.pack(FILTER_INSTRUCTION_FORMAT_STRING, instruction[0], instruction[1],
+                                         instruction[2], instruction[3])
+        return program_bytes
+
+    #  Attaches classic BPF program to socket - Kernel copies the program, so its buffer can be freed afterwards
+    @staticmethod
+    def attach_filter(s, program_bytes):
+        instruction_length = struct.calcsize(FILTER_INSTRUCTION_FORMAT_STRING)
+        program_buffer = ctypes.create_string_buffer(program_bytes)
+        program = struct.pack(FILTER_PROGRAM_FORMAT_STRING, len(program_bytes) // instruction_length,
+                              ctypes.addressof(program_buffer))
+        s.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, program)
+
+    #  Validates packets read from an interface, dropping the ones the router would not process
+    #  Returns list of [interface_name, packet_byte_stream, source_ip_address] with the packets that are valid
+    @staticmethod
+    def validate_packets(packets, version, router_id, area_id, accept_self_packets, verify_checksum=True):
+        validated_packets = []
+        destination_addresses = None
+        if (len(packets) > 0) & (version == conf.VERSION_IPV6) & verify_checksum:
+            #  Packets of a batch come from the same interface - Its addresses are looked up once
+            destination_addresses = Socket.get_ospfv3_destination_addresses(packets[0][0])
+        for packet_data in packets:
+            packet_object = Socket.validate_packet(packet_data[0], packet_data[1], packet_data[2], version, router_id,
+                                                   area_id, accept_self_packets, verify_checksum, destination_addresses)
+            if packet_object is not None:  # Router decodes the byte stream again, which is cheaper than pickling
+                validated_packets.append(packet_data)
+        return validated_packets
+
+    #  Returns packet object if packet is valid, returns None otherwise
+    #  Packet is invalid if it has wrong OSPF version or checksum, if it belongs to other area, or if it is from itself
+    #  Checksum is not verified again if the kernel already verified it
+    @staticmethod
+    def validate_packet(interface, packet_bytes, source_address, version, router_id, area_id, accept_self_packets,
+                        verify_checksum=True, destination_addresses=None):
+        try:
+            if packet.Packet.get_ospf_version(packet_bytes) != version:
+                return None
+            if not verify_checksum:
+                checksum_valid = True
+            elif version == conf.VERSION_IPV4:  # OSPFv2 checksum does not depend on the IP addresses
+                checksum_valid = packet.Packet.is_packet_bytes_checksum_valid(packet_bytes, source_address, None)
+            else:  # OSPFv3 checksum depends on the destination address, which the socket does not provide
+                if destination_addresses is None:
+                    destination_addresses = Socket.get_ospfv3_destination_addresses(interface)
+                checksum_valid = False
+                for destination_address in destination_addresses:
+                    if packet.Packet.is_packet_bytes_checksum_valid(
+                            packet_bytes, source_address, destination_address):
+                        checksum_valid = True
+                        break
+            if not checksum_valid:
+                return None
+            packet_object = packet.Packet.unpack_packet(packet_bytes)
+        except (ValueError, IndexError, struct.error):  # Malformed packet
+            return None
+        if packet_object.header.area_id != area_id:
+            return None
+        if (packet_object.header.router_id == router_id) & (not accept_self_packets):
+            return None
+        return packet_object
+
+    #  Returns the addresses an OSPFv3 packet received in the interface may have been sent to
+    @staticmethod
+    def get_ospfv3_destination_addresses(interface):
+        destination_addresses = []
+        for destination_address in [conf.ALL_OSPF_ROUTERS_IPV6, conf.ALL_DR_IPV6,
+                                    utils.Utils.interface_name_to_ipv6_link_local_address(interface),
+                                    utils.Utils.interface_name_to_ipv6_global_address(interface)]:
+            if destination_address not in [None, '']:
+                destination_addresses.append(destination_address)
+        return destination_addresses
+
     #  Processes incoming IPv4 data
     @staticmethod
     def process_ipv4_data(byte_stream):
@@ -231,15 +527,17 @@ class Socket:
 
         return [ospf_packet, source_ip_address]
 
-    #  Launches warning if packet checksum is invalid
+    #  Returns packet byte stream with its checksum corrected, if it is invalid
     @staticmethod
     def is_packet_checksum_valid(packet_bytes, version, source_address, destination_address):
+        if packet.Packet.is_packet_bytes_checksum_valid(packet_bytes, source_address, destination_address):
+            return packet_bytes
         packet_object = packet.Packet.unpack_packet(packet_bytes)
         # print("Sending packet", packet_object, source_address)
         if not packet_object.is_packet_checksum_valid(source_address, destination_address):
             if version == conf.VERSION_IPV6:
-                packet_object.header.source_ipv6_address = source_address
-                packet_object.header.destination_ipv6_address = destination_address
+                packet_object.source_ipv6_address = source_address
+                packet_object.destination_ipv6_address = destination_address
             packet_object.set_packet_length()
             packet_object.set_packet_checksum()
             packet_bytes = packet_object.pack_packet()
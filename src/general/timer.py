@@ -1,63 +1,169 @@
+import threading
+import heapq
 import time
+import os
 
 '''
 This class performs the timer operations in the router
 '''
 
+MINIMAL_TIMEOUT_SECONDS = 0.001  # Timers have millisecond resolution
+
+timer_service = None
+timer_service_lock = threading.Lock()
+
 
 class Timer:
 
-    def __init__(self):
+    def __init__(self, service=None):
         self.initial_time = 0
         self.timeout = 0
+        self.timeout_event = None
+        self.is_interval = False
+        self.heap_entry = None  # Entry of timer service heap while timer is running
+        if service is None:
+            service = get_timer_service()
+        self.service = service
 
-    #  Implements a single-shot timer - Fires if timeout is reached, can be reset indefinite times
-    def single_shot_timer(self, reset, timeout, shutdown, seconds):
-        if reset is None:
-            raise ValueError("No reset event provided")
+    #  Starts a single-shot timer - Sets timeout event if timeout is reached or timer is stopped, can be reset
+    def single_shot_timer(self, timeout, seconds):
         if timeout is None:
             raise ValueError("No timeout event provided")
-        if shutdown is None:
-            raise ValueError("No shutdown event provided")
-        if int(seconds) <= 0:
-            raise ValueError("Timeout must be positive and at least 1 second")
-
-        self.reset_timer()
-        self.timeout = seconds
-        while int(time.perf_counter()) < int(self.initial_time + seconds):
-            if reset.is_set():  # Timer is signalled to restart
-                reset.clear()
-                self.reset_timer()
-            if shutdown.is_set():  # Timer is signalled to shutdown
-                break
-        timeout.set()
-
-    #  Implements a regular timer - Fires at regular intervals
-    def interval_timer(self, offset, timeout, shutdown, seconds):
-        if int(offset) < 0:
+        if seconds < MINIMAL_TIMEOUT_SECONDS:
+            raise ValueError("Timeout must be positive and at least 1 millisecond")
+        self.service.start_timer(self, timeout, seconds, 0, False)
+
+    #  Starts a regular timer - Sets timeout event at regular intervals until stopped
+    def interval_timer(self, offset, timeout, seconds):
+        if offset < 0:
             raise ValueError("Offset time must be at least 0")
         if timeout is None:
             raise ValueError("No timeout event provided")
-        if shutdown is None:
-            raise ValueError("No shutdown event provided")
-        if int(seconds) <= 0:
-            raise ValueError("Timeout must be positive and at least 1 second")
-
-        self.reset_timer()
-        self.timeout = seconds
-        time.sleep(offset)  # This sleep helps to ensure different interval timers are not synchronized
-        while True:
-            if int(time.perf_counter()) >= int(self.initial_time + seconds):  # Timeout is reached
-                timeout.set()
-                self.reset_timer()
-            if shutdown.is_set():  # Times is signalled to shutdown
-                break
+        if seconds < MINIMAL_TIMEOUT_SECONDS:
+            raise ValueError("Timeout must be positive and at least 1 millisecond")
+        #  Offset helps to ensure different interval timers are not synchronized
+        self.service.start_timer(self, timeout, seconds, offset, True)
+
+    #  Restarts the countdown of a running timer
+    def reset_timer(self):
+        self.service.reset_timer(self)
+
+    #  Stops timer - Timeout event of a running single-shot timer is set, so that nothing waits for it after shutdown
+    def stop_timer(self):
+        self.service.stop_timer(self)
 
+    def is_running(self):
+        return self.heap_entry is not None
+
+    #  Returns time in seconds until timer fires, with millisecond resolution
     def get_timer_time(self):
-        timer_time = int(self.initial_time + self.timeout) - int(time.perf_counter())
+        timer_time = round(self.initial_time + self.timeout - time.perf_counter(), 3)
         if timer_time > 0:
             return timer_time
         return 0
 
-    def reset_timer(self):
-        self.initial_time = int(time.perf_counter())  # Sets initial time with current system time in seconds
+
+'''
+This class keeps the running timers of the router in a min-heap of deadlines served by a single thread
+The thread sleeps until the earliest deadline, and is only woken up earlier if a timer with a closer deadline is started
+Reset and stopped timers leave their old heap entry behind, which is discarded when it reaches the top of the heap
+'''
+
+
+class TimerService:
+
+    def __init__(self):
+        self.heap = []  # Entries are [deadline, sequence number, timer], timer being None in discarded entries
+        self.sequence_number = 0  # Orders entries with same deadline, so that timers are never compared
+        self.timer_number = 0
+        self.wake_time = None  # Time at which service thread will wake up, None if waiting for a timer to start
+        self.condition = threading.Condition()
+        self.process_id = os.getpid()
+        self.thread = threading.Thread(target=self.timer_service_loop, daemon=True)
+        self.thread.start()
+
+    #  Stores timer, setting its timeout event after provided delay and then every "seconds" if interval timer
+    def start_timer(self, query_timer, timeout, seconds, delay, is_interval):
+        with self.condition:
+            self.remove_timer(query_timer)
+            query_timer.timeout_event = timeout
+            query_timer.timeout = seconds
+            query_timer.is_interval = is_interval
+            query_timer.initial_time = time.perf_counter() + delay
+            self.insert_timer(query_timer)
+
+    def reset_timer(self, query_timer):
+        with self.condition:
+            if query_timer.heap_entry is not None:
+                self.remove_timer(query_timer)
+                query_timer.initial_time = time.perf_counter()
+                self.insert_timer(query_timer)
+
+    def stop_timer(self, query_timer):
+        with self.condition:
+            if query_timer.heap_entry is not None:
+                self.remove_timer(query_timer)
+                if not query_timer.is_interval:
+                    query_timer.timeout_event.set()
+
+    #  Must be called with condition lock acquired
+    def insert_timer(self, query_timer):
+        deadline = query_timer.initial_time + query_timer.timeout
+        query_timer.heap_entry = [deadline, self.sequence_number, query_timer]
+        self.sequence_number += 1
+        heapq.heappush(self.heap, query_timer.heap_entry)
+        self.timer_number += 1
+        #  Service thread is only woken if it would otherwise miss the deadline
+        if self.wake_time is None:
+            self.condition.notify()
+        elif deadline < self.wake_time:
+            self.condition.notify()
+
+    #  Must be called with condition lock acquired
+    def remove_timer(self, query_timer):
+        if query_timer.heap_entry is not None:
+            query_timer.heap_entry[2] = None
+            query_timer.heap_entry = None
+            self.timer_number -= 1
+            #  Heap is rebuilt when most of its entries were discarded, e.g. by frequent resets
+            if len(self.heap) > 2 * self.timer_number + 64:
+                self.heap = [entry for entry in self.heap if entry[2] is not None]
+                heapq.heapify(self.heap)
+
+    #  Sets timeout event of timers whose deadline was reached, then sleeps until the next deadline
+    def timer_service_loop(self):
+        with self.condition:
+            while True:
+                current_time = time.perf_counter()
+                while len(self.heap) > 0:
+                    if self.heap[0][2] is None:  # Discarded entry
+                        heapq.heappop(self.heap)
+                    elif self.heap[0][0] <= current_time:
+                        query_timer = self.heap[0][2]
+                        self.remove_timer(query_timer)
+                        query_timer.timeout_event.set()
+                        if query_timer.is_interval:
+                            query_timer.initial_time += query_timer.timeout
+                            if query_timer.initial_time < current_time - query_timer.timeout:
+                                query_timer.initial_time = current_time  # Missed intervals are not caught up
+                            self.insert_timer(query_timer)
+                    else:
+                        break
+
+                if len(self.heap) > 0:
+                    self.wake_time = self.heap[0][0]
+                    self.condition.wait(self.wake_time - current_time)
+                else:
+                    self.wake_time = None
+                    self.condition.wait()
+
+
+#  Returns the timer service shared by all timers of the router, starting it if needed
+def get_timer_service():
+    global timer_service
+    with timer_service_lock:
+        if timer_service is None:
+            timer_service = TimerService()
+        elif timer_service.process_id != os.getpid():  # Threads are not inherited by child processes
+            timer_service = TimerService()
+        return timer_service
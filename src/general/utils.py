@@ -1,30 +1,70 @@
 import netifaces
 import ipaddress
 import struct
+import socket
+import threading
+import os
+import sys
+import array
+import itertools
 
 import conf.conf as conf
 
+try:  # Optional - Used to compute checksums of large messages
+    import numpy
+except ImportError:
+    numpy = None
+
 '''
 This class contains utility functions used throughout the router code
 '''
 
+RTMGRP_IPV4_IFADDR = 0x10  # Netlink multicast groups notifying IPv4 and IPv6 address changes
+RTMGRP_IPV6_IFADDR = 0x100
+NETLINK_BUFFER_SIZE = 65536
+INTERFACE_MTU_PATH = "/sys/class/net/{}/mtu"
+IPV4_FORMAT_STRING = "> L"  # IPv4 address as a 4-byte big-endian number
+NUMPY_CHECKSUM_THRESHOLD = 4096  # Minimum message length in bytes for checksums to be computed with NumPy
+
 
 class Utils:
 
+    #  Interface addresses are cached and only queried again after the kernel notifies an address change
+    address_cache = {}  # Interface name -> Result of netifaces.ifaddresses()
+    address_cache_lock = threading.RLock()
+    netlink_socket = None  # Receives address change notifications - One per process
+    netlink_process_id = None
+
+    #  Address strings in standard notation are converted by the C library, without creating ipaddress objects
+    #  Other arguments are handled by the ipaddress module, which also raises the appropriate errors
+
     #  Converts IPv4 addresses to numbers between 0 and 4294967295
     @staticmethod
     def ipv4_to_decimal(ip_address):
+        if isinstance(ip_address, str):
+            try:
+                return struct.unpack(IPV4_FORMAT_STRING, socket.inet_pton(socket.AF_INET, ip_address))[0]
+            except (OSError, ValueError):
+                pass
         return int(ipaddress.IPv4Address(ip_address))
 
     #  Converts IPv6 addresses to numbers between 0 and 340282366920938463463374607431768211455
     @staticmethod
     def ipv6_to_decimal(ip_address):
+        if isinstance(ip_address, str):
+            try:
+                return int.from_bytes(socket.inet_pton(socket.AF_INET6, ip_address), 'big')
+            except (OSError, ValueError):
+                pass
         return int(ipaddress.IPv6Address(ip_address))
 
     #  Converts numbers between 0 and 4294967295 to IPv4 addresses
     @staticmethod
     def decimal_to_ipv4(decimal):
-        return str(ipaddress.IPv4Address(int(decimal)))
+        decimal = int(decimal)
+        if 0 <= decimal <= conf.MAX_VALUE_32_BITS:
+            return socket.inet_ntoa(struct.pack(IPV4_FORMAT_STRING, decimal))
+        return str(ipaddress.IPv4Address(decimal))
 
     #  Converts numbers between 0 and 340282366920938463463374607431768211455 to IPv6 addresses
     @staticmethod
@@ -37,14 +77,10 @@ class Utils:
     def create_checksum_ospfv2(message):
         #  1 - If the message has an odd number of bytes, append a empty byte at the end
         if (len(message) % 2) != 0:
-            message += b'\x00'
+            message = bytes(message) + b'\x00'
 
         #  2 - Get all 16-bit blocks of the message, and sum them
-        content_chunk_sum = 0
-        for i in range(len(message) // 2):  # len() returns byte size - Chunks of 2 bytes are required
-            value = int(message.hex()[conf.HEX_DIGIT_BIT_SIZE * i:conf.HEX_DIGIT_BIT_SIZE * i +
-                        conf.HEX_DIGIT_BIT_SIZE], conf.BASE_16)
-            content_chunk_sum += value
+        content_chunk_sum = Utils.sum_16_bit_blocks(message)
 
         #  3 - If sum exceeds 16 bits, carry value (the remainder) is added to the 16-bit sum
         quotient, remainder = divmod(content_chunk_sum, conf.MAX_VALUE_16_BITS + 1)
@@ -58,6 +94,17 @@ class Utils:
         checksum = result ^ conf.MAX_VALUE_16_BITS
         return checksum
 
+    #  Returns the sum of all big-endian 16-bit blocks of a message with an even number of bytes
+    @staticmethod
+    def sum_16_bit_blocks(message):
+        if (numpy is not None) and (len(message) >= NUMPY_CHECKSUM_THRESHOLD):
+            return int(numpy.frombuffer(message, dtype='>u2').sum(dtype=numpy.uint64))
+        blocks = array.array('H')
+        blocks.frombytes(message)  # Blocks are read in the byte order of the machine
+        if sys.byteorder == 'little':
+            blocks.byteswap()
+        return sum(blocks)
+
     #  Calculates the OSPFv3 packet checksum
     #  It is assumed that the checksum field is clear
     @staticmethod
@@ -82,40 +129,82 @@ class Utils:
     #  It is assumed that the LSA Age (first 2 bytes) is removed, and the checksum field is clear
     @staticmethod
     def create_fletcher_checksum(message):
-        c0 = 0
-        c1 = 0
-        for i in range(len(message)):
-            c0 = (message[i] + c0) % conf.MAX_VALUE_8_BITS
-            c1 = (c0 + c1) % conf.MAX_VALUE_8_BITS
+        #  C0 is the sum of all bytes, and C1 is the sum of all partial sums of C0, both modulo 255
+        if (numpy is not None) and (len(message) >= NUMPY_CHECKSUM_THRESHOLD):
+            partial_sums = numpy.cumsum(numpy.frombuffer(message, dtype=numpy.uint8), dtype=numpy.uint64)
+            c0 = int(partial_sums[-1]) % conf.MAX_VALUE_8_BITS
+            c1 = int(partial_sums.sum(dtype=numpy.uint64)) % conf.MAX_VALUE_8_BITS
+        else:
+            c0 = sum(message) % conf.MAX_VALUE_8_BITS
+            c1 = sum(itertools.accumulate(message)) % conf.MAX_VALUE_8_BITS
         x = (-c1 + (len(message) - 15) * c0) % conf.MAX_VALUE_8_BITS  # Checksum starts at 16th byte of LSA
         y = (c1 - (len(message) - 15 + 1) * c0) % conf.MAX_VALUE_8_BITS
         return (x << conf.BYTE_SIZE) + y
 
+    #  Returns the addresses of an interface given its name (ex: ens33), as returned by netifaces
+    @staticmethod
+    def get_interface_addresses(interface_name):
+        with Utils.address_cache_lock:
+            if not Utils.is_address_cache_valid():
+                Utils.address_cache = {}
+            if interface_name in Utils.address_cache:
+                return Utils.address_cache[interface_name]
+            interface_addresses = netifaces.ifaddresses(interface_name)
+            if Utils.netlink_socket is not None:  # Without address change notifications cache could become stale
+                Utils.address_cache[interface_name] = interface_addresses
+            return interface_addresses
+
+    #  Returns False if interface addresses may have changed since they were cached
+    #  Pending notifications are read without blocking, so a change is noticed as soon as the kernel completes it
+    @staticmethod
+    def is_address_cache_valid():
+        if Utils.netlink_process_id != os.getpid():  # Netlink socket is not shared with parent process
+            Utils.netlink_process_id = os.getpid()
+            Utils.netlink_socket = None
+            try:
+                netlink_socket = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+                netlink_socket.bind((0, RTMGRP_IPV4_IFADDR | RTMGRP_IPV6_IFADDR))
+                Utils.netlink_socket = netlink_socket
+            except (AttributeError, OSError):
+                pass  # Netlink is not available - Addresses are not cached
+            return False
+        if Utils.netlink_socket is None:
+            return False
+        is_valid = True
+        while True:
+            try:
+                Utils.netlink_socket.recv(NETLINK_BUFFER_SIZE, socket.MSG_DONTWAIT)
+                is_valid = False  # Only address change notifications are received
+            except BlockingIOError:
+                return is_valid  # No more notifications
+            except OSError:
+                return False  # Notifications were lost
+
     #  Returns the IPv4 address of an interface given its name (ex: ens33)
     @staticmethod
     def interface_name_to_ipv4_address(interface_name):
-        return netifaces.ifaddresses(interface_name)[netifaces.AF_INET][0]['addr']
+        return Utils.get_interface_addresses(interface_name)[netifaces.AF_INET][0]['addr']
 
     #  Returns the IPv6 global address of an interface given its name (ex: ens33)
     @staticmethod
     def interface_name_to_ipv6_global_address(interface_name):
-        for i in range(len(netifaces.ifaddresses(interface_name)[netifaces.AF_INET6])):
-            ip_address = netifaces.ifaddresses(interface_name)[netifaces.AF_INET6][i]['addr']
+        for address in Utils.get_interface_addresses(interface_name)[netifaces.AF_INET6]:
+            ip_address = address['addr']
             if not ip_address.__contains__("fe80"):
                 return ip_address
 
     #  Returns the IPv6 link-local address of an interface given its name (ex: ens33)
     @staticmethod
     def interface_name_to_ipv6_link_local_address(interface_name):
-        for i in range(len(netifaces.ifaddresses(interface_name)[netifaces.AF_INET6])):
-            ip_address = netifaces.ifaddresses(interface_name)[netifaces.AF_INET6][i]['addr']
+        for address in Utils.get_interface_addresses(interface_name)[netifaces.AF_INET6]:
+            ip_address = address['addr']
             if ip_address.__contains__("fe80"):
                 return ip_address.split('%')[0]
 
     #  Returns the IPv4 network mask of an interface given its name (ex: ens33)
     @staticmethod
     def interface_name_to_ipv4_network_mask(interface_name):
-        return netifaces.ifaddresses(interface_name)[netifaces.AF_INET][0]['netmask']
+        return Utils.get_interface_addresses(interface_name)[netifaces.AF_INET][0]['netmask']
 
     #  Returns the IPv4 prefix and respective length of an interface given its name (ex: ens33)
     @staticmethod
@@ -130,7 +219,7 @@ class Utils:
     #  Returns the IPv6 network mask of an interface given its name (ex: ens33)
     @staticmethod
     def interface_name_to_ipv6_network_mask(interface_name):
-        return netifaces.ifaddresses(interface_name)[netifaces.AF_INET6][0]['netmask'].split("/")[0]
+        return Utils.get_interface_addresses(interface_name)[netifaces.AF_INET6][0]['netmask'].split("/")[0]
 
     #  Returns the IPv6 prefix and respective length of an interface given its name (ex: ens33)
     @staticmethod
@@ -141,9 +230,24 @@ class Utils:
         prefix = str(ipaddress.IPv6Interface((global_ipv6_address, prefix_length)).network).split("/")[0]
         return [prefix, prefix_length]
 
+    #  Returns the MTU of an interface given its name (ex: ens33) - Returns default MTU if it cannot be read
+    @staticmethod
+    def interface_name_to_mtu(interface_name):
+        try:
+            with open(INTERFACE_MTU_PATH.format(interface_name)) as mtu_file:
+                return int(mtu_file.read())
+        except (OSError, ValueError):
+            return conf.MTU
+
     #  Returns True if argument is a valid IPv4 address
     @staticmethod
     def is_ipv4_address(ip_address):
+        if isinstance(ip_address, str):
+            try:
+                socket.inet_pton(socket.AF_INET, ip_address)
+                return True
+            except (OSError, ValueError):
+                pass
         try:
             int(ip_address)
             return False
@@ -157,6 +261,12 @@ class Utils:
     #  Returns True if argument is a valid IPv6 address
     @staticmethod
     def is_ipv6_address(ip_address):
+        if isinstance(ip_address, str):
+            try:
+                socket.inet_pton(socket.AF_INET6, ip_address)
+                return True
+            except (OSError, ValueError):
+                pass
         try:
             int(ip_address)
             return False
@@ -42,14 +42,14 @@ class Interface:
         self.network_mask = network_mask  # Just for OSPFv2
         self.link_prefixes = link_prefixes  # Just for OSPFv3
         self.area_id = area_id  # 0.0.0.0 - Backbone area
-        self.hello_interval = conf.HELLO_INTERVAL
+        self.hello_interval = conf.HELLO_INTERVAL  # 0 in minimal Hello mode
         self.router_dead_interval = conf.ROUTER_DEAD_INTERVAL
         self.router_priority = conf.ROUTER_PRIORITY
         self.neighbors = {}
         self.designated_router = conf.DEFAULT_DESIGNATED_ROUTER  # 0.0.0.0 - No DR known
         self.backup_designated_router = conf.DEFAULT_DESIGNATED_ROUTER
         self.cost = cost
-        self.max_ip_datagram = conf.MTU
+        self.max_ip_datagram = utils.Utils.interface_name_to_mtu(physical_identifier)
         #  TODO: Allow router to operate more than one instance of OSPFv3
         self.instance_id = 0  # Just for OSPFv3 - Default is 0
         self.transmission_delay = 0
@@ -72,6 +72,8 @@ class Interface:
             destination_address = conf.ALL_OSPF_ROUTERS_IPV6
             self.hello_packet_to_send.create_header_v3(
                 conf.PACKET_TYPE_HELLO, self.router_id, area_id, self.instance_id, source_address, destination_address)
+        self.hello_packet_bytes = b''  # Finalized Hello packet - Only rebuilt when its content changes
+        self.hello_packet_parameters = None  # Content of the finalized Hello packet
         self.lsa_lock = threading.RLock()  # For controlling access to interface LSA list
         self.lsdb = lsdb  # Reference to the area LSDB
         self.localhost = localhost
@@ -82,19 +84,19 @@ class Interface:
         #  Remains None if interface is being run as part of unit test
         self.extension_lsdb = None
 
-        self.hello_thread = None
         self.hello_timer = timer.Timer()
         self.hello_offset = 0
         self.hello_timeout = threading.Event()
-        self.hello_timer_shutdown = threading.Event()
         self.hello_timer_seconds = self.hello_interval
+        self.hello_multiplier = 0  # Hello packets sent per second in minimal Hello mode, 0 otherwise
 
-        self.waiting_thread = None
         self.waiting_timer = timer.Timer()
-        self.waiting_reset = threading.Event()
         self.waiting_timeout = threading.Event()
-        self.waiting_timer_shutdown = threading.Event()
-        self.waiting_timer_seconds = conf.ROUTER_DEAD_INTERVAL
+        self.waiting_timer_seconds = self.router_dead_interval
+
+        hello_interval, router_dead_interval, hello_multiplier = Interface.get_configured_timer_intervals(
+            physical_identifier)
+        self.set_timer_intervals(hello_interval, router_dead_interval, hello_multiplier)
 
         self.ls_ack_thread = None
         self.ls_ack_timer_seconds = conf.LS_ACK_TRANSMISSION_DELAY
@@ -205,9 +207,9 @@ class Interface:
                         if version == conf.VERSION_IPV6:
                             neighbor_interface_id = incoming_packet.body.interface_id
                         neighbor_options = incoming_packet.body.options
-                        new_neighbor = neighbor.Neighbor(
+                        new_neighbor = neighbor.Neighbor.create_unchecked(
                             neighbor_id, neighbor_priority, neighbor_interface_id, source_ip, neighbor_options,
-                            neighbor_dr, neighbor_bdr, self.router_id)
+                            neighbor_dr, neighbor_bdr, self.router_id, self.router_dead_interval)
                         self.neighbors[neighbor_id] = new_neighbor
 
                     #  Existing neighbor
@@ -384,7 +386,7 @@ class Interface:
 
                     for received_lsa in incoming_packet.body.lsa_list:
 
-                        if not received_lsa.is_lsa_checksum_valid():
+                        if not received_lsa.is_lsa_checksum_valid(True):
                             continue
                         if not received_lsa.is_ls_type_valid(received_lsa.header.ls_type, self.version):
                             continue
@@ -418,6 +420,8 @@ class Interface:
 
                         #  If LSA instance is not in LSDB or if received instance is more recent
                         if (local_copy is None) | (lsa.Lsa.get_fresher_lsa(received_lsa, local_copy) == header.FIRST):
+                            if received_lsa.body is None:  # LSA body is only decoded when instance is installed
+                                continue
                             self.add_lsa_to_flooding_pipeline(received_lsa, neighbor_id)  # This LSA will be flooded
                             for n in self.neighbors:  # Implicit acknowledgement
                                 self.neighbors[n].delete_lsa_identifier(
@@ -513,31 +517,24 @@ class Interface:
                 if self.neighbors[n].neighbor_state in [conf.NEIGHBOR_STATE_EXCHANGE, conf.NEIGHBOR_STATE_LOADING]:
                     neighbors_state_exchange_loading = True
             if not neighbors_state_exchange_loading:
-                lsa_list = self.get_complete_lsdb(None)
-                for query_lsa in lsa_list:
-                    lsa_identifier = query_lsa.get_lsa_identifier()
+                for lsa_identifier in self.get_aged_lsa_identifiers(conf.MAX_AGE, None):
                     lsa_in_retransmission_list = False
                     for n in self.neighbors:
                         if lsa_identifier in self.neighbors[n].ls_retransmission_list:
                             lsa_in_retransmission_list = True
-                    if (not lsa_in_retransmission_list) & (query_lsa.header.ls_age >= conf.MAX_AGE):
+                    if not lsa_in_retransmission_list:
                         self.delete_lsa(lsa_identifier[0], lsa_identifier[1], lsa_identifier[2])
 
             #  Creates new instances of own LSAs if previous reach LS Age of 30 minutes
-            lsa_instances = self.get_complete_lsdb(None)
-            for query_lsa in lsa_instances:
-                if (query_lsa.header.ls_age >= conf.LS_REFRESH_TIME) & (
-                        query_lsa.header.advertising_router == self.router_id):
+            for lsa_identifier in self.get_aged_lsa_identifiers(conf.LS_REFRESH_TIME, self.router_id):
+                query_lsa = self.get_lsa(lsa_identifier[0], lsa_identifier[1], lsa_identifier[2], [self])
+                if query_lsa is not None:
                     #  Creates and floods new instance of LSA with same body
                     self.event_ls_age_refresh_time(query_lsa)
 
             #  Sends Hello packet
             if self.hello_timeout.is_set():
-                self.create_hello_packet()
-                if self.version == conf.VERSION_IPV4:
-                    self.send_packet(self.hello_packet_to_send, conf.ALL_OSPF_ROUTERS_IPV4, None)
-                else:
-                    self.send_packet(self.hello_packet_to_send, conf.ALL_OSPF_ROUTERS_IPV6, None)
+                self.send_hello_packet()
                 self.hello_timeout.clear()
 
         #  Interface signalled to shutdown
@@ -545,10 +542,11 @@ class Interface:
 
     #  Sends an OSPF packet through the interface
     def send_packet(self, packet_to_send, destination_address, neighbor_router):
-        packet_bytes = packet_to_send.pack_packet()
         if self.version == conf.VERSION_IPV4:
+            packet_bytes = packet_to_send.pack_packet_to_send('', destination_address)
             self.socket.send_ipv4(packet_bytes, destination_address, self.physical_identifier, self.localhost)
         else:
+            packet_bytes = packet_to_send.pack_packet_to_send(self.ipv6_address, destination_address)
             self.socket.send_ipv6(packet_bytes, destination_address, self.physical_identifier, self.localhost)
 
         if packet_to_send.header.packet_type == conf.PACKET_TYPE_LS_REQUEST:
@@ -570,17 +568,17 @@ class Interface:
 
     #  Performs shutdown operations on the interface
     def shutdown_interface(self):
-        for n in list(self.neighbors):  # Stops timer thread in all neighbors
+        for n in list(self.neighbors):  # Stops timers of all neighbors
             self.event_kill_nbr(n)
-        self.hello_timer_shutdown.set()
-        self.hello_thread.join()
-        self.waiting_timer_shutdown.set()
-        self.waiting_thread.join()
+        self.hello_timer.stop_timer()
+        self.waiting_timer.stop_timer()
         self.ls_ack_thread.join()
-        #  Reset interface values
+        #  Reset interface values, keeping its timer intervals
+        timer_intervals = [self.hello_interval, self.router_dead_interval, self.hello_multiplier]
         self.__init__(self.router_id, self.physical_identifier, self.ipv4_address, self.ipv6_address, self.network_mask,
                       self.link_prefixes, self.area_id, self.pipeline, self.interface_shutdown, self.version, self.lsdb,
                       self.localhost, self.is_abr, self.cost)
+        self.set_timer_intervals(timer_intervals[0], timer_intervals[1], timer_intervals[2])
 
     #  Groups LSAs to acknowledge and sends delayed acknowledgments
     def send_delayed_acknowledgements(self):
@@ -612,10 +610,7 @@ class Interface:
     def event_interface_up(self):
         if self.state == conf.INTERFACE_STATE_DOWN:
             #  Starts Hello timer
-            self.hello_thread = threading.Thread(
-                target=self.hello_timer.interval_timer,
-                args=(self.hello_offset, self.hello_timeout, self.hello_timer_shutdown, self.hello_timer_seconds))
-            self.hello_thread.start()  # Thread must be created and started after every interface shutdown
+            self.hello_timer.interval_timer(self.hello_offset, self.hello_timeout, self.hello_timer_seconds)
             self.hello_timeout.set()  # Hello packet will be sent immediately if CPU is not lost
             self.interface_shutdown.clear()
 
@@ -625,19 +620,14 @@ class Interface:
                 self.set_interface_state(conf.INTERFACE_STATE_DROTHER)
             else:
                 self.set_interface_state(conf.INTERFACE_STATE_WAITING)
-                self.waiting_thread = threading.Thread(
-                    target=self.waiting_timer.single_shot_timer,
-                    args=(self.waiting_reset, self.waiting_timeout, self.waiting_timer_shutdown,
-                          self.waiting_timer_seconds))
-                self.waiting_thread.start()
+                self.waiting_timer.single_shot_timer(self.waiting_timeout, self.waiting_timer_seconds)
 
             self.ls_ack_thread = threading.Thread(target=self.send_delayed_acknowledgements)
             self.ls_ack_thread.start()
 
     #  WaitTimer event
     def event_wait_timer(self):
-        self.waiting_timer_shutdown.set()
-        self.waiting_thread.join()
+        self.waiting_timer.stop_timer()
         self.waiting_timeout.clear()
         if self.state == conf.INTERFACE_STATE_WAITING:
             self.election_algorithm()
@@ -862,14 +852,14 @@ class Interface:
                         conf.PACKET_TYPE_DB_DESCRIPTION, self.router_id, self.area_id, conf.NULL_AUTHENTICATION,
                         conf.DEFAULT_AUTH)
                     neighbor_router.last_sent_dd_description_packet.create_db_description_packet_body(
-                        conf.MTU, conf.OPTIONS_V2, True, True, neighbor_router.master_slave,
+                        self.max_ip_datagram, conf.OPTIONS_V2, True, True, neighbor_router.master_slave,
                         self.neighbors[neighbor_id].dd_sequence, [], conf.VERSION_IPV4)
                 else:
                     neighbor_router.last_sent_dd_description_packet.create_header_v3(
                         conf.PACKET_TYPE_DB_DESCRIPTION, self.router_id, self.area_id, self.instance_id,
                         self.ipv6_address, source_ip)
                     neighbor_router.last_sent_dd_description_packet.create_db_description_packet_body(
-                        conf.MTU, conf.OPTIONS_V3, True, True, neighbor_router.master_slave,
+                        self.max_ip_datagram, conf.OPTIONS_V3, True, True, neighbor_router.master_slave,
                         self.neighbors[neighbor_id].dd_sequence, [], conf.VERSION_IPV6)
                 self.send_packet(neighbor_router.last_sent_dd_description_packet, source_ip, neighbor_router)
         else:  # Nothing to do
@@ -957,14 +947,14 @@ class Interface:
             dd_packet.create_header_v2(conf.PACKET_TYPE_DB_DESCRIPTION, self.router_id, self.area_id,
                                        conf.NULL_AUTHENTICATION, conf.DEFAULT_AUTH)
             dd_packet.create_db_description_packet_body(
-                conf.MTU, conf.OPTIONS_V2, True, True, neighbor_router.master_slave, neighbor_router.dd_sequence, [],
-                conf.VERSION_IPV4)
+                self.max_ip_datagram, conf.OPTIONS_V2, True, True, neighbor_router.master_slave,
+                neighbor_router.dd_sequence, [], conf.VERSION_IPV4)
         else:
             dd_packet.create_header_v3(conf.PACKET_TYPE_DB_DESCRIPTION, self.router_id, self.area_id, self.instance_id,
                                        self.ipv6_address, source_ip)
             dd_packet.create_db_description_packet_body(
-                conf.MTU, conf.OPTIONS_V3, True, True, neighbor_router.master_slave, neighbor_router.dd_sequence, [],
-                conf.VERSION_IPV6)
+                self.max_ip_datagram, conf.OPTIONS_V3, True, True, neighbor_router.master_slave,
+                neighbor_router.dd_sequence, [], conf.VERSION_IPV6)
         self.send_packet(dd_packet, source_ip, neighbor_router)
 
     #  BadLSReq event
@@ -999,9 +989,12 @@ class Interface:
         neighbor_router.stop_retransmission_timer(neighbor.DB_DESCRIPTION)
         #  TODO: Implement resending if incoming packet is duplicate
         invalid_ls_type = False
+        area_lsa_headers = []  # Compared with the LSDB in a single scan
         for lsa_header in incoming_packet.body.lsa_headers:
             if not lsa.Lsa.is_ls_type_valid(lsa_header.ls_type, self.version):
                 invalid_ls_type = True
+            elif self.lsdb.is_area_ls_type(lsa_header.ls_type) & (not self.is_extension_ls_type(lsa_header.ls_type)):
+                area_lsa_headers.append(lsa_header)
             else:
                 local_lsa = self.get_lsa(  # None if no LSA found
                     lsa_header.ls_type, lsa_header.link_state_id, lsa_header.advertising_router, [self])
@@ -1010,6 +1003,8 @@ class Interface:
                     neighbor_router.add_lsa_identifier(neighbor_router.ls_request_list, lsa_header.get_lsa_identifier())
                 elif header.Header.get_fresher_lsa_header(lsa_header, local_lsa.header) == header.FIRST:
                     neighbor_router.add_lsa_identifier(neighbor_router.ls_request_list, lsa_header.get_lsa_identifier())
+        for lsa_header in self.lsdb.get_fresher_lsa_headers(area_lsa_headers):
+            neighbor_router.add_lsa_identifier(neighbor_router.ls_request_list, lsa_header.get_lsa_identifier())
         return invalid_ls_type
 
     #  Given a neighbor RID, returns True if this router and the neighbor should become fully adjacent
@@ -1296,8 +1291,7 @@ class Interface:
         lsa_instance.header.ls_sequence_number = lsa.Lsa.get_next_ls_sequence_number(
             lsa_instance.header.ls_sequence_number)
         lsa_instance.header.ls_age = conf.INITIAL_LS_AGE
-        lsa_instance.set_lsa_length()
-        lsa_instance.set_lsa_checksum()
+        lsa_instance.finalize_lsa()
         self.install_flood_lsa(lsa_instance, neighbor_id)
 
     def install_flood_lsa(self, lsa_instance, neighbor_id):
@@ -1376,14 +1370,16 @@ class Interface:
             conf.LSA_TYPE_INTRA_AREA_PREFIX, conf.LSA_TYPE_NETWORK, ls_sequence_number)
         intra_area_prefix_lsa.create_intra_area_prefix_lsa_body(
             conf.LSA_TYPE_NETWORK, self.ospf_identifier, self.router_id)
-        for query_lsa in self.get_link_lsa_list():  # Assumes this router is DR
-            neighbor_id = query_lsa.header.advertising_router
-            if neighbor_id in self.neighbors:
-                if (self.neighbors[neighbor_id].neighbor_state == conf.NEIGHBOR_STATE_FULL) & (
-                        self.neighbors[neighbor_id].neighbor_interface_id == query_lsa.header.link_state_id):
-                    for prefix_info in query_lsa.body.prefixes:
-                        intra_area_prefix_lsa.add_prefix_info(prefix_info[0], prefix_info[1], self.cost, prefix_info[2],
-                                                              conf.LSA_TYPE_INTRA_AREA_PREFIX)
+        with intra_area_prefix_lsa.edit():
+            for query_lsa in self.get_link_lsa_list():  # Assumes this router is DR
+                neighbor_id = query_lsa.header.advertising_router
+                if neighbor_id in self.neighbors:
+                    if (self.neighbors[neighbor_id].neighbor_state == conf.NEIGHBOR_STATE_FULL) & (
+                            self.neighbors[neighbor_id].neighbor_interface_id == query_lsa.header.link_state_id):
+                        for prefix_info in query_lsa.body.prefixes:
+                            intra_area_prefix_lsa.add_prefix_info(
+                                prefix_info[0], prefix_info[1], self.cost, prefix_info[2],
+                                conf.LSA_TYPE_INTRA_AREA_PREFIX)
         return intra_area_prefix_lsa
 
     #  Returns a LSA with header created and empty body
@@ -1421,18 +1417,76 @@ class Interface:
     #  Auxiliary methods  #
     #  #  #  #  #  #  #  #
 
-    #  Creates an OSPF Hello packet to be sent
+    #  Sets Hello and Router Dead intervals of the interface, or minimal Hello mode if Hello multiplier is not 0
+    def set_timer_intervals(self, hello_interval, router_dead_interval, hello_multiplier):
+        if hello_multiplier != 0:
+            if not (conf.MIN_HELLO_MULTIPLIER <= hello_multiplier <= conf.MAX_HELLO_MULTIPLIER):
+                raise ValueError("Invalid Hello multiplier")
+            #  Hello packets advertise Hello Interval of 0 and Router Dead Interval of 1 s
+            hello_interval = 0
+            router_dead_interval = conf.MINIMAL_ROUTER_DEAD_INTERVAL
+            hello_timer_seconds = router_dead_interval / hello_multiplier
+        else:
+            if not (0 < hello_interval <= conf.MAX_VALUE_16_BITS):
+                raise ValueError("Invalid Hello interval")
+            if (router_dead_interval <= hello_interval) | (router_dead_interval > conf.MAX_VALUE_16_BITS):
+                raise ValueError("Invalid Router Dead interval")
+            hello_timer_seconds = hello_interval
+
+        self.hello_interval = hello_interval
+        self.router_dead_interval = router_dead_interval
+        self.hello_multiplier = hello_multiplier
+        self.hello_timer_seconds = hello_timer_seconds
+        self.waiting_timer_seconds = router_dead_interval
+        if self.hello_timer.is_running():  # Interface is operating
+            self.hello_timer.interval_timer(0, self.hello_timeout, self.hello_timer_seconds)
+
+    #  Returns Hello interval, Router Dead interval and Hello multiplier configured for provided interface
+    @staticmethod
+    def get_configured_timer_intervals(physical_identifier):
+        hello_interval = conf.HELLO_INTERVAL
+        router_dead_interval = conf.ROUTER_DEAD_INTERVAL
+        if physical_identifier in conf.INTERFACE_TIMER_INTERVALS:
+            hello_interval, router_dead_interval = conf.INTERFACE_TIMER_INTERVALS[physical_identifier]
+        hello_multiplier = conf.INTERFACE_HELLO_MULTIPLIERS.get(physical_identifier, 0)
+        return hello_interval, router_dead_interval, hello_multiplier
+
+    #  Sends finalized Hello packet byte stream, creating it again if any of its fields changed
+    def send_hello_packet(self):
+        if self.get_hello_packet_parameters() != self.hello_packet_parameters:
+            self.create_hello_packet()
+        if self.version == conf.VERSION_IPV4:
+            self.socket.send_ipv4(
+                self.hello_packet_bytes, conf.ALL_OSPF_ROUTERS_IPV4, self.physical_identifier, self.localhost)
+        else:
+            self.socket.send_ipv6(
+                self.hello_packet_bytes, conf.ALL_OSPF_ROUTERS_IPV6, self.physical_identifier, self.localhost)
+
+    #  Creates an OSPF Hello packet to be sent and stores its finalized byte stream
     def create_hello_packet(self):
         if self.version == conf.VERSION_IPV4:
             self.hello_packet_to_send.create_hello_v2_packet_body(
                 self.network_mask, self.hello_interval, conf.OPTIONS_V2, self.router_priority,
                 self.router_dead_interval, self.designated_router, self.backup_designated_router, self.neighbors)
+            self.hello_packet_bytes = self.hello_packet_to_send.pack_packet_to_send('', conf.ALL_OSPF_ROUTERS_IPV4)
         else:
             self.hello_packet_to_send.create_hello_v3_packet_body(
                 self.ospf_identifier, self.hello_interval, conf.OPTIONS_V3, self.router_priority,
                 self.router_dead_interval, self.designated_router, self.backup_designated_router, self.neighbors)
+            self.hello_packet_bytes = self.hello_packet_to_send.pack_packet_to_send(
+                self.ipv6_address, conf.ALL_OSPF_ROUTERS_IPV6)
+        self.hello_packet_parameters = self.get_hello_packet_parameters()
         return self.hello_packet_to_send
 
+    #  Returns the interface fields included in the Hello packet
+    def get_hello_packet_parameters(self):
+        if self.version == conf.VERSION_IPV4:
+            interface_parameter = self.network_mask
+        else:  # Source address is part of the OSPFv3 checksum
+            interface_parameter = (self.ospf_identifier, self.ipv6_address)
+        return (interface_parameter, self.hello_interval, self.router_priority, self.router_dead_interval,
+                self.designated_router, self.backup_designated_router, tuple(self.neighbors))
+
     def get_neighbor_count(self):
         return len(self.neighbors)
 
@@ -1529,6 +1583,12 @@ class Interface:
             return []
         return self.extension_lsdb.get_extension_lsdb(identifiers)
 
+    #  Returns headers of full OSPF extension LSDB or part of it
+    def get_extension_lsa_headers(self, identifiers):
+        if self.extension_lsdb is None:  # Unit test
+            return []
+        return self.extension_lsdb.get_extension_lsa_headers(identifiers)
+
     #  Returns desired LSA if present in OSPF extension LSDB
     def get_extension_lsa(self, ls_type, link_state_id, advertising_router):
         if self.extension_lsdb is None:  # Unit test
@@ -1560,23 +1620,35 @@ class Interface:
 
     #  Gets all LSA headers (except link-local-scope LSAs of other interfaces) from area LSDB and extension LSDB
     def get_complete_lsdb_headers(self, identifiers):
-        lsa_headers = []
-        for query_lsa in self.get_complete_lsdb(identifiers):
-            lsa_headers.append(query_lsa.header)
-        return lsa_headers
+        return self.lsdb.get_lsa_headers([self], identifiers) + self.get_extension_lsa_headers(identifiers)
+
+    #  Gets identifiers of LSAs (except link-local-scope LSAs of other interfaces) from area LSDB and extension LSDB with
+    #  at least provided LS Age and, if provided, with given Advertising Router
+    def get_aged_lsa_identifiers(self, minimum_ls_age, advertising_router):
+        lsa_identifiers = self.lsdb.get_lsa_identifiers([self], minimum_ls_age, advertising_router)
+        for lsa_header in self.get_extension_lsa_headers(None):
+            if (lsa_header.ls_age >= minimum_ls_age) & (
+                    (advertising_router is None) | (lsa_header.advertising_router == advertising_router)):
+                lsa_identifiers.append(lsa_header.get_lsa_identifier())
+        return lsa_identifiers
 
     #  Gets LSA either from area LSDB or extension LSDB according to desired LS Type
     def get_lsa(self, ls_type, link_state_id, advertising_router, interfaces):
         ls_type = header.Header.get_ls_type(ls_type)  # Removes S1, S2 and U bits in OSPFv3, otherwise does nothing
-        if (self.version == conf.VERSION_IPV4) & (ls_type in [
-                conf.LSA_TYPE_OPAQUE_LINK_LOCAL, conf.LSA_TYPE_OPAQUE_AREA, conf.LSA_TYPE_OPAQUE_AS]):
-            return self.get_extension_lsa(ls_type, link_state_id, advertising_router)
-        if (self.version == conf.VERSION_IPV6) & (ls_type in [
-                conf.LSA_TYPE_EXTENSION_ABR_LSA, conf.LSA_TYPE_EXTENSION_PREFIX_LSA, conf.LSA_TYPE_EXTENSION_ASBR_LSA]):
+        if self.is_extension_ls_type(ls_type):
             return self.get_extension_lsa(ls_type, link_state_id, advertising_router)
         else:
             return self.lsdb.get_lsa(ls_type, link_state_id, advertising_router, interfaces)
 
+    #  Returns True if LSAs with provided LS Type are stored in extension LSDB
+    def is_extension_ls_type(self, ls_type):
+        ls_type = header.Header.get_ls_type(ls_type)
+        return ((self.version == conf.VERSION_IPV4) & (ls_type in [
+                conf.LSA_TYPE_OPAQUE_LINK_LOCAL, conf.LSA_TYPE_OPAQUE_AREA, conf.LSA_TYPE_OPAQUE_AS])) | (
+                (self.version == conf.VERSION_IPV6) & (ls_type in [
+                    conf.LSA_TYPE_EXTENSION_ABR_LSA, conf.LSA_TYPE_EXTENSION_PREFIX_LSA,
+                    conf.LSA_TYPE_EXTENSION_ASBR_LSA]))
+
     #  Gets LSA header either from area LSDB or extension LSDB according to desired LS Type
     def get_lsa_header(self, ls_type, link_state_id, advertising_router, interfaces):
         return self.get_lsa(ls_type, link_state_id, advertising_router, interfaces).header
@@ -1591,11 +1663,7 @@ class Interface:
     #  Deletes LSA from either area LSDB or extension LSDB according to LS Type
     def delete_lsa(self, ls_type, link_state_id, advertising_router):
         ls_type = header.Header.get_ls_type(ls_type)
-        if (self.version == conf.VERSION_IPV4) & (ls_type in [
-                conf.LSA_TYPE_OPAQUE_LINK_LOCAL, conf.LSA_TYPE_OPAQUE_AREA, conf.LSA_TYPE_OPAQUE_AS]):
-            return self.delete_extension_lsa(ls_type, link_state_id, advertising_router)
-        if (self.version == conf.VERSION_IPV6) & (ls_type in [
-                conf.LSA_TYPE_EXTENSION_ABR_LSA, conf.LSA_TYPE_EXTENSION_PREFIX_LSA, conf.LSA_TYPE_EXTENSION_ASBR_LSA]):
+        if self.is_extension_ls_type(ls_type):
             return self.delete_extension_lsa(ls_type, link_state_id, advertising_router)
         else:
             self.lsdb.delete_lsa(ls_type, link_state_id, advertising_router, [self])
@@ -1618,6 +1686,27 @@ class Interface:
                 link_lsa_list.append(query_lsa)
         return link_lsa_list
 
+    #  Atomically gets copies of the headers of all link-local LSAs, or of the ones with provided identifiers
+    def get_link_local_lsa_headers(self, identifiers):
+        lsa_headers = []
+        with self.lsa_lock:
+            for local_lsa in self.link_local_lsa_list:
+                if identifiers is None:
+                    lsa_headers.append(copy.copy(local_lsa.header))
+                elif local_lsa.get_lsa_identifier() in identifiers:
+                    lsa_headers.append(copy.copy(local_lsa.header))
+        return lsa_headers
+
+    #  Atomically gets a copy of a link-local LSA header from interface
+    def get_link_local_lsa_header(self, ls_type, link_state_id, advertising_router):
+        if not utils.Utils.is_ipv4_address(link_state_id):
+            link_state_id = utils.Utils.decimal_to_ipv4(link_state_id)
+        with self.lsa_lock:
+            for local_lsa in self.link_local_lsa_list:
+                if local_lsa.is_lsa_identifier_equal(ls_type, link_state_id, advertising_router):
+                    return copy.copy(local_lsa.header)
+            return None
+
     #  Atomically gets a link-local LSA from interface
     def get_link_local_lsa(self, ls_type, link_state_id, advertising_router):
         if not utils.Utils.is_ipv4_address(link_state_id):
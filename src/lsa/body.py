@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 
 class Body(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def pack_lsa_body(self):
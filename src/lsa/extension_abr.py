@@ -24,9 +24,11 @@ This class represents the body of an ABR-LSA of the OSPF extension and contains
 #  > - Big-endian
 #  L - Unsigned long (4 bytes) - struct.pack("> L", 1) -> b'\x00\x00\x00\x01
 BASE_FORMAT_STRING = "> L L"  # Determines the format of the byte object to be created
+BASE_STRUCT = struct.Struct(BASE_FORMAT_STRING)
 
 
 class ExtensionAbr(body.Body):  # 8 bytes / ABR
+    __slots__ = ('abr_list',)
 
     def __init__(self):
         self.abr_list = []  # 8 bytes / ABR
@@ -62,23 +64,21 @@ class ExtensionAbr(body.Body):  # 8 bytes / ABR
 
     #  Creates byte object suitable to be sent and recognized as the body of an ABR-LSA of the OSPF extension
     def pack_lsa_body(self):
-        body_bytes = b''
+        body_bytes = []
         for abr_info in self.abr_list:
             metric = int(abr_info[0])
             decimal_neighbor_router_id = utils.Utils.ipv4_to_decimal(abr_info[1])
-            body_bytes += struct.pack(BASE_FORMAT_STRING, metric, decimal_neighbor_router_id)
-        return body_bytes
+            body_bytes.append(BASE_STRUCT.pack(metric, decimal_neighbor_router_id))
+        return b''.join(body_bytes)
 
     #  Converts byte stream to body of an ABR-LSA of the OSPF extension
     @staticmethod
     def unpack_lsa_body(body_bytes, version):
         extension_abr_lsa = ExtensionAbr()
-        while len(body_bytes) > 0:
-            abr_parameters = struct.unpack(BASE_FORMAT_STRING, body_bytes[:8])
+        for abr_parameters in BASE_STRUCT.iter_unpack(body_bytes):
             metric = int(abr_parameters[0])
             neighbor_router_id = utils.Utils.decimal_to_ipv4(abr_parameters[1])
             extension_abr_lsa.add_abr_info(metric, neighbor_router_id)
-            body_bytes = body_bytes[8:]
         return extension_abr_lsa
 
     def __str__(self):
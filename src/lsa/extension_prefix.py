@@ -58,9 +58,15 @@ OSPFv3
 SUBNET_FORMAT_STRING = "> L L L"
 OSPFV3_BASE_FORMAT_STRING = "> L"
 PREFIX_DATA_FORMAT_STRING = "> L B B H"
+SUBNET_STRUCT = struct.Struct(SUBNET_FORMAT_STRING)
+OSPFV3_BASE_STRUCT = struct.Struct(OSPFV3_BASE_FORMAT_STRING)
+PREFIX_DATA_STRUCT = struct.Struct(PREFIX_DATA_FORMAT_STRING)
+WORD_STRUCT = struct.Struct("> L")  # Parts of address prefix with variable length
+DOUBLE_WORD_STRUCT = struct.Struct("> Q")
 
 
 class ExtensionPrefix(body.Body):  # OSPFv2 - 12 bytes / subnet; OSPFv3 - 4 bytes + 8-24 bytes / prefix
+    __slots__ = ('subnet_list', 'prefix_number', 'prefix_list', 'version')
 
     def __init__(self, version):
         self.subnet_list = []  # 12 bytes / subnet - Just for OSPFv2
@@ -146,31 +152,31 @@ class ExtensionPrefix(body.Body):  # OSPFv2 - 12 bytes / subnet; OSPFv3 - 4 byte
                 metric = subnet_info[0]
                 decimal_subnet_mask = utils.Utils.ipv4_to_decimal(subnet_info[1])
                 decimal_subnet_address = utils.Utils.ipv4_to_decimal(subnet_info[2])
-                body_bytes += struct.pack(SUBNET_FORMAT_STRING, metric, decimal_subnet_mask, decimal_subnet_address)
+                body_bytes += SUBNET_STRUCT.pack(metric, decimal_subnet_mask, decimal_subnet_address)
 
         elif self.version == conf.VERSION_IPV6:
-            body_bytes = struct.pack(OSPFV3_BASE_FORMAT_STRING, self.prefix_number)
+            body_bytes = OSPFV3_BASE_STRUCT.pack(self.prefix_number)
             for prefix_info in self.prefix_list:
                 metric = prefix_info[0]
                 prefix_length = prefix_info[1]
                 prefix_options = prefix_info[2]
                 decimal_prefix = utils.Utils.ipv6_to_decimal(prefix_info[3])
-                prefix_data = struct.pack(PREFIX_DATA_FORMAT_STRING, metric, prefix_length, prefix_options, 0)
+                prefix_data = PREFIX_DATA_STRUCT.pack(metric, prefix_length, prefix_options, 0)
                 body_bytes += prefix_data
 
                 #  Packing data with variable length
                 if prefix_length == 0:
                     prefix_bytes = b''
                 elif 0 < prefix_length <= 32:
-                    prefix_bytes = struct.pack("> L", decimal_prefix >> 96)
+                    prefix_bytes = WORD_STRUCT.pack(decimal_prefix >> 96)
                 elif 32 < prefix_length <= 64:
-                    prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
+                    prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
                 elif 64 < prefix_length <= 96:
-                    prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
-                    prefix_bytes += struct.pack("> L", (decimal_prefix >> 32) & conf.MAX_VALUE_32_BITS)
+                    prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
+                    prefix_bytes += WORD_STRUCT.pack((decimal_prefix >> 32) & conf.MAX_VALUE_32_BITS)
                 else:  # 96 < prefix_length <= 128:
-                    prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
-                    prefix_bytes += struct.pack("> Q", decimal_prefix & conf.MAX_VALUE_64_BITS)
+                    prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
+                    prefix_bytes += DOUBLE_WORD_STRUCT.pack(decimal_prefix & conf.MAX_VALUE_64_BITS)
                 body_bytes += prefix_bytes
 
         else:
@@ -181,51 +187,45 @@ class ExtensionPrefix(body.Body):  # OSPFv2 - 12 bytes / subnet; OSPFv3 - 4 byte
     #  Converts byte stream to body of a Prefix-LSA of the OSPF extension
     @staticmethod
     def unpack_lsa_body(body_bytes, version):
+        offset = 0  # Fields are read in place from the byte stream, without slicing it
         if version == conf.VERSION_IPV4:
             unpacked_body = ExtensionPrefix(conf.VERSION_IPV4)
-            while len(body_bytes) > 0:
-                subnet_bytes = body_bytes[:12]
-                subnet_parameters = struct.unpack(SUBNET_FORMAT_STRING, subnet_bytes)
+            while offset < len(body_bytes):
+                subnet_parameters = SUBNET_STRUCT.unpack_from(body_bytes, offset)
                 metric = subnet_parameters[0]
                 subnet_mask = utils.Utils.decimal_to_ipv4(subnet_parameters[1])
                 subnet_address = utils.Utils.decimal_to_ipv4(subnet_parameters[2])
                 unpacked_body.add_subnet_info(metric, subnet_mask, subnet_address)
-                body_bytes = body_bytes[12:]
+                offset += 12
 
         elif version == conf.VERSION_IPV6:
             unpacked_body = ExtensionPrefix(conf.VERSION_IPV6)
-            prefix_number = struct.unpack(OSPFV3_BASE_FORMAT_STRING, body_bytes[:4])[0]
-            body_bytes = body_bytes[4:]
+            prefix_number = OSPFV3_BASE_STRUCT.unpack_from(body_bytes, offset)[0]
+            offset += 4
             for i in range(prefix_number):
-                prefix_data = struct.unpack(PREFIX_DATA_FORMAT_STRING, body_bytes[:8])
+                prefix_data = PREFIX_DATA_STRUCT.unpack_from(body_bytes, offset)
                 metric = prefix_data[0]
                 prefix_length = prefix_data[1]
                 prefix_options = prefix_data[2]
-                body_bytes = body_bytes[8:]
+                offset += 8
 
                 #  Unpacking data with variable length
                 if prefix_length == 0:
                     prefix = 0
                 elif 0 < prefix_length <= 32:
-                    prefix_bytes = body_bytes[:4]
-                    prefix = struct.unpack("> L", prefix_bytes)[0] << 96
-                    body_bytes = body_bytes[4:]
+                    prefix = WORD_STRUCT.unpack_from(body_bytes, offset)[0] << 96
+                    offset += 4
                 elif 32 < prefix_length <= 64:
-                    prefix_bytes = body_bytes[:8]
-                    prefix = struct.unpack("> Q", prefix_bytes)[0] << 64
-                    body_bytes = body_bytes[8:]
+                    prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, offset)[0] << 64
+                    offset += 8
                 elif 64 < prefix_length <= 96:
-                    prefix_bytes = body_bytes[:8]
-                    prefix = struct.unpack("> Q", prefix_bytes)[0] << 64
-                    prefix_bytes = body_bytes[8:12]
-                    prefix += struct.unpack("> L", prefix_bytes)[0]
-                    body_bytes = body_bytes[12:]
+                    prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, offset)[0] << 64
+                    prefix += WORD_STRUCT.unpack_from(body_bytes, offset + 8)[0] << 32
+                    offset += 12
                 else:  # 96 < prefix_length <= 128:
-                    prefix_bytes = body_bytes[:8]
-                    prefix = struct.unpack("> Q", prefix_bytes)[0] << 64
-                    prefix_bytes = body_bytes[8:16]
-                    prefix += struct.unpack("> Q", prefix_bytes)[0]
-                    body_bytes = body_bytes[16:]
+                    prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, offset)[0] << 64
+                    prefix += DOUBLE_WORD_STRUCT.unpack_from(body_bytes, offset + 8)[0]
+                    offset += 16
                 prefix = utils.Utils.decimal_to_ipv6(prefix)
 
                 unpacked_body.add_prefix_info(metric, prefix_length, prefix_options, prefix)
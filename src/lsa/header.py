@@ -14,6 +14,8 @@ This class represents the OSPF LSA header and contains its operations
 #  L - Unsigned long (4 bytes) - struct.pack("> L", 1) -> b'\x00\x00\x00\x01
 OSPFV2_FORMAT_STRING = "> H B B L L L H H"  # Determines the format of the byte object to be created
 OSPFV3_FORMAT_STRING = "> H H L L L H H"
+OSPFV2_STRUCT = struct.Struct(OSPFV2_FORMAT_STRING)  # Format string is compiled once, when the module is loaded
+OSPFV3_STRUCT = struct.Struct(OSPFV3_FORMAT_STRING)
 
 #  Results when determining which of 2 LSA header instances is fresher
 FIRST = 'First'
@@ -22,6 +24,8 @@ BOTH = 'Both'
 
 
 class Header:  # OSPFv2 and OSPFv3 - 20 bytes
+    __slots__ = ('ospf_version', 'ls_age', 'options', 'ls_type', 'link_state_id', 'advertising_router',
+                 'ls_sequence_number', 'ls_checksum', 'length')
 
     def __init__(self, ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number, version):
         if not utils.Utils.is_ipv4_address(link_state_id):
@@ -30,7 +34,22 @@ class Header:  # OSPFv2 and OSPFv3 - 20 bytes
             ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number, version)
         if not is_valid:  # At least one of the parameters failed validation
             raise ValueError(message)
+        self.set_header_fields(ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number, version)
 
+    #  Creates LSA header from fields read from a byte stream, skipping the validation ensured by the stream format
+    @staticmethod
+    def from_wire(ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number, version):
+        is_valid, message = Header.wire_validation(ls_age, ls_type, advertising_router, ls_sequence_number, version)
+        if not is_valid:  # At least one of the fields is invalid regardless of its format
+            raise ValueError(message)
+        header = Header.__new__(Header)
+        header.set_header_fields(
+            ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number, version)
+        return header
+
+    #  Sets header fields without validating them
+    def set_header_fields(self, ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number,
+                          version):
         self.ospf_version = version
         self.ls_age = ls_age  # 2 bytes
         if version == conf.VERSION_IPV4:
@@ -53,18 +72,26 @@ class Header:  # OSPFv2 and OSPFv3 - 20 bytes
         decimal_link_state_id = utils.Utils.ipv4_to_decimal(self.link_state_id)
         decimal_advertising_router = utils.Utils.ipv4_to_decimal(self.advertising_router)
         if self.ospf_version == conf.VERSION_IPV4:
-            return struct.pack(OSPFV2_FORMAT_STRING, self.ls_age, self.options, self.ls_type, decimal_link_state_id,
-                               decimal_advertising_router, self.ls_sequence_number, self.ls_checksum, self.length)
+            return OSPFV2_STRUCT.pack(self.ls_age, self.options, self.ls_type, decimal_link_state_id,
+                                      decimal_advertising_router, self.ls_sequence_number, self.ls_checksum,
+                                      self.length)
         else:
-            return struct.pack(OSPFV3_FORMAT_STRING, self.ls_age, self.ls_type, decimal_link_state_id,
-                               decimal_advertising_router, self.ls_sequence_number, self.ls_checksum, self.length)
+            return OSPFV3_STRUCT.pack(self.ls_age, self.ls_type, decimal_link_state_id, decimal_advertising_router,
+                                      self.ls_sequence_number, self.ls_checksum, self.length)
 
     #  Converts byte object to an OSPF LSA header
     @staticmethod
     def unpack_header(header_bytes, version):
-        format_string = Header.get_format_string(version)
-        header_tuple = struct.unpack(format_string, header_bytes)
+        return Header.get_header_from_tuple(Header.get_struct(version).unpack(header_bytes), version)
 
+    #  Converts OSPF LSA header starting at provided offset of byte object, without copying it
+    @staticmethod
+    def unpack_header_from(header_bytes, offset, version):
+        return Header.get_header_from_tuple(Header.get_struct(version).unpack_from(header_bytes, offset), version)
+
+    #  Creates OSPF LSA header from its unpacked fields
+    @staticmethod
+    def get_header_from_tuple(header_tuple, version):
         ls_age = header_tuple[0]
         if version == conf.VERSION_IPV4:
             options = header_tuple[1]
@@ -74,7 +101,8 @@ class Header:  # OSPFv2 and OSPFv3 - 20 bytes
             ls_sequence_number = header_tuple[5]
             ls_checksum = header_tuple[6]
             length = header_tuple[7]
-            header = Header(ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number, version)
+            header = Header.from_wire(
+                ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number, version)
         else:
             ls_type = header_tuple[1]
             link_state_id = utils.Utils.decimal_to_ipv4(header_tuple[2])
@@ -82,7 +110,8 @@ class Header:  # OSPFv2 and OSPFv3 - 20 bytes
             ls_sequence_number = header_tuple[4]
             ls_checksum = header_tuple[5]
             length = header_tuple[6]
-            header = Header(ls_age, 0, ls_type, link_state_id, advertising_router, ls_sequence_number, version)
+            header = Header.from_wire(
+                ls_age, 0, ls_type, link_state_id, advertising_router, ls_sequence_number, version)
         header.ls_checksum = ls_checksum
         header.length = length
         return header
@@ -91,34 +120,44 @@ class Header:  # OSPFv2 and OSPFv3 - 20 bytes
     def parameter_validation(
             self, ls_age, options, ls_type, link_state_id, advertising_router, ls_sequence_number, version):
         try:
-            if (ls_age < 0) | (ls_age > conf.MAX_AGE):
-                return False, "Invalid LS Age"
             if (version == conf.VERSION_IPV4) & ((options < 0) | (options > conf.MAX_VALUE_8_BITS)):
                 return False, "Invalid options"
-            if (version == conf.VERSION_IPV4) & (
-                    ls_type not in [conf.LSA_TYPE_ROUTER, conf.LSA_TYPE_NETWORK, conf.LSA_TYPE_SUMMARY_TYPE_3,
-                                    conf.LSA_TYPE_SUMMARY_TYPE_4, conf.LSA_TYPE_AS_EXTERNAL, conf.LSA_TYPE_OPAQUE_AS,
-                                    conf.LSA_TYPE_OPAQUE_LINK_LOCAL, conf.LSA_TYPE_OPAQUE_AREA]):
-                return False, "Invalid LS Type"
-            if (version == conf.VERSION_IPV6) & ((ls_type <= 0) | (ls_type > conf.MAX_VALUE_16_BITS)):
+            if (version == conf.VERSION_IPV6) & (ls_type > conf.MAX_VALUE_16_BITS):
                 return False, "Invalid LS Type"
-            s1_s2_bits = Header.get_s1_s2_bits(ls_type)
-            if (version == conf.VERSION_IPV6) & (
-                    s1_s2_bits not in [conf.LINK_LOCAL_SCOPING, conf.AREA_SCOPING, conf.AS_SCOPING]):
-                return False, "Invalid values for S1 and S2 bits"
             if not utils.Utils.is_ipv4_address(link_state_id):
                 return False, "Invalid Link State ID"
-            if (not utils.Utils.is_ipv4_address(advertising_router)) | (advertising_router == '0.0.0.0'):
+            if not utils.Utils.is_ipv4_address(advertising_router):
                 return False, "Invalid Advertising Router"
-            if (ls_sequence_number < 0) | (ls_sequence_number > conf.MAX_VALUE_32_BITS) |\
-                    (ls_sequence_number == 0x80000000):  # Sequence Number 0x80000000 is unused
+            if (ls_sequence_number < 0) | (ls_sequence_number > conf.MAX_VALUE_32_BITS):
                 return False, "Invalid LS Sequence Number"
-            if version not in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
-                return False, "Invalid OSPF version"
-            return True, ''  # No error message to return
+            return Header.wire_validation(ls_age, ls_type, advertising_router, ls_sequence_number, version)
         except (ValueError, TypeError):
             return False, "Invalid parameter type"
 
+    #  Validates header fields that can be invalid even if read from a byte stream with the correct format
+    @staticmethod
+    def wire_validation(ls_age, ls_type, advertising_router, ls_sequence_number, version):
+        if (ls_age < 0) | (ls_age > conf.MAX_AGE):
+            return False, "Invalid LS Age"
+        if (version == conf.VERSION_IPV4) & (
+                ls_type not in [conf.LSA_TYPE_ROUTER, conf.LSA_TYPE_NETWORK, conf.LSA_TYPE_SUMMARY_TYPE_3,
+                                conf.LSA_TYPE_SUMMARY_TYPE_4, conf.LSA_TYPE_AS_EXTERNAL, conf.LSA_TYPE_OPAQUE_AS,
+                                conf.LSA_TYPE_OPAQUE_LINK_LOCAL, conf.LSA_TYPE_OPAQUE_AREA]):
+            return False, "Invalid LS Type"
+        if (version == conf.VERSION_IPV6) & (ls_type <= 0):
+            return False, "Invalid LS Type"
+        s1_s2_bits = Header.get_s1_s2_bits(ls_type)
+        if (version == conf.VERSION_IPV6) & (
+                s1_s2_bits not in [conf.LINK_LOCAL_SCOPING, conf.AREA_SCOPING, conf.AS_SCOPING]):
+            return False, "Invalid values for S1 and S2 bits"
+        if advertising_router == '0.0.0.0':
+            return False, "Invalid Advertising Router"
+        if ls_sequence_number == 0x80000000:  # Sequence Number 0x80000000 is unused
+            return False, "Invalid LS Sequence Number"
+        if version not in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+            return False, "Invalid OSPF version"
+        return True, ''  # No error message to return
+
     #  Gets U-bit value from LS Type value in OSPFv3 LSA header
     @staticmethod
     def get_u_bit(ls_type):
@@ -159,6 +198,15 @@ class Header:  # OSPFv2 and OSPFv3 - 20 bytes
             return OSPFV3_FORMAT_STRING
         else:
             raise ValueError("Invalid OSPF version")
+
+    @staticmethod
+    def get_struct(version):
+        if version == conf.VERSION_IPV4:
+            return OSPFV2_STRUCT
+        elif version == conf.VERSION_IPV6:
+            return OSPFV3_STRUCT
+        else:
+            raise ValueError("Invalid OSPF version")
         
     #  Given 2 instances of LSA headers, states which of them is fresher or if both have same freshness
     @staticmethod
@@ -14,9 +14,13 @@ This class represents the body of an OSPF Inter-Area-Prefix-LSA and contains its
 #  L - Unsigned long (4 bytes) - struct.pack("> L", 1) -> b'\x00\x00\x00\x01
 #  Q - Unsigned long long (8 bytes) - struct.pack("> Q", 1) -> b'\x00\x00\x00\x00\x00\x00\x00\x01
 BASE_FORMAT_STRING = "> L B B H"  # Determines the format of the byte object to be created
+BASE_STRUCT = struct.Struct(BASE_FORMAT_STRING)
+WORD_STRUCT = struct.Struct("> L")  # Parts of address prefix with variable length
+DOUBLE_WORD_STRUCT = struct.Struct("> Q")
 
 
 class InterAreaPrefix(body.Body):  # 8-24 bytes
+    __slots__ = ('metric', 'prefix_length', 'prefix_options', 'address_prefix')
 
     def __init__(self, metric, prefix_length, prefix_options, address_prefix):
         self.metric = metric  # 3 bytes
@@ -26,51 +30,46 @@ class InterAreaPrefix(body.Body):  # 8-24 bytes
 
     #  Creates byte object suitable to be sent and recognized as the body of an OSPF Inter-Area-Prefix-LSA
     def pack_lsa_body(self):
-        body_bytes = struct.pack(BASE_FORMAT_STRING, self.metric, self.prefix_length, self.prefix_options, 0)
+        body_bytes = BASE_STRUCT.pack(self.metric, self.prefix_length, self.prefix_options, 0)
         decimal_prefix = utils.Utils.ipv6_to_decimal(self.address_prefix)
 
         #  Packing data with variable length
         if self.prefix_length == 0:
             prefix_bytes = b''
         elif 0 < self.prefix_length <= 32:
-            prefix_bytes = struct.pack("> L", decimal_prefix >> 96)
+            prefix_bytes = WORD_STRUCT.pack(decimal_prefix >> 96)
         elif 32 < self.prefix_length <= 64:
-            prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
+            prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
         elif 64 < self.prefix_length <= 96:
-            prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
-            prefix_bytes += struct.pack("> L", (decimal_prefix >> 32) & conf.MAX_VALUE_32_BITS)
+            prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
+            prefix_bytes += WORD_STRUCT.pack((decimal_prefix >> 32) & conf.MAX_VALUE_32_BITS)
         else:  # 96 < prefix_length <= 128:
-            prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
-            prefix_bytes += struct.pack("> Q", decimal_prefix & conf.MAX_VALUE_64_BITS)
+            prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
+            prefix_bytes += DOUBLE_WORD_STRUCT.pack(decimal_prefix & conf.MAX_VALUE_64_BITS)
         body_bytes += prefix_bytes
         return body_bytes
 
     #  Converts byte stream to body of an OSPF Inter-Area-Prefix-LSA
     @staticmethod
     def unpack_lsa_body(body_bytes, version):
-        parameters = struct.unpack(BASE_FORMAT_STRING, body_bytes[:8])
+        parameters = BASE_STRUCT.unpack_from(body_bytes, 0)
         metric = parameters[0]
         prefix_length = parameters[1]
         prefix_options = parameters[2]
-        body_bytes = body_bytes[8:]
 
         #  Unpacking data with variable length
         if prefix_length == 0:
             prefix = 0
         elif 0 < prefix_length <= 32:
-            prefix = struct.unpack("> L", body_bytes)[0] << 96
+            prefix = WORD_STRUCT.unpack_from(body_bytes, 8)[0] << 96
         elif 32 < prefix_length <= 64:
-            prefix = struct.unpack("> Q", body_bytes)[0] << 64
+            prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, 8)[0] << 64
         elif 64 < prefix_length <= 96:
-            prefix_bytes = body_bytes[:8]
-            prefix = struct.unpack("> Q", prefix_bytes)[0] << 64
-            prefix_bytes = body_bytes[8:12]
-            prefix += struct.unpack("> L", prefix_bytes)[0]
+            prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, 8)[0] << 64
+            prefix += WORD_STRUCT.unpack_from(body_bytes, 16)[0] << 32
         else:  # 96 < prefix_length <= 128:
-            prefix_bytes = body_bytes[:8]
-            prefix = struct.unpack("> Q", prefix_bytes)[0] << 64
-            prefix_bytes = body_bytes[8:16]
-            prefix += struct.unpack("> Q", prefix_bytes)[0]
+            prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, 8)[0] << 64
+            prefix += DOUBLE_WORD_STRUCT.unpack_from(body_bytes, 16)[0]
         prefix = utils.Utils.decimal_to_ipv6(prefix)
 
         return InterAreaPrefix(metric, prefix_length, prefix_options, prefix)
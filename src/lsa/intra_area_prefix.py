@@ -16,9 +16,15 @@ This class represents the body of an OSPF Intra-Area-Prefix-LSA and contains its
 #  Q - Unsigned long long (8 bytes) - struct.pack("> Q", 1) -> b'\x00\x00\x00\x00\x00\x00\x00\x01
 BASE_FORMAT_STRING = "> H H L L"  # Determines the format of the byte object to be created
 PREFIX_BASE_FORMAT_STRING = "> B B H"
+BASE_STRUCT = struct.Struct(BASE_FORMAT_STRING)
+PREFIX_BASE_STRUCT = struct.Struct(PREFIX_BASE_FORMAT_STRING)
+WORD_STRUCT = struct.Struct("> L")  # Parts of address prefix with variable length
+DOUBLE_WORD_STRUCT = struct.Struct("> Q")
 
 
 class IntraAreaPrefix(body.Body):  # 12 bytes + 4-20 bytes / prefix
+    __slots__ = ('prefix_number', 'referenced_ls_type', 'referenced_link_state_id', 'referenced_advertising_router',
+                 'prefixes')
 
     def __init__(self, referenced_ls_type, referenced_link_state_id, referenced_advertising_router):
         self.prefix_number = 0  # 2 bytes
@@ -48,45 +54,45 @@ class IntraAreaPrefix(body.Body):  # 12 bytes + 4-20 bytes / prefix
     def pack_lsa_body(self):
         decimal_referenced_link_state_id = utils.Utils.ipv4_to_decimal(self.referenced_link_state_id)
         decimal_referenced_advertising_router = utils.Utils.ipv4_to_decimal(self.referenced_advertising_router)
-        body_bytes = struct.pack(BASE_FORMAT_STRING, self.prefix_number, self.referenced_ls_type,
-                                 decimal_referenced_link_state_id, decimal_referenced_advertising_router)
+        body_bytes = [BASE_STRUCT.pack(self.prefix_number, self.referenced_ls_type,
+                                       decimal_referenced_link_state_id, decimal_referenced_advertising_router)]
         for p in self.prefixes:
             prefix_length = p[0]
             prefix_options = p[1]
             metric = p[2]
             decimal_prefix = utils.Utils.ipv6_to_decimal(p[3])
-            prefix_data = struct.pack(PREFIX_BASE_FORMAT_STRING, prefix_length, prefix_options, metric)
-            body_bytes += prefix_data
+            prefix_data = PREFIX_BASE_STRUCT.pack(prefix_length, prefix_options, metric)
+            body_bytes.append(prefix_data)
 
             #  Packing data with variable length
             if prefix_length == 0:
                 prefix_bytes = b''
             elif 0 < prefix_length <= 32:
-                prefix_bytes = struct.pack("> L", decimal_prefix >> 96)
+                prefix_bytes = WORD_STRUCT.pack(decimal_prefix >> 96)
             elif 32 < prefix_length <= 64:
-                prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
+                prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
             elif 64 < prefix_length <= 96:
-                prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
-                prefix_bytes += struct.pack("> L", (decimal_prefix >> 32) & conf.MAX_VALUE_32_BITS)
+                prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
+                prefix_bytes += WORD_STRUCT.pack((decimal_prefix >> 32) & conf.MAX_VALUE_32_BITS)
             else:  # 96 < prefix_length <= 128:
-                prefix_bytes = struct.pack("> Q", decimal_prefix >> 64)
-                prefix_bytes += struct.pack("> Q", decimal_prefix & conf.MAX_VALUE_64_BITS)
-            body_bytes += prefix_bytes
-        return body_bytes
+                prefix_bytes = DOUBLE_WORD_STRUCT.pack(decimal_prefix >> 64)
+                prefix_bytes += DOUBLE_WORD_STRUCT.pack(decimal_prefix & conf.MAX_VALUE_64_BITS)
+            body_bytes.append(prefix_bytes)
+        return b''.join(body_bytes)
 
     #  Converts byte stream to body of an OSPF Intra-Area-Prefix-LSA
     @staticmethod
     def unpack_lsa_body(body_bytes, version):
-        first_fields = struct.unpack(BASE_FORMAT_STRING, body_bytes[:12])
+        first_fields = BASE_STRUCT.unpack_from(body_bytes, 0)
         prefix_number = first_fields[0]
         referenced_ls_type = first_fields[1]
         referenced_link_state_id = utils.Utils.decimal_to_ipv4(first_fields[2])
         referenced_advertising_router = utils.Utils.decimal_to_ipv4(first_fields[3])
         unpacked_body = IntraAreaPrefix(referenced_ls_type, referenced_link_state_id, referenced_advertising_router)
-        body_bytes = body_bytes[12:]
+        offset = 12  # Fields are read in place from the byte stream, without slicing it
 
         for i in range(prefix_number):
-            prefix_fields = struct.unpack(PREFIX_BASE_FORMAT_STRING, body_bytes[:4])
+            prefix_fields = PREFIX_BASE_STRUCT.unpack_from(body_bytes, offset)
             prefix_length = prefix_fields[0]
             prefix_options = prefix_fields[1]
             metric = prefix_fields[2]
@@ -94,27 +100,21 @@ class IntraAreaPrefix(body.Body):  # 12 bytes + 4-20 bytes / prefix
             #  Unpacking data with variable length
             if prefix_length == 0:
                 prefix = 0
-                body_bytes = body_bytes[4:]
+                offset += 4
             elif 0 < prefix_length <= 32:
-                prefix_bytes = body_bytes[4:8]
-                prefix = struct.unpack("> L", prefix_bytes)[0] << 96
-                body_bytes = body_bytes[8:]
+                prefix = WORD_STRUCT.unpack_from(body_bytes, offset + 4)[0] << 96
+                offset += 8
             elif 32 < prefix_length <= 64:
-                prefix_bytes = body_bytes[4:12]
-                prefix = struct.unpack("> Q", prefix_bytes)[0] << 64
-                body_bytes = body_bytes[12:]
+                prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, offset + 4)[0] << 64
+                offset += 12
             elif 64 < prefix_length <= 96:
-                prefix_bytes = body_bytes[4:12]
-                prefix = struct.unpack("> Q", prefix_bytes)[0] << 64
-                prefix_bytes = body_bytes[12:16]
-                prefix += struct.unpack("> L", prefix_bytes)[0]
-                body_bytes = body_bytes[16:]
+                prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, offset + 4)[0] << 64
+                prefix += WORD_STRUCT.unpack_from(body_bytes, offset + 12)[0] << 32
+                offset += 16
             else:  # 96 < prefix_length <= 128:
-                prefix_bytes = body_bytes[4:12]
-                prefix = struct.unpack("> Q", prefix_bytes)[0] << 64
-                prefix_bytes = body_bytes[12:20]
-                prefix += struct.unpack("> Q", prefix_bytes)[0]
-                body_bytes = body_bytes[20:]
+                prefix = DOUBLE_WORD_STRUCT.unpack_from(body_bytes, offset + 4)[0] << 64
+                prefix += DOUBLE_WORD_STRUCT.unpack_from(body_bytes, offset + 12)[0]
+                offset += 20
             prefix = utils.Utils.decimal_to_ipv6(prefix)
 
             unpacked_body.add_prefix_info(prefix_length, prefix_options, metric, prefix)
@@ -1,5 +1,6 @@
 import struct
 import time
+import contextlib
 
 import lsa.header as header
 import lsa.router as router
@@ -17,15 +18,42 @@ import general.utils as utils
 This class serves as an interface to LSA creation, storage and manipulation, both for OSPFv2 and OSPFv3
 '''
 
+MAX_VERIFIED_CHECKSUMS = 10000  # Implementation-specific - Cache is cleared when this number of LSAs is reached
+
 
 class Lsa:
+    #  Attributes are kept without a dictionary per instance, reducing the memory used by large LSDBs
+    __slots__ = ('header', 'decoded_body', 'body_bytes', 'body_class', 'system_time', 'installation_time', 'edit_depth')
+    #  LS Type, Link State ID, Advertising Router, LS Sequence Number, LS Checksum and Length of LSAs with valid checksum
+    verified_checksums = set()
 
     def __init__(self):
         self.header = None
-        self.body = None
+        self.decoded_body = None
+        self.body_bytes = None  # Byte stream of received LSA body, until it is decoded
+        self.body_class = None  # Class of received LSA body, until it is decoded
 
         self.system_time = time.perf_counter()  # Current system time in seconds
         self.installation_time = time.perf_counter()  # Time of installation in LSDB
+        self.edit_depth = 0  # Number of open edit blocks - LSA length and checksum are set when last one is closed
+
+    #  LSA body - Body of received LSA is only decoded when it is first accessed
+    @property
+    def body(self):
+        if self.body_bytes is not None:
+            try:
+                self.decoded_body = self.body_class.unpack_lsa_body(self.body_bytes, self.header.ospf_version)
+            except (ValueError, IndexError, struct.error):
+                self.decoded_body = None  # Invalid LSA body is discarded
+            self.body_bytes = None
+            self.body_class = None
+        return self.decoded_body
+
+    @body.setter
+    def body(self, new_body):
+        self.decoded_body = new_body
+        self.body_bytes = None
+        self.body_class = None
 
     #  #  #  #  #  #  #
     #  Main methods  #
@@ -64,13 +92,23 @@ class Lsa:
     def pack_lsa(self):
         if self.header is None:
             raise ValueError("LSA header is not set")
-        if self.body is None:
+        if not self.has_body():
             raise ValueError("LSA body is not set")
 
         header_bytes = self.header.pack_header()
-        body_bytes = self.body.pack_lsa_body()
+        body_bytes = self.pack_lsa_body()
         return header_bytes + body_bytes
 
+    #  Converts an OSPF LSA body into a byte stream - Byte stream of received LSA body is returned if not yet decoded
+    def pack_lsa_body(self):
+        if self.body_bytes is not None:
+            return self.body_bytes
+        return self.body.pack_lsa_body()
+
+    #  Returns True if LSA has a body, without decoding it
+    def has_body(self):
+        return (self.body_bytes is not None) | (self.decoded_body is not None)
+
     #  Converts an OSPF LSA header into a byte stream
     def pack_header(self):
         if self.header is None:
@@ -79,9 +117,10 @@ class Lsa:
         return header_bytes
 
     #  Converts a byte stream into an OSPF LSA
+    #  Only the LSA header is decoded - LSA body is kept as a byte stream until it is accessed
     @staticmethod
     def unpack_lsa(lsa_bytes, lsa_version):
-        lsa_type = Lsa.get_lsa_type_from_bytes(lsa_bytes)
+        lsa_bytes = memoryview(lsa_bytes)
 
         #  An OSPF LSA just with a header, or with less bytes, can immediately be discarded
         if len(lsa_bytes) <= conf.LSA_HEADER_LENGTH:
@@ -89,39 +128,41 @@ class Lsa:
 
         lsa = Lsa()
         header_bytes = lsa_bytes[:conf.LSA_HEADER_LENGTH]
-        body_bytes = lsa_bytes[conf.LSA_HEADER_LENGTH:]
-
-        #  Creates the header and the body of the LSA from their byte streams
         lsa.header = header.Header.unpack_header(header_bytes, lsa_version)
+        body_class = Lsa.get_lsa_body_class(lsa_bytes, lsa_version)
+        if body_class is not None:  # Body of LSA with unknown type is not kept
+            lsa.body_bytes = bytes(lsa_bytes[conf.LSA_HEADER_LENGTH:])  # Received byte stream may be reused
+            lsa.body_class = body_class
+        return lsa
+
+    #  Given a LSA byte stream, returns the class of its body, or None if LSA type is not known
+    @staticmethod
+    def get_lsa_body_class(lsa_bytes, lsa_version):
+        lsa_type = Lsa.get_lsa_type_from_bytes(lsa_bytes)
         if lsa_type == conf.LSA_TYPE_ROUTER:
-            lsa.body = router.Router.unpack_lsa_body(body_bytes, lsa_version)
+            return router.Router
         elif lsa_type == conf.LSA_TYPE_NETWORK:
-            lsa.body = network.Network.unpack_lsa_body(body_bytes, lsa_version)
+            return network.Network
         elif (lsa_type == conf.LSA_TYPE_INTRA_AREA_PREFIX) & (lsa_version == conf.VERSION_IPV6):
-            lsa.body = intra_area_prefix.IntraAreaPrefix.unpack_lsa_body(body_bytes, 0)
+            return intra_area_prefix.IntraAreaPrefix
         elif (lsa_type == conf.LSA_TYPE_LINK) & (lsa_version == conf.VERSION_IPV6):
-            lsa.body = link.Link.unpack_lsa_body(body_bytes, 0)
+            return link.Link
         elif (lsa_type in [conf.LSA_TYPE_SUMMARY_TYPE_3, conf.LSA_TYPE_SUMMARY_TYPE_4]) & (
                 lsa_version == conf.VERSION_IPV4):
-            lsa.body = summary.Summary.unpack_lsa_body(body_bytes, 0)
+            return summary.Summary
         elif (lsa_type == conf.LSA_TYPE_INTER_AREA_PREFIX) & (lsa_version == conf.VERSION_IPV6):
-            lsa.body = inter_area_prefix.InterAreaPrefix.unpack_lsa_body(body_bytes, 0)
+            return inter_area_prefix.InterAreaPrefix
         elif (lsa_type == conf.LSA_TYPE_OPAQUE_AS) & (lsa_version == conf.VERSION_IPV4):
             opaque_type = Lsa.get_opaque_type_from_bytes(lsa_bytes)
             if opaque_type == conf.OPAQUE_TYPE_ABR_LSA:
-                lsa.body = extension_abr.ExtensionAbr.unpack_lsa_body(body_bytes, 0)
+                return extension_abr.ExtensionAbr
             elif opaque_type == conf.OPAQUE_TYPE_PREFIX_LSA:
-                lsa.body = extension_prefix.ExtensionPrefix.unpack_lsa_body(body_bytes, lsa_version)
-            else:
-                pass
+                return extension_prefix.ExtensionPrefix
         elif (lsa_type == conf.LSA_TYPE_EXTENSION_ABR_LSA) & (lsa_version == conf.VERSION_IPV6):
-            lsa.body = extension_abr.ExtensionAbr.unpack_lsa_body(body_bytes, 0)
+            return extension_abr.ExtensionAbr
         elif (lsa_type == conf.LSA_TYPE_EXTENSION_PREFIX_LSA) & (lsa_version == conf.VERSION_IPV6):
-            lsa.body = extension_prefix.ExtensionPrefix.unpack_lsa_body(body_bytes, lsa_version)
-        else:
-            pass
-
-        return lsa
+            return extension_prefix.ExtensionPrefix
+        return None
 
     #  Converts a byte stream into an OSPF LSA header
     @staticmethod
@@ -129,7 +170,7 @@ class Lsa:
         if len(lsa_bytes) < conf.LSA_HEADER_LENGTH:
             raise ValueError("LSA byte stream is too short")
         lsa = Lsa()
-        header_bytes = lsa_bytes[:conf.LSA_HEADER_LENGTH]
+        header_bytes = memoryview(lsa_bytes)[:conf.LSA_HEADER_LENGTH]
         lsa.header = header.Header.unpack_header(header_bytes, lsa_version)
         return lsa
 
@@ -138,20 +179,17 @@ class Lsa:
     #  Adds an OSPF Router-LSA body to the LSA with the provided arguments
     def create_router_lsa_body(self, bit_v, bit_e, bit_b, options, version):
         self.body = router.Router(bit_v, bit_e, bit_b, options, version)
-        self.set_lsa_length()  # LSA length must be set after body is created and before checksum is computed
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Adds data for one link (interface) to the OSPFv2 Router-LSA body
     def add_link_info_v2(self, link_id, link_data, link_type, tos_number, metric):
         self.body.add_link_info_v2(link_id, link_data, link_type, tos_number, metric)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Adds data for one link (interface) to the OSPFv3 Router-LSA body
     def add_link_info_v3(self, link_type, metric, interface_id, neighbor_interface_id, neighbor_router_id):
         self.body.add_link_info_v3(link_type, metric, interface_id, neighbor_interface_id, neighbor_router_id)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     def has_link_info_v2(self, link_id, link_data, link_type, tos_number, metric):
         return [link_id, link_data, link_type, tos_number, metric] in self.body.links
@@ -162,38 +200,32 @@ class Lsa:
     #  Deletes all link information produced by provided interface in Router-LSA
     def delete_interface_link_info(self, interface_ip, subnet_ip, interface_id):
         self.body.delete_interface_link_info(interface_ip, subnet_ip, interface_id)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Deletes data for one link from the OSPFv2 LSA body
     def delete_link_info_v2(self, link_id, link_data, link_type, tos_number, metric):
         self.body.delete_link_info_v2(link_id, link_data, link_type, tos_number, metric)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Deletes data for one link from the OSPFv3 LSA body
     def delete_link_info_v3(self, link_type, metric, interface_id, neighbor_interface_id, neighbor_router_id):
         self.body.delete_link_info_v3(link_type, metric, interface_id, neighbor_interface_id, neighbor_router_id)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Network-LSA
 
     #  Adds an OSPF Network-LSA body to the LSA with the provided arguments
     def create_network_lsa_body(self, network_mask, options, attached_routers, version):
         self.body = network.Network(network_mask, options, attached_routers, version)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     def add_attached_router(self, router_id):
         self.body.add_attached_router(router_id)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     def delete_attached_router(self, router_id):
         self.body.delete_attached_router(router_id)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Intra-Area-Prefix-LSA and Link-LSA
 
@@ -205,15 +237,13 @@ class Lsa:
             referenced_ls_type += 0x2000
         self.body = intra_area_prefix.IntraAreaPrefix(
             referenced_ls_type, referenced_link_state_id, referenced_advertising_router)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Adds an OSPF Link-LSA body to the LSA with the provided arguments
     def create_link_lsa_body(self, router_priority, options, link_local_address):
         self.body = link.Link(router_priority, options, link_local_address)
         #  Link-LSAs have link local scope - LS Type field remains unchanged
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Adds data for one prefix to the Intra-Area-Prefix-LSA and Link-LSA bodies
     def add_prefix_info(self, prefix_length, prefix_options, metric, prefix, lsa_type):
@@ -223,8 +253,7 @@ class Lsa:
             self.body.add_prefix_info(prefix_length, prefix_options, prefix)
         else:
             raise ValueError("LSA Type must be Intra-Area-Prefix or Link for this method")
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     def has_prefix_info(self, prefix_length, prefix_options, metric, prefix, lsa_type):
         if lsa_type == conf.LSA_TYPE_INTRA_AREA_PREFIX:
@@ -242,38 +271,33 @@ class Lsa:
             self.body.delete_prefix_info(prefix_length, prefix_options, prefix)
         else:
             raise ValueError("LSA Type must be Intra-Area-Prefix or Link for this method")
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Summary-LSA
 
     #  Adds an OSPFv2 Summary-LSA body to the LSA with the provided arguments
     def create_summary_lsa_body(self, network_mask, metric):
         self.body = summary.Summary(network_mask, metric)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Inter-Area-Prefix-LSA
 
     #  Adds an OSPF Inter-Area-Prefix-LSA body to the LSA with the provided arguments
     def create_inter_area_prefix_lsa_body(self, metric, prefix_length, prefix_options, address_prefix):
         self.body = inter_area_prefix.InterAreaPrefix(metric, prefix_length, prefix_options, address_prefix)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  ABR-LSA of the OSPF extension
 
     #  Adds a ABR-LSA body to the LSA with the provided arguments
     def create_extension_abr_lsa_body(self):
         self.body = extension_abr.ExtensionAbr()
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Adds data for one ABR to the ABR-LSA body
     def add_abr_info(self, metric, neighbor_router_id):
         self.body.add_abr_info(metric, neighbor_router_id)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     def has_abr_info(self, neighbor_router_id):
         return self.body.has_abr_info(neighbor_router_id)
@@ -284,28 +308,24 @@ class Lsa:
     #  Deletes data for one ABR from the ABR-LSA body
     def delete_abr_info(self, neighbor_router_id):
         self.body.delete_abr_info(neighbor_router_id)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Prefix-LSA of the OSPF extension
 
     #  Adds a Prefix-LSA body to the LSA with the provided arguments
     def create_extension_prefix_lsa_body(self, version):
         self.body = extension_prefix.ExtensionPrefix(version)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Adds data for one subnet to the OSPFv2 Prefix-LSA body
     def add_subnet_info(self, metric, subnet_mask, subnet_address):
         self.body.add_subnet_info(metric, subnet_mask, subnet_address)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Adds data for one prefix to the OSPFv3 Prefix-LSA body
     def add_prefix_info_extension(self, metric, prefix_length, prefix_options, address_prefix):
         self.body.add_prefix_info(metric, prefix_length, prefix_options, address_prefix)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     def has_subnet_info(self, subnet_mask, subnet_address):
         return self.body.has_subnet_info(subnet_mask, subnet_address)
@@ -322,57 +342,89 @@ class Lsa:
     #  Deletes data for one subnet from the OSPFv2 Prefix-LSA body
     def delete_subnet_info(self, subnet_mask, subnet_address):
         self.body.delete_subnet_info(subnet_mask, subnet_address)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
 
     #  Deletes data for one prefix from the OSPFv3 Prefix-LSA body
     def delete_prefix_info_extension(self, prefix_length, address_prefix):
         self.body.delete_prefix_info_extension(prefix_length, address_prefix)
-        self.set_lsa_length()
-        self.set_lsa_checksum()
+        self.finalize_lsa()
+
+    #  Edit block - Changes made to the LSA inside it set its length and checksum only once, when it is closed
+    #  with lsa_instance.edit():
+    #      lsa_instance.add_link_info_v2(...)
+    #      ...
+    @contextlib.contextmanager
+    def edit(self):
+        self.edit_depth += 1
+        try:
+            yield self
+        finally:
+            self.edit_depth -= 1
+            self.finalize_lsa()
 
     #  #  #  #  #  #  #  #
     #  Auxiliary methods  #
     #  #  #  #  #  #  #  #
 
+    #  Sets LSA length and checksum according to current LSA body, unless LSA is being edited
+    #  LSA body is packed only once for both calculations
+    def finalize_lsa(self):
+        if (not self.has_body()) | (self.edit_depth > 0):
+            return
+        body_bytes = self.pack_lsa_body()
+        self.header.length = conf.LSA_HEADER_LENGTH + len(body_bytes)
+        self.header.ls_checksum = 0
+        header_bytes = self.header.pack_header()[2:]  # Without the LS Age field
+        self.header.ls_checksum = utils.Utils.create_fletcher_checksum(header_bytes + body_bytes)
+
     #  Calculates LSA checksum and inserts it on LSA header
     def set_lsa_checksum(self):
-        if self.body is not None:  # Does nothing if there is no LSA body
+        if self.has_body():  # Does nothing if there is no LSA body
             self.header.ls_checksum = 0
 
             #  Calculates and sets LSA checksum
             header_bytes = self.header.pack_header()[2:]  # Without the LS Age field
-            body_bytes = self.body.pack_lsa_body()
+            body_bytes = self.pack_lsa_body()
             self.header.ls_checksum = utils.Utils.create_fletcher_checksum(header_bytes + body_bytes)
 
     #  Returns True if LSA checksum is valid
-    def is_lsa_checksum_valid(self):
-        if self.body is None:
+    #  If cache is used, checksum of retransmitted and duplicate received LSA instances is not calculated again
+    def is_lsa_checksum_valid(self, use_cache=False):
+        if not self.has_body():
             return False
+        checksum_key = (self.header.ls_type, self.header.link_state_id, self.header.advertising_router,
+                        self.header.ls_sequence_number, self.header.ls_checksum, self.header.length)
+        if use_cache & (checksum_key in Lsa.verified_checksums):
+            return True
         header_bytes = self.header.pack_header()[2:]  # Without the LS Age field
-        body_bytes = self.body.pack_lsa_body()
+        body_bytes = self.pack_lsa_body()
         checksum = utils.Utils.create_fletcher_checksum(header_bytes + body_bytes)
-        return checksum == 0  # Checksum of LSA with valid checksum will always be 0
+        if checksum != 0:  # Checksum of LSA with valid checksum will always be 0
+            return False
+        if not use_cache:
+            return True
+        if len(Lsa.verified_checksums) >= MAX_VERIFIED_CHECKSUMS:
+            Lsa.verified_checksums.clear()
+        Lsa.verified_checksums.add(checksum_key)
+        return True
 
     #  Calculates LSA length and inserts it on given LSA header
     def set_lsa_length(self):
-        if self.body is not None:
+        if self.has_body():
             header_bytes = self.header.pack_header()
-            body_bytes = self.body.pack_lsa_body()
+            body_bytes = self.pack_lsa_body()
             self.header.length = len(header_bytes + body_bytes)
 
     #  Given a LSA byte stream, returns its OSPF LSA type
     @staticmethod
     def get_lsa_type_from_bytes(lsa_bytes):
-        lsa_type_byte = lsa_bytes[3:4]  # Forth byte of OSPF LSA is always its type
-        lsa_type = struct.unpack("> B", lsa_type_byte)[0]
+        lsa_type = struct.unpack_from("> B", lsa_bytes, 3)[0]  # Forth byte of OSPF LSA is always its type
         return lsa_type
 
     #  Given a Opaque-LSA byte stream, returns its OSPF Opaque Type
     @staticmethod
     def get_opaque_type_from_bytes(lsa_bytes):
-        opaque_type_byte = lsa_bytes[4:5]  # Fifth byte of OSPFv2 Opaque-LSA is always its Opaque Type
-        opaque_type = struct.unpack("> B", opaque_type_byte)[0]
+        opaque_type = struct.unpack_from("> B", lsa_bytes, 4)[0]  # Fifth byte of OSPFv2 Opaque-LSA is its Opaque Type
         return opaque_type
 
     #  Returns OSPF Opaque Type of current LSA
@@ -422,11 +474,10 @@ class Lsa:
     def is_lsa_self_originated(self, router_id):
         return router_id == self.header.advertising_router
 
-    # Given a bite stream with LSAs, returns the length of the first LSA
+    # Given a bite stream with LSAs, returns the length of the LSA starting at the provided offset
     @staticmethod
-    def get_lsa_length(lsa_bytes):
-        lsa_length_byte = lsa_bytes[18:20]  # 19th and 20th bytes of OSPF LSA are always its length
-        lsa_length = struct.unpack("> H", lsa_length_byte)[0]
+    def get_lsa_length(lsa_bytes, offset=0):
+        lsa_length = struct.unpack_from("> H", lsa_bytes, offset + 18)[0]  # 19th and 20th bytes of LSA are its length
         return lsa_length
 
     #  Given 2 instances of LSAs, states which of them is fresher or if both have same freshness
@@ -11,9 +11,11 @@ This class represents the body of an OSPF Network-LSA and contains its operation
 #  > - Big-endian
 #  L - Unsigned long (4 bytes) - struct.pack("> L", 1) -> b'\x00\x00\x00\x01
 FORMAT_STRING = "> L"
+STRUCT = struct.Struct(FORMAT_STRING)
 
 
 class Network(body.Body):  # OSPFv2 and OSPFv3 - 4 bytes + 4 bytes / link
+    __slots__ = ('network_mask', 'options', 'attached_routers', 'version')
 
     def __init__(self, network_mask, options, attached_routers, version):
         self.network_mask = network_mask  # 4 bytes - Only for OSPFv2
@@ -33,23 +35,23 @@ class Network(body.Body):  # OSPFv2 and OSPFv3 - 4 bytes + 4 bytes / link
     def pack_lsa_body(self):
         if self.version == conf.VERSION_IPV4:
             decimal_network_mask = utils.Utils.ipv4_to_decimal(self.network_mask)
-            body_bytes = struct.pack(FORMAT_STRING, decimal_network_mask)
+            body_bytes = [STRUCT.pack(decimal_network_mask)]
         else:
-            body_bytes = struct.pack(FORMAT_STRING, self.options)
+            body_bytes = [STRUCT.pack(self.options)]
         for r in self.attached_routers:
-            body_bytes += struct.pack(FORMAT_STRING, utils.Utils.ipv4_to_decimal(r))
-        return body_bytes
+            body_bytes.append(STRUCT.pack(utils.Utils.ipv4_to_decimal(r)))
+        return b''.join(body_bytes)
 
     #  Converts byte stream to body of an OSPF Network-LSA
     @staticmethod
     def unpack_lsa_body(body_bytes, version):
-        first_field = struct.unpack(FORMAT_STRING, body_bytes[:4])[0]
+        first_field = STRUCT.unpack_from(body_bytes, 0)[0]
         if version == conf.VERSION_IPV4:
             first_field = utils.Utils.decimal_to_ipv4(first_field)
         attached_routers = []
-        for i in range(len(body_bytes[4:]) // 4):
-            attached_router_ip = struct.unpack(FORMAT_STRING, body_bytes[4*i+4:4*(i+1)+4])[0]
-            attached_routers.append(utils.Utils.decimal_to_ipv4(attached_router_ip))
+        router_bytes = memoryview(body_bytes)[4:len(body_bytes) - len(body_bytes) % 4]
+        for router_tuple in STRUCT.iter_unpack(router_bytes):
+            attached_routers.append(utils.Utils.decimal_to_ipv4(router_tuple[0]))
         if version == conf.VERSION_IPV4:
             return Network(first_field, 0, attached_routers, conf.VERSION_IPV4)
         else:
@@ -15,9 +15,13 @@ This class represents the body of an OSPF Router-LSA and contains its operations
 BASE_FORMAT_STRING = "> L"  # Determines the format of the byte object to be created
 OSPFV2_LINK_FORMAT_STRING = "> L L B B H"
 OSPFV3_LINK_FORMAT_STRING = "> L L L L"
+BASE_STRUCT = struct.Struct(BASE_FORMAT_STRING)
+OSPFV2_LINK_STRUCT = struct.Struct(OSPFV2_LINK_FORMAT_STRING)
+OSPFV3_LINK_STRUCT = struct.Struct(OSPFV3_LINK_FORMAT_STRING)
 
 
 class Router(body.Body):  # OSPFv2 - 4 bytes + 12 bytes / link; OSPFv3 - 4 bytes + 16 bytes / link
+    __slots__ = ('bit_v', 'bit_e', 'bit_b', 'link_number', 'options', 'links', 'version')
 
     def __init__(self, bit_v, bit_e, bit_b, options, version):
         self.bit_v = bool(bit_v)  # Virtual link endpoint bit
@@ -75,39 +79,39 @@ class Router(body.Body):  # OSPFv2 - 4 bytes + 12 bytes / link; OSPFv3 - 4 bytes
             flags_byte << 1
 
         if self.version == conf.VERSION_IPV4:
-            body_bytes = struct.pack(BASE_FORMAT_STRING, (flags_byte << 3 * conf.BYTE_SIZE) + self.link_number)
+            body_parts = [BASE_STRUCT.pack((flags_byte << 3 * conf.BYTE_SIZE) + self.link_number)]
             for link in self.links:
                 decimal_link_id = utils.Utils.ipv4_to_decimal(link[0])
                 decimal_link_data = utils.Utils.ipv4_to_decimal(link[1])
                 link_type = link[2]
                 tos_number = link[3]
                 metric = link[4]
-                body_bytes += struct.pack(
-                    OSPFV2_LINK_FORMAT_STRING, decimal_link_id, decimal_link_data, link_type, tos_number, metric)
+                body_parts.append(OSPFV2_LINK_STRUCT.pack(
+                    decimal_link_id, decimal_link_data, link_type, tos_number, metric))
         else:
-            body_bytes = struct.pack(BASE_FORMAT_STRING, (flags_byte << 3 * conf.BYTE_SIZE) + self.options)
+            body_parts = [BASE_STRUCT.pack((flags_byte << 3 * conf.BYTE_SIZE) + self.options)]
             for link in self.links:
                 link_type = link[0]
                 metric = link[1]
                 interface_id = link[2]
                 neighbor_interface_id = link[3]
                 decimal_neighbor_router_id = utils.Utils.ipv4_to_decimal(link[4])
-                body_bytes += struct.pack(OSPFV3_LINK_FORMAT_STRING, (link_type << 3 * conf.BYTE_SIZE) + metric,
-                                          interface_id, neighbor_interface_id, decimal_neighbor_router_id)
-        return body_bytes
+                body_parts.append(OSPFV3_LINK_STRUCT.pack((link_type << 3 * conf.BYTE_SIZE) + metric, interface_id,
+                                                          neighbor_interface_id, decimal_neighbor_router_id))
+        return b''.join(body_parts)
 
     #  Converts byte stream to body of an OSPF Router-LSA
     @staticmethod
     def unpack_lsa_body(body_bytes, version):
-        body_tuple = struct.unpack(BASE_FORMAT_STRING, body_bytes[:4])
+        body_tuple = BASE_STRUCT.unpack_from(body_bytes, 0)
         flags_byte = body_tuple[0] >> 3 * conf.BYTE_SIZE
         bit_v = (flags_byte >> 2) & 1
         bit_e = (flags_byte >> 1) & 1
         bit_b = flags_byte & 1
         if version == conf.VERSION_IPV4:
             unpacked_body = Router(bit_v, bit_e, bit_b, 0, conf.VERSION_IPV4)
-            for i in range(len(body_bytes[4:]) // 12):
-                body_tuple = struct.unpack(OSPFV2_LINK_FORMAT_STRING, body_bytes[12*i+4:12*(i+1)+4])
+            link_bytes = Router.get_link_bytes(body_bytes, OSPFV2_LINK_STRUCT.size)
+            for body_tuple in OSPFV2_LINK_STRUCT.iter_unpack(link_bytes):
                 link_id = utils.Utils.decimal_to_ipv4(body_tuple[0])
                 link_data = utils.Utils.decimal_to_ipv4(body_tuple[1])
                 link_type = body_tuple[2]
@@ -117,8 +121,8 @@ class Router(body.Body):  # OSPFv2 - 4 bytes + 12 bytes / link; OSPFv3 - 4 bytes
         else:
             options = body_tuple[0] & conf.MAX_VALUE_24_BITS
             unpacked_body = Router(bit_v, bit_e, bit_b, options, conf.VERSION_IPV6)
-            for i in range(len(body_bytes[4:]) // 16):
-                body_tuple = struct.unpack(OSPFV3_LINK_FORMAT_STRING, body_bytes[16*i+4:16*(i+1)+4])
+            link_bytes = Router.get_link_bytes(body_bytes, OSPFV3_LINK_STRUCT.size)
+            for body_tuple in OSPFV3_LINK_STRUCT.iter_unpack(link_bytes):
                 link_type = body_tuple[0] >> 3 * conf.BYTE_SIZE
                 metric = body_tuple[0] & conf.MAX_VALUE_16_BITS
                 interface_id = body_tuple[1]
@@ -128,6 +132,12 @@ class Router(body.Body):  # OSPFv2 - 4 bytes + 12 bytes / link; OSPFv3 - 4 bytes
                     link_type, metric, interface_id, neighbor_interface_id, neighbor_router_id)
         return unpacked_body
 
+    #  Returns view of the links in the LSA body, without copying it - Incomplete links at the end are left out
+    @staticmethod
+    def get_link_bytes(body_bytes, link_length):
+        link_number = (len(body_bytes) - BASE_STRUCT.size) // link_length
+        return memoryview(body_bytes)[BASE_STRUCT.size:BASE_STRUCT.size + link_number * link_length]
+
     #  Validates constructor parameters - Returns error message in case of failed validation
     @staticmethod
     def parameter_validation(version):
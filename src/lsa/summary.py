@@ -12,9 +12,11 @@ LSA structure is the same for both Type 3 Summary-LSA (Network-Summary) and Type
 #  > - Big-endian
 #  L - Unsigned long (4 bytes) - struct.pack("> L", 1) -> b'\x00\x00\x00\x01
 FORMAT_STRING = "> L L"  # Determines the format of the byte object to be created
+STRUCT = struct.Struct(FORMAT_STRING)
 
 
 class Summary(body.Body):  # 8 bytes
+    __slots__ = ('network_mask', 'metric')
 
     def __init__(self, network_mask, metric):
         is_valid, message = self.parameter_validation(network_mask, metric)
@@ -26,13 +28,14 @@ class Summary(body.Body):  # 8 bytes
 
     #  Creates byte object suitable to be sent and recognized as the body of an OSPFv2 Summary-LSA
     def pack_lsa_body(self):
-        return struct.pack(FORMAT_STRING, utils.Utils.ipv4_to_decimal(self.network_mask), self.metric)
+        return STRUCT.pack(utils.Utils.ipv4_to_decimal(self.network_mask), self.metric)
 
     #  Converts byte stream to body of an OSPFv2 Summary-LSA
     @staticmethod
     def unpack_lsa_body(body_bytes, version):
-        network_mask = utils.Utils.decimal_to_ipv4(struct.unpack(FORMAT_STRING, body_bytes)[0])
-        metric = struct.unpack(FORMAT_STRING, body_bytes)[1]
+        body_tuple = STRUCT.unpack(body_bytes)
+        network_mask = utils.Utils.decimal_to_ipv4(body_tuple[0])
+        metric = body_tuple[1]
         return Summary(network_mask, metric)
 
     #  Validates constructor parameters - Returns error message in case of failed validation
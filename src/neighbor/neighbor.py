@@ -16,13 +16,33 @@ LS_UPDATE = "LS Update"
 
 
 class Neighbor:
+    __slots__ = ('neighbor_id', 'neighbor_priority', 'neighbor_interface_id', 'neighbor_ip_address', 'neighbor_options',
+                 'neighbor_state', 'neighbor_dr', 'neighbor_bdr', 'master_slave', 'dd_sequence', 'last_dd_packet',
+                 'ls_retransmission_list', 'db_summary_list', 'ls_request_list', 'inactivity_timeout',
+                 'last_sent_dd_description_packet', 'router_id', 'inactivity_timer', 'dd_packet_retransmit_timer',
+                 'dd_packet_retransmit_timeout', 'ls_request_retransmit_timer', 'ls_request_retransmit_timeout',
+                 'ls_update_retransmit_timer', 'ls_update_retransmit_timeout')
 
     def __init__(self, neighbor_id, neighbor_priority, neighbor_interface_id, neighbor_ip_address, neighbor_options,
-                 neighbor_dr, neighbor_bdr, router_id):
+                 neighbor_dr, neighbor_bdr, router_id, router_dead_interval=conf.ROUTER_DEAD_INTERVAL):
         is_valid, message = self.parameter_validation(neighbor_id, neighbor_options)
         if not is_valid:  # At least one of the parameters failed validation
             raise ValueError(message)
+        self.initialize_neighbor(neighbor_id, neighbor_priority, neighbor_interface_id, neighbor_ip_address,
+                                 neighbor_options, neighbor_dr, neighbor_bdr, router_id, router_dead_interval)
 
+    #  Creates neighbor from trusted values, such as the ones of an already unpacked Hello packet, skipping validation
+    @staticmethod
+    def create_unchecked(neighbor_id, neighbor_priority, neighbor_interface_id, neighbor_ip_address, neighbor_options,
+                         neighbor_dr, neighbor_bdr, router_id, router_dead_interval=conf.ROUTER_DEAD_INTERVAL):
+        new_neighbor = Neighbor.__new__(Neighbor)
+        new_neighbor.initialize_neighbor(neighbor_id, neighbor_priority, neighbor_interface_id, neighbor_ip_address,
+                                         neighbor_options, neighbor_dr, neighbor_bdr, router_id, router_dead_interval)
+        return new_neighbor
+
+    #  Sets neighbor data and starts its inactivity timer, without validating the provided values
+    def initialize_neighbor(self, neighbor_id, neighbor_priority, neighbor_interface_id, neighbor_ip_address,
+                            neighbor_options, neighbor_dr, neighbor_bdr, router_id, router_dead_interval):
         self.neighbor_id = neighbor_id
         self.neighbor_priority = neighbor_priority
         self.neighbor_interface_id = neighbor_interface_id  # Only for OSPFv3
@@ -44,33 +64,21 @@ class Neighbor:
 
         #  Implementation-specific parameters
 
-        self.reset = threading.Event()
         self.inactivity_timeout = threading.Event()
-        self.inactivity_shutdown = threading.Event()
         self.last_sent_dd_description_packet = None  # Last DD Description packet sent to neighbor
         self.router_id = router_id
 
-        #  Sets timer that monitors neighbor last activity
-        timeout_seconds = conf.ROUTER_DEAD_INTERVAL
+        #  Sets timer that monitors neighbor last activity, with the Router Dead Interval of the interface
         self.inactivity_timer = timer.Timer()
-        self.inactivity_thread = threading.Thread(
-            target=self.inactivity_timer.single_shot_timer,
-            args=(self.reset, self.inactivity_timeout, self.inactivity_shutdown, timeout_seconds))
-        self.inactivity_thread.start()
+        self.inactivity_timer.single_shot_timer(self.inactivity_timeout, router_dead_interval)
 
         #  Packet retransmission timers
         self.dd_packet_retransmit_timer = timer.Timer()
-        self.dd_packet_retransmit_thread = None
         self.dd_packet_retransmit_timeout = threading.Event()
-        self.dd_packet_retransmit_shutdown = threading.Event()
         self.ls_request_retransmit_timer = timer.Timer()
-        self.ls_request_retransmit_thread = None
         self.ls_request_retransmit_timeout = threading.Event()
-        self.ls_request_retransmit_shutdown = threading.Event()
         self.ls_update_retransmit_timer = timer.Timer()
-        self.ls_update_retransmit_thread = None
         self.ls_update_retransmit_timeout = threading.Event()
-        self.ls_update_retransmit_shutdown = threading.Event()
 
     #  Starts retransmission timer for specified packet type
     def start_retransmission_timer(self, packet_type):
@@ -79,28 +87,16 @@ class Neighbor:
         self.stop_retransmission_timer(packet_type)
         if packet_type == DB_DESCRIPTION:
             self.dd_packet_retransmit_timeout.clear()
-            self.dd_packet_retransmit_shutdown.clear()
-            self.dd_packet_retransmit_thread = threading.Thread(
-                target=self.dd_packet_retransmit_timer.interval_timer,
-                args=(0, self.dd_packet_retransmit_timeout, self.dd_packet_retransmit_shutdown,
-                      conf.RETRANSMISSION_INTERVAL))
-            self.dd_packet_retransmit_thread.start()
+            self.dd_packet_retransmit_timer.interval_timer(
+                0, self.dd_packet_retransmit_timeout, conf.RETRANSMISSION_INTERVAL)
         elif packet_type == LS_REQUEST:
             self.ls_request_retransmit_timeout.clear()
-            self.ls_request_retransmit_shutdown.clear()
-            self.ls_request_retransmit_thread = threading.Thread(
-                target=self.ls_request_retransmit_timer.interval_timer,
-                args=(0, self.ls_request_retransmit_timeout, self.ls_request_retransmit_shutdown,
-                      conf.RETRANSMISSION_INTERVAL))
-            self.ls_request_retransmit_thread.start()
+            self.ls_request_retransmit_timer.interval_timer(
+                0, self.ls_request_retransmit_timeout, conf.RETRANSMISSION_INTERVAL)
         else:  # LS Update packets
             self.ls_update_retransmit_timeout.clear()
-            self.ls_update_retransmit_shutdown.clear()
-            self.ls_update_retransmit_thread = threading.Thread(
-                target=self.ls_update_retransmit_timer.interval_timer,
-                args=(0, self.ls_update_retransmit_timeout, self.ls_update_retransmit_shutdown,
-                      conf.RETRANSMISSION_INTERVAL))
-            self.ls_update_retransmit_thread.start()
+            self.ls_update_retransmit_timer.interval_timer(
+                0, self.ls_update_retransmit_timeout, conf.RETRANSMISSION_INTERVAL)
 
     #  Returns True if inactivity timer has fired - No activity from neighbor was received lately
     def is_expired(self):
@@ -111,54 +107,41 @@ class Neighbor:
         if packet_type not in [DB_DESCRIPTION, LS_REQUEST, LS_UPDATE]:
             raise ValueError("Invalid packet type")
         if packet_type == DB_DESCRIPTION:
-            if self.dd_packet_retransmit_timeout.is_set() & (self.dd_packet_retransmit_thread is not None):
-                if self.dd_packet_retransmit_thread.isAlive():
-                    self.dd_packet_retransmit_timeout.clear()
-                    return True
+            if self.dd_packet_retransmit_timeout.is_set() & self.dd_packet_retransmit_timer.is_running():
+                self.dd_packet_retransmit_timeout.clear()
+                return True
         elif packet_type == LS_REQUEST:
-            if self.ls_request_retransmit_timeout.is_set() & (self.ls_request_retransmit_thread is not None):
-                if self.ls_request_retransmit_thread.isAlive():
-                    self.ls_request_retransmit_timeout.clear()
-                    return True
+            if self.ls_request_retransmit_timeout.is_set() & self.ls_request_retransmit_timer.is_running():
+                self.ls_request_retransmit_timeout.clear()
+                return True
         else:  # LS Update packet
-            if self.ls_update_retransmit_timeout.is_set() & (self.ls_update_retransmit_thread is not None):
-                if self.ls_update_retransmit_thread.isAlive():
-                    self.ls_update_retransmit_timeout.clear()
-                    return True
+            if self.ls_update_retransmit_timeout.is_set() & self.ls_update_retransmit_timer.is_running():
+                self.ls_update_retransmit_timeout.clear()
+                return True
         return False
 
     #  Resets inactivity timer - Activity from neighbor has just been received
     def reset_inactivity_timer(self):
-        self.reset.set()
+        self.inactivity_timer.reset_timer()
 
     #  Stops retransmission timer
     def stop_retransmission_timer(self, packet_type):
         if packet_type not in [DB_DESCRIPTION, LS_REQUEST, LS_UPDATE]:
             raise ValueError("Invalid packet type")
         if packet_type == DB_DESCRIPTION:
-            if self.dd_packet_retransmit_thread is not None:
-                self.dd_packet_retransmit_shutdown.set()
-                if self.dd_packet_retransmit_thread.isAlive():
-                    self.dd_packet_retransmit_thread.join()
+            self.dd_packet_retransmit_timer.stop_timer()
         elif packet_type == LS_REQUEST:
-            if self.ls_request_retransmit_thread is not None:
-                self.ls_request_retransmit_shutdown.set()
-                if self.ls_request_retransmit_thread.isAlive():
-                    self.ls_request_retransmit_thread.join()
+            self.ls_request_retransmit_timer.stop_timer()
         else:  # LS Update packet
-            if self.ls_update_retransmit_thread is not None:
-                self.ls_update_retransmit_shutdown.set()
-                if self.ls_update_retransmit_thread.isAlive():
-                    self.ls_update_retransmit_thread.join()
+            self.ls_update_retransmit_timer.stop_timer()
 
-    #  Stops timer thread so that neighbor can be deleted
+    #  Stops neighbor timers so that neighbor can be deleted
     def delete_neighbor(self):
         self.set_neighbor_state(conf.NEIGHBOR_STATE_DOWN)
         self.ls_retransmission_list = []
         self.db_summary_list = []
         self.ls_request_list = []
-        self.inactivity_shutdown.set()
-        self.inactivity_thread.join()
+        self.inactivity_timer.stop_timer()
         self.stop_retransmission_timer(DB_DESCRIPTION)
         self.stop_retransmission_timer(LS_REQUEST)
         self.stop_retransmission_timer(LS_UPDATE)
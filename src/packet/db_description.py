@@ -14,6 +14,8 @@ This class represents the body of an OSPF Database Description packet and contai
 #  L - Unsigned long (4 bytes) - struct.pack("> L", 1) -> b'\x00\x00\x00\x01
 OSPFV2_BASE_FORMAT_STRING = "> H B B L"  # Determines the format of the byte object to be created
 OSPFV3_BASE_FORMAT_STRING = "> L H H L"
+OSPFV2_BASE_STRUCT = struct.Struct(OSPFV2_BASE_FORMAT_STRING)
+OSPFV3_BASE_STRUCT = struct.Struct(OSPFV3_BASE_FORMAT_STRING)
 
 
 class DBDescription(body.Body):  # OSPFv2 - 8 bytes + 20 bytes / LSA Header; OSPFv3 - 12 bytes + 20 bytes / LSA Header
@@ -23,7 +25,22 @@ class DBDescription(body.Body):  # OSPFv2 - 8 bytes + 20 bytes / LSA Header; OSP
             interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number, lsa_headers, version)
         if not is_valid:  # At least one of the parameters failed validation
             raise ValueError(message)
+        self.set_body_fields(interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number, lsa_headers, version)
 
+    #  Creates packet body from fields read from a byte stream, skipping the validation ensured by the stream format
+    @staticmethod
+    def from_wire(interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number, lsa_headers, version):
+        is_valid, message = DBDescription.wire_validation(interface_mtu, options, i_bit, m_bit, ms_bit, lsa_headers,
+                                                          version)
+        if not is_valid:  # At least one of the fields is invalid regardless of its format
+            raise ValueError(message)
+        packet_body = DBDescription.__new__(DBDescription)
+        packet_body.set_body_fields(
+            interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number, lsa_headers, version)
+        return packet_body
+
+    #  Sets packet body fields without validating them
+    def set_body_fields(self, interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number, lsa_headers, version):
         self.interface_mtu = interface_mtu  # 2 bytes
         self.options = options  # 1 byte in OSPFv2, 3 bytes in OSPFv3
         self.i_bit = i_bit  # Init bit
@@ -37,25 +54,20 @@ class DBDescription(body.Body):  # OSPFv2 - 8 bytes + 20 bytes / LSA Header; OSP
     def pack_packet_body(self):
         i_m_ms_byte = (self.i_bit << 2) + (self.m_bit << 1) + self.ms_bit  # Byte that contains the I, M and MS bits
         if self.version == conf.VERSION_IPV4:
-            header_bytes = struct.pack(
-                OSPFV2_BASE_FORMAT_STRING, self.interface_mtu, self.options, i_m_ms_byte, self.dd_sequence_number)
+            header_bytes = [OSPFV2_BASE_STRUCT.pack(
+                self.interface_mtu, self.options, i_m_ms_byte, self.dd_sequence_number)]
         else:
-            header_bytes = struct.pack(
-                OSPFV3_BASE_FORMAT_STRING, self.options, self.interface_mtu, i_m_ms_byte, self.dd_sequence_number)
-            header_bytes = header_bytes
+            header_bytes = [OSPFV3_BASE_STRUCT.pack(
+                self.options, self.interface_mtu, i_m_ms_byte, self.dd_sequence_number)]
         for lsa_header in self.lsa_headers:
             lsa_header_bytes = lsa_header.pack_header()
-            header_bytes += lsa_header_bytes
-        return header_bytes
+            header_bytes.append(lsa_header_bytes)
+        return b''.join(header_bytes)
 
     #  Converts byte stream to body of an OSPF Hello packet
     @staticmethod
     def unpack_packet_body(body_bytes, version):
-        if version == conf.VERSION_IPV4:
-            base_body_bytes = body_bytes[:conf.OSPFV2_BASE_DB_DESCRIPTION_LENGTH]
-        else:
-            base_body_bytes = body_bytes[:conf.OSPFV3_BASE_DB_DESCRIPTION_LENGTH]
-        body_tuple = struct.unpack(DBDescription.get_format_string(version), base_body_bytes)
+        body_tuple = DBDescription.get_struct(version).unpack_from(body_bytes, 0)
         if version == conf.VERSION_IPV4:
             interface_mtu = body_tuple[0]
             options = body_tuple[1]
@@ -68,7 +80,8 @@ class DBDescription(body.Body):  # OSPFv2 - 8 bytes + 20 bytes / LSA Header; OSP
         ms_bit = bool(i_m_ms_byte & 1)  # 8th bit
         dd_sequence_number = body_tuple[3]
         lsa_headers = DBDescription.get_lsa_headers_from_packet_body(body_bytes, version)
-        return DBDescription(interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number, lsa_headers, version)
+        return DBDescription.from_wire(
+            interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number, lsa_headers, version)
 
     @staticmethod
     def get_format_string(version):
@@ -80,44 +93,60 @@ class DBDescription(body.Body):  # OSPFv2 - 8 bytes + 20 bytes / LSA Header; OSP
             raise ValueError("Invalid OSPF version")
         return format_string
 
+    @staticmethod
+    def get_struct(version):
+        if version == conf.VERSION_IPV4:
+            return OSPFV2_BASE_STRUCT
+        elif version == conf.VERSION_IPV6:
+            return OSPFV3_BASE_STRUCT
+        else:
+            raise ValueError("Invalid OSPF version")
+
     #  Gets the LSA Headers from a byte object representing the body of an OSPF DB Description packet
     @staticmethod
     def get_lsa_headers_from_packet_body(body_bytes, version):
         if version == conf.VERSION_IPV4:
-            lsa_headers_bytes = body_bytes[conf.OSPFV2_BASE_DB_DESCRIPTION_LENGTH:]
+            offset = conf.OSPFV2_BASE_DB_DESCRIPTION_LENGTH
         else:
-            lsa_headers_bytes = body_bytes[conf.OSPFV3_BASE_DB_DESCRIPTION_LENGTH:]
+            offset = conf.OSPFV3_BASE_DB_DESCRIPTION_LENGTH
+        header_number = (len(body_bytes) - offset) // conf.LSA_HEADER_LENGTH
+        header_bytes = memoryview(body_bytes)[offset:offset + header_number * conf.LSA_HEADER_LENGTH]
         lsa_headers = []
-        for i in range(len(lsa_headers_bytes) // conf.LSA_HEADER_LENGTH):
-            lsa_header_bytes = lsa_headers_bytes[i * conf.LSA_HEADER_LENGTH:(i + 1) * conf.LSA_HEADER_LENGTH]
-            lsa_header = header.Header.unpack_header(lsa_header_bytes, version)
-            lsa_headers.append(lsa_header)
+        for header_tuple in header.Header.get_struct(version).iter_unpack(header_bytes):
+            lsa_headers.append(header.Header.get_header_from_tuple(header_tuple, version))
         return tuple(lsa_headers)
 
     #  Validates constructor parameters - Returns error message in case of failed validation
     @staticmethod
     def parameter_validation(interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number, lsa_headers, version):
         try:
-            if (interface_mtu <= 0) | (interface_mtu > conf.MAX_VALUE_16_BITS):
+            if interface_mtu > conf.MAX_VALUE_16_BITS:
                 return False, "Invalid MTU"
             if (not (0 <= options <= conf.MAX_VALUE_8_BITS)) & (version == conf.VERSION_IPV4):  # OSPFv2
                 return False, "Invalid packet options"
-            if (not (0 <= options <= conf.MAX_VALUE_24_BITS)) & (version == conf.VERSION_IPV6):  # OSPFv3
-                return False, "Invalid packet options"
-            if (i_bit is True) & ((m_bit is False) | (ms_bit is False)):
-                return False, "Invalid values for I, M and MS bits"
             if (dd_sequence_number < 0) | (dd_sequence_number > conf.MAX_VALUE_32_BITS):
                 return False, "Invalid DD Sequence Number"
-            if (len(lsa_headers) > 0) & i_bit:
-                return False, "ExStart state - There must be no LSA Headers"
             for lsa_header in lsa_headers:
                 lsa_header.pack_header()  # An error will be raised if it is not a LSA Header instance
-            if version not in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
-                return False, "Invalid OSPF version"
-            return True, ''  # No error message to return
+            return DBDescription.wire_validation(interface_mtu, options, i_bit, m_bit, ms_bit, lsa_headers, version)
         except (ValueError, TypeError, AttributeError):
             return False, "Invalid parameter type"
 
+    #  Validates packet body fields that can be invalid even if read from a byte stream with the correct format
+    @staticmethod
+    def wire_validation(interface_mtu, options, i_bit, m_bit, ms_bit, lsa_headers, version):
+        if interface_mtu <= 0:
+            return False, "Invalid MTU"
+        if (not (0 <= options <= conf.MAX_VALUE_24_BITS)) & (version == conf.VERSION_IPV6):  # OSPFv3
+            return False, "Invalid packet options"
+        if (i_bit is True) & ((m_bit is False) | (ms_bit is False)):
+            return False, "Invalid values for I, M and MS bits"
+        if (len(lsa_headers) > 0) & i_bit:
+            return False, "ExStart state - There must be no LSA Headers"
+        if version not in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+            return False, "Invalid OSPF version"
+        return True, ''  # No error message to return
+
     def __str__(self):
         lsa_headers = []
         for lsa_header in self.lsa_headers:
@@ -14,16 +14,33 @@ This class represents the OSPF packet header and contains its operations
 #  Q - Unsigned long long (8 bytes) - struct.pack("> Q", 1) -> b'\x00\x00\x00\x00\x00\x00\x00\x01
 OSPFV2_FORMAT_STRING = "> B B H L L H H Q"  # Determines the format of the byte object to be created
 OSPFV3_FORMAT_STRING = "> B B H L L H B B"
+OSPFV2_STRUCT = struct.Struct(OSPFV2_FORMAT_STRING)
+OSPFV3_STRUCT = struct.Struct(OSPFV3_FORMAT_STRING)
 
 
 class Header:  # OSPFv2 - 24 bytes; OSPFv3 - 16 bytes
+    __slots__ = ('version', 'packet_type', 'length', 'router_id', 'area_id', 'checksum', 'auth_type', 'authentication',
+                 'instance_id')
 
     def __init__(self, version, packet_type, router_id, area_id, auth_type, authentication, instance_id):
         is_valid, message = self.parameter_validation(
             version, packet_type, router_id, area_id, auth_type, authentication, instance_id)
         if not is_valid:  # At least one of the parameters failed validation
             raise ValueError(message)
+        self.set_header_fields(version, packet_type, router_id, area_id, auth_type, authentication, instance_id)
 
+    #  Creates packet header from fields read from a byte stream, skipping the validation ensured by the stream format
+    @staticmethod
+    def from_wire(version, packet_type, router_id, area_id, auth_type, authentication, instance_id):
+        is_valid, message = Header.wire_validation(version, packet_type, auth_type)
+        if not is_valid:  # At least one of the fields is invalid regardless of its format
+            raise ValueError(message)
+        header = Header.__new__(Header)
+        header.set_header_fields(version, packet_type, router_id, area_id, auth_type, authentication, instance_id)
+        return header
+
+    #  Sets header fields without validating them
+    def set_header_fields(self, version, packet_type, router_id, area_id, auth_type, authentication, instance_id):
         self.version = version  # 1 byte
         self.packet_type = packet_type  # 1 byte
         self.length = 0  # 2 bytes
@@ -44,17 +61,16 @@ class Header:  # OSPFv2 - 24 bytes; OSPFv3 - 16 bytes
         decimal_router_id = utils.Utils.ipv4_to_decimal(self.router_id)
         decimal_area_id = utils.Utils.ipv4_to_decimal(self.area_id)
         if self.version == conf.VERSION_IPV4:
-            return struct.pack(OSPFV2_FORMAT_STRING, self.version, self.packet_type, self.length, decimal_router_id,
-                               decimal_area_id, self.checksum, self.auth_type, self.authentication)
+            return OSPFV2_STRUCT.pack(self.version, self.packet_type, self.length, decimal_router_id,
+                                      decimal_area_id, self.checksum, self.auth_type, self.authentication)
         else:
-            return struct.pack(OSPFV3_FORMAT_STRING, self.version, self.packet_type, self.length, decimal_router_id,
-                               decimal_area_id, self.checksum, self.instance_id, 0)  # Last byte is set to 0
+            return OSPFV3_STRUCT.pack(self.version, self.packet_type, self.length, decimal_router_id,
+                                      decimal_area_id, self.checksum, self.instance_id, 0)  # Last byte is set to 0
 
     #  Converts byte object to an OSPF packet header
     @staticmethod
     def unpack_header(header_bytes, version):
-        format_string = Header.get_format_string(version)
-        header_tuple = struct.unpack(format_string, header_bytes)
+        header_tuple = Header.get_struct(version).unpack(header_bytes)
 
         version = header_tuple[0]
         packet_type = header_tuple[1]
@@ -65,10 +81,10 @@ class Header:  # OSPFv2 - 24 bytes; OSPFv3 - 16 bytes
         if version == conf.VERSION_IPV4:
             auth_type = header_tuple[6]
             authentication = header_tuple[7]
-            header = Header(version, packet_type, router_id, area_id, auth_type, authentication, 0)
+            header = Header.from_wire(version, packet_type, router_id, area_id, auth_type, authentication, 0)
         else:
             instance_id = header_tuple[6]
-            header = Header(version, packet_type, router_id, area_id, 0, 0, instance_id)
+            header = Header.from_wire(version, packet_type, router_id, area_id, 0, 0, instance_id)
         header.length = length
         header.checksum = checksum
         return header
@@ -89,18 +105,13 @@ class Header:  # OSPFv2 - 24 bytes; OSPFv3 - 16 bytes
     #  Validates constructor parameters - Returns error message in case of failed validation
     def parameter_validation(self, version, packet_type, router_id, area_id, auth_type, authentication, instance_id):
         try:
-            if version not in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
-                return False, "Invalid OSPF version"
-            if packet_type not in [conf.PACKET_TYPE_HELLO, conf.PACKET_TYPE_DB_DESCRIPTION, conf.PACKET_TYPE_LS_REQUEST,
-                                   conf.PACKET_TYPE_LS_UPDATE, conf.PACKET_TYPE_LS_ACKNOWLEDGMENT]:
-                return False, "Invalid packet type"
+            is_valid, message = Header.wire_validation(version, packet_type, auth_type)
+            if not is_valid:
+                return is_valid, message
             if not utils.Utils.is_ipv4_address(router_id):
                 return False, "Invalid router ID"
             if not utils.Utils.is_ipv4_address(area_id):
                 return False, "Invalid area ID"
-            if (auth_type not in [conf.NULL_AUTHENTICATION, conf.SIMPLE_PASSWORD, conf.CRYPTOGRAPHIC_AUTHENTICATION])\
-                    & (version == conf.VERSION_IPV4):
-                return False, "Invalid authentication type"
             if (not (0 <= authentication <= conf.MAX_VALUE_64_BITS)) & (version == conf.VERSION_IPV4):
                 return False, "Invalid authentication field"
             if (not (0 <= instance_id <= conf.MAX_VALUE_8_BITS)) & (version == conf.VERSION_IPV6):
@@ -109,6 +120,19 @@ class Header:  # OSPFv2 - 24 bytes; OSPFv3 - 16 bytes
         except (ValueError, TypeError):
             return False, "Invalid parameter type"
 
+    #  Validates header fields that can be invalid even if read from a byte stream with the correct format
+    @staticmethod
+    def wire_validation(version, packet_type, auth_type):
+        if version not in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+            return False, "Invalid OSPF version"
+        if packet_type not in [conf.PACKET_TYPE_HELLO, conf.PACKET_TYPE_DB_DESCRIPTION, conf.PACKET_TYPE_LS_REQUEST,
+                               conf.PACKET_TYPE_LS_UPDATE, conf.PACKET_TYPE_LS_ACKNOWLEDGMENT]:
+            return False, "Invalid packet type"
+        if (auth_type not in [conf.NULL_AUTHENTICATION, conf.SIMPLE_PASSWORD, conf.CRYPTOGRAPHIC_AUTHENTICATION]) & (
+                version == conf.VERSION_IPV4):
+            return False, "Invalid authentication type"
+        return True, ''
+
     def set_checksum(self, checksum):
         if (checksum < 0) | (checksum > conf.MAX_VALUE_16_BITS):
             error = "Checksum must be between 0 and " + str(conf.MAX_VALUE_16_BITS) + " bytes, was " + str(checksum)
@@ -136,6 +160,15 @@ class Header:  # OSPFv2 - 24 bytes; OSPFv3 - 16 bytes
         else:
             raise ValueError("Invalid OSPF version")
 
+    @staticmethod
+    def get_struct(version):
+        if version == conf.VERSION_IPV4:
+            return OSPFV2_STRUCT
+        elif version == conf.VERSION_IPV6:
+            return OSPFV3_STRUCT
+        else:
+            raise ValueError("Invalid OSPF version")
+
     def __str__(self):
         return str({'Version': self.version, 'Packet Type': self.packet_type, 'Length': self.length,
                     'Router ID': self.router_id, 'Area ID': self.area_id, 'Checksum': self.checksum,
@@ -15,6 +15,9 @@ This class represents the body of an OSPF Hello packet and contains its operatio
 OSPFV2_BASE_FORMAT_STRING = "> L H B B L L L"  # Determines the format of the byte object to be created
 OSPFV3_BASE_FORMAT_STRING = "> L L H H L L"
 EXTRA_FORMAT_STRING = " L"  # Must be added to the base format string for every neighbor, for every OSPF version
+OSPFV2_BASE_STRUCT = struct.Struct(OSPFV2_BASE_FORMAT_STRING)
+OSPFV3_BASE_STRUCT = struct.Struct(OSPFV3_BASE_FORMAT_STRING)
+NEIGHBOR_STRUCT = struct.Struct(">" + EXTRA_FORMAT_STRING)
 
 
 class Hello(body.Body):  # OSPFv2 and OSPFv3 - 20 bytes + 4 bytes / neighbor
@@ -45,24 +48,23 @@ class Hello(body.Body):  # OSPFv2 and OSPFv3 - 20 bytes + 4 bytes / neighbor
 
         if self.version == conf.VERSION_IPV4:
             decimal_network_mask = utils.Utils.ipv4_to_decimal(self.network_mask)
-            base_packed_data = struct.pack(
-                OSPFV2_BASE_FORMAT_STRING, decimal_network_mask, self.hello_interval, self.options,
-                self.router_priority, self.router_dead_interval, decimal_designated_router,
-                decimal_backup_designated_router)
+            base_packed_data = OSPFV2_BASE_STRUCT.pack(
+                decimal_network_mask, self.hello_interval, self.options, self.router_priority,
+                self.router_dead_interval, decimal_designated_router, decimal_backup_designated_router)
         else:
             decimal_interface_id = utils.Utils.ipv4_to_decimal(self.interface_id)
-            base_packed_data = struct.pack(
-                OSPFV3_BASE_FORMAT_STRING, decimal_interface_id, (self.router_priority << 3 * conf.BYTE_SIZE) +
-                self.options, self.hello_interval, self.router_dead_interval, decimal_designated_router,
+            base_packed_data = OSPFV3_BASE_STRUCT.pack(
+                decimal_interface_id, (self.router_priority << 3 * conf.BYTE_SIZE) + self.options,
+                self.hello_interval, self.router_dead_interval, decimal_designated_router,
                 decimal_backup_designated_router)
 
-        packed_data = base_packed_data
+        packed_data = [base_packed_data]
         #  Adds neighbors one by one to the Hello packet
         for n in self.neighbors:
             decimal_neighbor = utils.Utils.ipv4_to_decimal(n)
-            extra_packed_data = struct.pack(">" + EXTRA_FORMAT_STRING, decimal_neighbor)
-            packed_data += extra_packed_data
-        return packed_data
+            extra_packed_data = NEIGHBOR_STRUCT.pack(decimal_neighbor)
+            packed_data.append(extra_packed_data)
+        return b''.join(packed_data)
 
     #  Converts byte stream to body of an OSPF Hello packet
     @staticmethod
@@ -1,5 +1,7 @@
 import packet.body as body
 import lsa.lsa as lsa
+import lsa.header as header
+import conf.conf as conf
 
 '''
 This class represents the body of an OSPF Link State Acknowledgement packet and contains its operations
@@ -18,17 +20,20 @@ class LSAcknowledgement(body.Body):  # OSPFv2 and OSPFv3 - 20 bytes / LSA header
 
     #  Creates byte object suitable to be sent and recognized as the body of an OSPF Link State Acknowledge packet
     def pack_packet_body(self):
-        body_bytes = b''
+        body_bytes = []
         for i in self.lsa_headers:
-            body_bytes += i.pack_header()
-        return body_bytes
+            body_bytes.append(i.pack_header())
+        return b''.join(body_bytes)
 
     #  Converts byte stream to body of an OSPF Link State Acknowledgement packet
     @staticmethod
     def unpack_packet_body(body_bytes, version):
         new_packet = LSAcknowledgement(version)
-        for i in range(len(body_bytes) // 20):
-            new_lsa = lsa.Lsa.unpack_header(body_bytes[i*20:(i+1)*20], version)
+        header_bytes = memoryview(body_bytes)  # LSA headers are read in place from the byte stream, without copying it
+        header_bytes = header_bytes[:len(header_bytes) - len(header_bytes) % conf.LSA_HEADER_LENGTH]
+        for header_tuple in header.Header.get_struct(version).iter_unpack(header_bytes):
+            new_lsa = lsa.Lsa()
+            new_lsa.header = header.Header.get_header_from_tuple(header_tuple, version)
             new_packet.lsa_headers.append(new_lsa)
         return new_packet
 
@@ -11,6 +11,7 @@ This class represents the body of an OSPF Link State Request packet and contains
 #  > - Big-endian
 #  L - Unsigned long (4 bytes) - struct.pack("> L", 1) -> b'\x00\x00\x00\x01
 FORMAT_STRING = "> L L L"  # Determines the format of the byte object to be created
+STRUCT = struct.Struct(FORMAT_STRING)
 
 
 class LSRequest(body.Body):  # OSPFv2 and OSPFv3 - 12 bytes / LSA identifier
@@ -28,20 +29,20 @@ class LSRequest(body.Body):  # OSPFv2 and OSPFv3 - 12 bytes / LSA identifier
 
     #  Creates byte object suitable to be sent and recognized as the body of an OSPF Link State Request packet
     def pack_packet_body(self):
-        body_bytes = b''
+        body_bytes = []
         for i in self.lsa_identifiers:
             ls_type = i[0]
             decimal_link_state_id = utils.Utils.ipv4_to_decimal(i[1])
             decimal_advertising_router = utils.Utils.ipv4_to_decimal(i[2])
-            body_bytes += struct.pack(FORMAT_STRING, ls_type, decimal_link_state_id, decimal_advertising_router)
-        return body_bytes
+            body_bytes.append(STRUCT.pack(ls_type, decimal_link_state_id, decimal_advertising_router))
+        return b''.join(body_bytes)
 
     #  Converts byte stream to body of an OSPF Link State Request packet
     @staticmethod
     def unpack_packet_body(body_bytes, version):
         new_packet = LSRequest(version)
-        for i in range(len(body_bytes) // 12):
-            body_tuple = struct.unpack(FORMAT_STRING, body_bytes[i*12:(i+1)*12])
+        identifier_bytes = memoryview(body_bytes)[:len(body_bytes) - len(body_bytes) % STRUCT.size]
+        for body_tuple in STRUCT.iter_unpack(identifier_bytes):
             ls_type = body_tuple[0]
             link_state_id = utils.Utils.decimal_to_ipv4(body_tuple[1])
             advertising_router = utils.Utils.decimal_to_ipv4(body_tuple[2])
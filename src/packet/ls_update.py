@@ -2,6 +2,7 @@ import struct
 
 import packet.body as body
 import lsa.lsa as lsa
+import conf.conf as conf
 
 '''
 This class represents the body of an OSPF Link State Update packet and contains its operations
@@ -10,6 +11,7 @@ This class represents the body of an OSPF Link State Update packet and contains
 #  > - Big-endian
 #  L - Unsigned long (4 bytes) - struct.pack("> L", 1) -> b'\x00\x00\x00\x01
 FORMAT_STRING = "> L"  # Determines the format of the byte object to be created
+STRUCT = struct.Struct(FORMAT_STRING)
 
 
 class LSUpdate(body.Body):  # OSPFv2 and OSPFv3 - 4 bytes + 20+ bytes / LSA
@@ -26,7 +28,7 @@ class LSUpdate(body.Body):  # OSPFv2 and OSPFv3 - 4 bytes + 20+ bytes / LSA
 
     #  Creates byte object suitable to be sent and recognized as the body of an OSPF Link State Update packet
     def pack_packet_body(self):
-        body_bytes = struct.pack(FORMAT_STRING, self.lsa_number)
+        body_bytes = STRUCT.pack(self.lsa_number)
         for i in self.lsa_list:
             body_bytes += i.pack_lsa()
         return body_bytes
@@ -35,12 +37,15 @@ class LSUpdate(body.Body):  # OSPFv2 and OSPFv3 - 4 bytes + 20+ bytes / LSA
     @staticmethod
     def unpack_packet_body(body_bytes, version):
         new_packet = LSUpdate(version)
-        body_bytes = body_bytes[4:]  # Extracting the LSAs
-        while len(body_bytes) > 0:
-            ls_length = lsa.Lsa.get_lsa_length(body_bytes)
-            new_lsa = lsa.Lsa.unpack_lsa(body_bytes[:ls_length], version)
+        body_bytes = memoryview(body_bytes)  # LSAs are read in place from the byte stream, without copying it
+        offset = 4  # Skipping the number of LSAs
+        while offset < len(body_bytes):
+            ls_length = lsa.Lsa.get_lsa_length(body_bytes, offset)
+            if ls_length < conf.LSA_HEADER_LENGTH:  # Would otherwise never reach the end of the byte stream
+                raise ValueError("Invalid LSA length")
+            new_lsa = lsa.Lsa.unpack_lsa(body_bytes[offset:offset + ls_length], version)
             new_packet.add_lsa(new_lsa)
-            body_bytes = body_bytes[ls_length:]
+            offset += ls_length
         return new_packet
 
     def __str__(self):
@@ -30,6 +30,7 @@ class Packet:
         self.body = None
         self.source_ipv6_address = '::'  # Required for OSPFv3 packet checksum calculation
         self.destination_ipv6_address = '::'
+        self.is_finalized = False  # True if packet length and checksum are set according to current packet body
 
     #  #  #  #  #  #  #
     #  Main methods   #
@@ -39,28 +40,36 @@ class Packet:
     def create_header_v2(self, packet_type, router_id, area_id, auth_type, authentication):
         self.header = header.Header(conf.VERSION_IPV4, packet_type, router_id, area_id, auth_type, authentication, 0)
         self.body = None
+        self.is_finalized = False
 
     #  Adds an OSPFv3 header to the packet with the provided arguments
     def create_header_v3(self, packet_type, router_id, area_id, instance_id, source_address, destination_address):
         self.header = header.Header(conf.VERSION_IPV6, packet_type, router_id, area_id, 0, 0, instance_id)
         self.body = None
+        self.is_finalized = False
         self.source_ipv6_address = source_address
         self.destination_ipv6_address = destination_address
 
     #  Converts an OSPF packet into a byte stream
+    #  Packet length and checksum are set at this point if packet body has changed since last time
     def pack_packet(self):
         if self.header is None:
             raise ValueError("Packet header is not set")
         if self.body is None:
             raise ValueError("Packet body is not set")
 
+        if not self.is_finalized:
+            body_bytes = self.finalize_packet()
+        else:
+            body_bytes = self.body.pack_packet_body()
         header_bytes = self.header.pack_header()
-        body_bytes = self.body.pack_packet_body()
         return header_bytes + body_bytes
 
     #  Converts a byte stream into an OSPF packet
+    #  Byte stream is accessed through a memoryview - Packet header, body and LSAs are read without being copied
     @staticmethod
     def unpack_packet(packet_bytes):
+        packet_bytes = memoryview(packet_bytes)
         packet_version = Packet.get_ospf_version(packet_bytes)
         packet_type = Packet.get_ospf_packet_type(packet_bytes)
 
@@ -92,6 +101,7 @@ class Packet:
         else:
             packet.body = ls_acknowledgement.LSAcknowledgement.unpack_packet_body(body_bytes, packet_version)
 
+        packet.is_finalized = True  # Packet length and checksum are kept as received
         return packet
 
     #  Adds an OSPFv2 Hello packet body to the packet with the provided arguments
@@ -104,8 +114,7 @@ class Packet:
 
         self.body = hello.Hello(network_mask, hello_interval, options, router_priority, router_dead_interval,
                                 designated_router, backup_designated_router, neighbors, 0, conf.VERSION_IPV4)
-        self.set_packet_length()  # Packet length must be set after body is created and before checksum is computed
-        self.set_packet_checksum()
+        self.finalize_packet()
 
     #  Adds an OSPFv3 Hello packet body to the packet with the provided arguments
     def create_hello_v3_packet_body(self, interface_id, hello_interval, options, router_priority, router_dead_interval,
@@ -117,8 +126,7 @@ class Packet:
 
         self.body = hello.Hello('', hello_interval, options, router_priority, router_dead_interval,
                                 designated_router, backup_designated_router, neighbors, interface_id, conf.VERSION_IPV6)
-        self.set_packet_length()  # Packet length must be set after body is created and before checksum is computed
-        self.set_packet_checksum()
+        self.finalize_packet()
 
     #  Adds an OSPF Database Description packet body to the packet with the provided arguments
     def create_db_description_packet_body(self, interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number,
@@ -128,8 +136,7 @@ class Packet:
 
         self.body = db_description.DBDescription(interface_mtu, options, i_bit, m_bit, ms_bit, dd_sequence_number,
                                                  lsa_headers, version)
-        self.set_packet_length()
-        self.set_packet_checksum()
+        self.finalize_packet()
 
     #  Adds an OSPF Link State Request packet body to the packet with the provided arguments
     def create_ls_request_packet_body(self, version):
@@ -137,8 +144,7 @@ class Packet:
             raise ValueError("Packet header is not set")
 
         self.body = ls_request.LSRequest(version)
-        self.set_packet_length()
-        self.set_packet_checksum()
+        self.finalize_packet()
 
     #  Adds data for one LSA identifier to the Link State Request packet
     def add_lsa_info(self, ls_type, link_state_id, advertising_router):
@@ -148,8 +154,7 @@ class Packet:
             raise ValueError("Packet body is not set")
 
         self.body.add_lsa_info(ls_type, link_state_id, advertising_router)
-        self.set_packet_length()
-        self.set_packet_checksum()
+        self.is_finalized = False
 
     #  Adds an OSPF Link State Update packet body to the packet with the provided arguments
     def create_ls_update_packet_body(self, version):
@@ -157,8 +162,7 @@ class Packet:
             raise ValueError("Packet header is not set")
 
         self.body = ls_update.LSUpdate(version)
-        self.set_packet_length()
-        self.set_packet_checksum()
+        self.finalize_packet()
 
     #  Adds one full LSA to the Link State Update packet
     def add_lsa(self, new_lsa):
@@ -168,8 +172,7 @@ class Packet:
             raise ValueError("Packet body is not set")
 
         self.body.add_lsa(new_lsa)
-        self.set_packet_length()
-        self.set_packet_checksum()
+        self.is_finalized = False
 
     #  Adds an OSPF Link State Acknowledgement packet body to the packet with the provided arguments
     def create_ls_acknowledgement_packet_body(self, version):
@@ -177,8 +180,7 @@ class Packet:
             raise ValueError("Packet header is not set")
 
         self.body = ls_acknowledgement.LSAcknowledgement(version)
-        self.set_packet_length()
-        self.set_packet_checksum()
+        self.finalize_packet()
 
     #  Adds one LSA header to the Link State Acknowledgement packet
     def add_lsa_header(self, lsa_header):
@@ -188,21 +190,34 @@ class Packet:
             raise ValueError("Packet body is not set")
 
         self.body.add_lsa_header(lsa_header)
-        self.set_packet_length()
-        self.set_packet_checksum()
+        self.is_finalized = False
 
     #  #  #  #  #  #  #   #
     #  Auxiliary methods  #
     #  #  #  #  #  #  #   #
 
+    #  Sets packet length and checksum according to current packet body, and returns the packed body
+    #  Packet body can be freely changed while the packet is built - This is done once, when it is packed
+    def finalize_packet(self):
+        body_bytes = self.body.pack_packet_body()
+        self.header.set_length(len(self.header.pack_header()) + len(body_bytes))
+        self.set_packet_checksum(body_bytes)
+        self.is_finalized = True
+        return body_bytes
+
     #  Calculates packet checksum and inserts it on packet header
-    def set_packet_checksum(self):
+    #  Packet body byte stream can be provided if it has already been packed
+    def set_packet_checksum(self, body_bytes=None):
+        if (self.header.version == conf.VERSION_IPV6) & conf.KERNEL_CHECKSUM_IPV6:
+            self.header.set_checksum(0)  # Kernel computes OSPFv3 checksum when packet is sent
+            return
         if self.body is not None:  # Does nothing if there is no packet body
             cleaned_parameters = self.header.prepare_packet_checksum()  # Cleans required fields before calculation
 
             #  Calculates and sets packet checksum - It is set to 0 in the packet sent as argument
             header_bytes = self.header.pack_header()  # Without the checksum
-            body_bytes = self.body.pack_packet_body()
+            if body_bytes is None:
+                body_bytes = self.body.pack_packet_body()
             if self.header.version == conf.VERSION_IPV4:
                 checksum = utils.Utils.create_checksum_ospfv2(header_bytes + body_bytes)
             else:
@@ -220,10 +235,20 @@ class Packet:
             packet_length = len(header_bytes + body_bytes)
             self.header.set_length(packet_length)
 
+    #  Converts an OSPF packet into a byte stream ready to be sent between the provided addresses
+    #  Checksum set when packet was finalized is kept, unless it was computed for other OSPFv3 source or destination
+    def pack_packet_to_send(self, source_address, destination_address):
+        if self.header.version == conf.VERSION_IPV6:
+            if (self.source_ipv6_address != source_address) | (self.destination_ipv6_address != destination_address):
+                self.source_ipv6_address = source_address
+                self.destination_ipv6_address = destination_address
+                self.is_finalized = False
+        return self.pack_packet()
+
     #  Given a packet byte stream, returns its OSPF version
     @staticmethod
     def get_ospf_version(packet_bytes):
-        if (packet_bytes is None) | (packet_bytes == b''):
+        if (packet_bytes is None) or (len(packet_bytes) == 0):
             raise ValueError("Packet byte stream is too short")
         version = packet_bytes[0]  # First byte of OSPF packet is always its version
         if version not in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
@@ -235,8 +260,7 @@ class Packet:
     def get_ospf_packet_type(packet_bytes):
         if (packet_bytes is None) | (len(packet_bytes) < 2):
             raise ValueError("Packet byte stream is too short")
-        packet_type_byte = packet_bytes[1:2]  # Second byte of OSPF packet is always its type
-        packet_type = struct.unpack(FORMAT_STRING, packet_type_byte)[0]
+        packet_type = struct.unpack_from(FORMAT_STRING, packet_bytes, 1)[0]  # Second byte of OSPF packet is its type
         if packet_type not in [conf.PACKET_TYPE_HELLO, conf.PACKET_TYPE_DB_DESCRIPTION, conf.PACKET_TYPE_LS_REQUEST,
                                conf.PACKET_TYPE_LS_UPDATE, conf.PACKET_TYPE_LS_ACKNOWLEDGMENT]:
             raise ValueError("Invalid OSPF packet type")
@@ -256,5 +280,17 @@ class Packet:
             correct_checksum = False
         return correct_checksum  # Checksum of packet with valid checksum will always be 0
 
+    #  Returns True if checksum of packet byte stream is valid, without decoding the packet
+    #  Sum of all 16-bit blocks, including the checksum field, of a packet with valid checksum is 0xFFFF
+    @staticmethod
+    def is_packet_bytes_checksum_valid(packet_bytes, source_address, destination_address):
+        version = Packet.get_ospf_version(packet_bytes)
+        if version == conf.VERSION_IPV4:
+            #  Authentication type and authentication fields are not included in the OSPFv2 checksum
+            message = bytes(packet_bytes[:14]) + bytes(10) + bytes(packet_bytes[conf.OSPFV2_PACKET_HEADER_LENGTH:])
+            return utils.Utils.create_checksum_ospfv2(message) == 0
+        else:
+            return utils.Utils.create_checksum_ospfv3(packet_bytes, source_address, destination_address) == 0
+
     def __str__(self):
         return 'Header: ' + self.header.__str__() + ' Body: ' + self.body.__str__()
@@ -78,16 +78,18 @@ class ExtensionLsdb:
                 return query_lsa
         return None
 
-    #  Atomically returns headers of full extension LSDB
+    #  Atomically returns copies of the headers of full extension LSDB or part of it, without copying LSA bodies
     def get_extension_lsa_headers(self, identifiers):
-        lsa_list = self.get_extension_lsdb(identifiers)
         lsa_headers = []
-        for query_lsa in lsa_list:
-            #  If no identifier list is provided, all LSA headers are returned
-            if identifiers is None:
-                lsa_headers.append(query_lsa.header)
-            elif query_lsa.get_lsa_identifier() in identifiers:
-                lsa_headers.append(query_lsa.header)
+        self.acquire_all_locks()
+        for lsa_list in [self.abr_lsa_list, self.prefix_lsa_list, self.asbr_lsa_list]:
+            for query_lsa in lsa_list:
+                #  If no identifier list is provided, all LSA headers are returned
+                if identifiers is None:
+                    lsa_headers.append(copy.copy(query_lsa.header))
+                elif query_lsa.get_lsa_identifier() in identifiers:
+                    lsa_headers.append(copy.copy(query_lsa.header))
+        self.release_all_locks()
         return lsa_headers
 
     #  Atomically returns an extension LSA header given its identifier, if present
@@ -7,6 +7,7 @@ import multiprocessing
 
 import general.utils as utils
 import general.sock as sock
+import general.ring_buffer as ring_buffer
 import conf.conf as conf
 import area.area as area
 import packet.packet as packet
@@ -53,6 +54,7 @@ class Router:
 
         self.packet_sockets = {}
         self.packet_pipelines = {}
+        self.receiving_pipelines = {}
         self.socket_shutdown_events = {}
         self.socket_processes = {}
         self.router_shutdown_event = None
@@ -93,27 +95,37 @@ class Router:
         for area_id in Router.get_unique_values(self.area_ids):
             for interface_id in self.areas[area_id].interfaces:
                 self.interfaces[interface_id] = self.areas[area_id].interfaces[interface_id]
-        self.max_ip_datagram = conf.MTU
+        for interface_id in self.interfaces:  # Largest IP datagram that can be carried by one of the interfaces
+            self.max_ip_datagram = max(
+                self.max_ip_datagram, self.interfaces[interface_id][area.INTERFACE_OBJECT].max_ip_datagram)
 
         for interface_id in self.interfaces:
-            self.packet_sockets[interface_id] = sock.Socket()
-            self.packet_pipelines[interface_id] = multiprocessing.Queue()
-        for interface_id in self.interfaces:
-            self.socket_shutdown_events[interface_id] = multiprocessing.Event()
+            self.packet_sockets[interface_id] = sock.Socket()  # Holds event stating if interface is DR/BDR
+            self.packet_pipelines[interface_id] = multiprocessing.Queue()  # Only used in localhost operation
+
+        #  Interfaces are distributed among a small pool of processes, each one listening to all of its interfaces
         accept_self_packets = False
-        is_dr = multiprocessing.Event()  # Event is clear on creation - Router on startup is never DR/BDR
-        for interface_id in self.interfaces:
-            if self.ospf_version == conf.VERSION_IPV4:
-                self.socket_processes[interface_id] = multiprocessing.Process(
-                    target=self.packet_sockets[interface_id].receive_ipv4,
-                    args=(self.packet_pipelines[interface_id], self.socket_shutdown_events[interface_id], interface_id,
-                          accept_self_packets, is_dr, localhost))
-            else:
-                self.socket_processes[interface_id] = multiprocessing.Process(
-                    target=self.packet_sockets[interface_id].receive_ipv6,
-                    args=(self.packet_pipelines[interface_id], self.socket_shutdown_events[interface_id], interface_id,
-                          accept_self_packets, is_dr, localhost))
-            self.socket_processes[interface_id].start()
+        interface_areas = None  # Receiving processes only filter and validate packets if they know the interface areas
+        if conf.RECEIVING_PROCESS_VALIDATION | conf.RECEIVING_KERNEL_FILTER:
+            interface_areas = {}
+            for i in range(len(self.interface_ids)):
+                interface_areas[self.interface_ids[i]] = self.area_ids[i]
+        if not localhost:  # No sockets will be used in the integration tests
+            process_number = max(1, min(conf.RECEIVING_PROCESSES, len(self.interfaces)))
+            interface_groups = [list(self.interfaces)[i::process_number] for i in range(process_number)]
+            for process_id in range(process_number):
+                interface_group = interface_groups[process_id]
+                is_dr_events = {}  # Event is clear on creation - Router on startup is never DR/BDR
+                for interface_id in interface_group:
+                    is_dr_events[interface_id] = self.packet_sockets[interface_id].is_dr
+                self.receiving_pipelines[process_id] = ring_buffer.RingBuffer(conf.RECEIVING_BUFFER_SIZE)
+                self.socket_shutdown_events[process_id] = multiprocessing.Event()
+                self.socket_processes[process_id] = multiprocessing.Process(
+                    target=sock.Socket().receive_interfaces,
+                    args=(self.receiving_pipelines[process_id], self.socket_shutdown_events[process_id],
+                          interface_group, accept_self_packets, is_dr_events, self.ospf_version, localhost,
+                          self.router_id, interface_areas))
+                self.socket_processes[process_id].start()
         self.router_shutdown_event = router_shutdown_event
         self.abr = Router.is_abr(area_ids)
         self.command_pipeline = command_pipeline  # User commands
@@ -133,15 +145,17 @@ class Router:
     def main_loop(self):
         while not self.router_shutdown_event.is_set():  # Until router is signalled to shutdown
             #  Sends received packets to receiving interface
+            for process_id in self.receiving_pipelines:
+                pipeline = self.receiving_pipelines[process_id]
+                if not pipeline.empty():  # Packets are read directly from the shared memory as a single batch
+                    for packet_data in pipeline.get():
+                        self.deliver_packet(packet_data[0], packet_data[1], packet_data[2])
+                    pipeline.release()  # Memory of delivered packets can be reused by the receiving process
             for interface_id in self.packet_pipelines:
                 pipeline = self.packet_pipelines[interface_id]
                 if not pipeline.empty():
                     packet_data = pipeline.get()
-                    packet_bytes = packet_data[0]
-                    source_ip = packet_data[1]
-                    received_packet = packet.Packet.unpack_packet(packet_bytes)
-                    interface_pipeline = self.interfaces[interface_id][area.PIPELINE]
-                    interface_pipeline.put([received_packet, source_ip])
+                    self.deliver_packet(interface_id, packet_data[0], packet_data[1])
 
             #  Remove extension LSAs with MaxAge
             lsa_list = self.extension_database.get_extension_lsdb(None)
@@ -316,7 +330,8 @@ class Router:
                                     prefix_length = utils.Utils.prefix_to_prefix_length(link_info[1])
                                     options = node_lsa.header.options
                                     intra_area_table.add_entry(
-                                        conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, area_id)
+                                        conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, area_id,
+                                        validate=False)
                                     #  Root to router + router to prefix
                                     cost = shortest_path_tree[node_id][0] + link_info[4]
                                     prefixes_with_costs[node_id][prefix] = [cost]
@@ -327,7 +342,8 @@ class Router:
                                         network_lsa.body.network_mask)
                                     options = network_lsa.header.options
                                     intra_area_table.add_entry(
-                                        conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, area_id)
+                                        conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, area_id,
+                                        validate=False)
                                     cost = shortest_path_tree[node_id][0]  # Root to network
                                     prefixes_with_costs[node_id][prefix] = [cost]
                     elif self.ospf_version == conf.VERSION_IPV6:
@@ -339,7 +355,8 @@ class Router:
                                 if prefix_info[3] == prefix:
                                     prefix_length = prefix_info[0]
                                     intra_area_table.add_entry(
-                                        conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, area_id)
+                                        conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, area_id,
+                                        validate=False)
                                     #  Root to router + router to prefix
                                     cost = shortest_path_tree[node_id][0] + prefix_info[2]
                                     prefixes_with_costs[node_id][prefix] = [cost]
@@ -358,7 +375,8 @@ class Router:
                                 if prefix_info[3] == prefix:
                                     prefix_length = prefix_info[0]
                                     intra_area_table.add_entry(
-                                        conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, area_id)
+                                        conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, area_id,
+                                        validate=False)
                                     cost = shortest_path_tree[node_id][0]  # Root to network
                                     prefixes_with_costs[node_id][prefix] = [cost]
                     else:
@@ -499,7 +517,7 @@ class Router:
                         elif cost > routing_table_entry.paths[0].cost:
                             continue
                     routing_table_entry.add_path(
-                        conf.INTRA_AREA_PATH, cost, 0, outgoing_interface, next_hop_address, '')
+                        conf.INTRA_AREA_PATH, cost, 0, outgoing_interface, next_hop_address, '', validate=False)
 
         return intra_area_table
 
@@ -547,8 +565,7 @@ class Router:
                         query_lsa.header.ls_sequence_number = lsa.Lsa.get_next_ls_sequence_number(
                             query_lsa.header.ls_sequence_number)
                         query_lsa.body.metric = entry.paths[0].cost
-                        query_lsa.set_lsa_length()
-                        query_lsa.set_lsa_checksum()
+                        query_lsa.finalize_lsa()
                         lsa_list.append(query_lsa)
 
         #  Creating LSAs that advertise new area-external prefixes
@@ -661,8 +678,7 @@ class Router:
                     own_abr_lsa.header.ls_age = conf.INITIAL_LS_AGE
                     own_abr_lsa.header.ls_sequence_number = lsa.Lsa.get_next_ls_sequence_number(
                         own_abr_lsa.header.ls_sequence_number)
-                own_abr_lsa.set_lsa_length()
-                own_abr_lsa.set_lsa_checksum()
+                own_abr_lsa.finalize_lsa()
                 updated_lsa_list.append(own_abr_lsa)
                 self.extension_database.add_extension_lsa(own_abr_lsa)
                 extension_lsdb_copy.add_extension_lsa(own_abr_lsa)
@@ -713,8 +729,7 @@ class Router:
                     own_prefix_lsa.header.ls_age = conf.INITIAL_LS_AGE
                     own_prefix_lsa.header.ls_sequence_number = lsa.Lsa.get_next_ls_sequence_number(
                         own_prefix_lsa.header.ls_sequence_number)
-                own_prefix_lsa.set_lsa_length()
-                own_prefix_lsa.set_lsa_checksum()
+                own_prefix_lsa.finalize_lsa()
                 updated_lsa_list.append(own_prefix_lsa)
                 self.extension_database.add_extension_lsa(own_prefix_lsa)
                 extension_lsdb_copy.add_extension_lsa(own_prefix_lsa)
@@ -747,8 +762,7 @@ class Router:
                         if not created_now:
                             own_abr_lsa.header.ls_sequence_number = lsa.Lsa.get_next_ls_sequence_number(
                                 own_abr_lsa.header.ls_sequence_number)
-                        own_abr_lsa.set_lsa_length()
-                        own_abr_lsa.set_lsa_checksum()
+                        own_abr_lsa.finalize_lsa()
                         updated_lsa_list.append(own_abr_lsa)
                         self.extension_database.add_extension_lsa(own_abr_lsa)
                         extension_lsdb_copy.add_extension_lsa(own_abr_lsa)
@@ -791,8 +805,7 @@ class Router:
                 if not created_now:
                     own_prefix_lsa.header.ls_sequence_number = lsa.Lsa.get_next_ls_sequence_number(
                         own_prefix_lsa.header.ls_sequence_number)
-                own_prefix_lsa.set_lsa_length()
-                own_prefix_lsa.set_lsa_checksum()
+                own_prefix_lsa.finalize_lsa()
                 updated_lsa_list.append(own_prefix_lsa)
                 self.extension_database.add_extension_lsa(own_prefix_lsa)
 
@@ -928,7 +941,7 @@ class Router:
                 options = conf.OPTIONS_V3
             prefix_area = abr_prefixes_dictionary[prefix][5]
             complete_routing_table.add_entry(
-                conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, prefix_area)
+                conf.DESTINATION_TYPE_NETWORK, prefix, prefix_length, options, prefix_area, validate=False)
             if prefix_area in self.area_ids:
                 path_type = conf.INTRA_AREA_PATH
             else:
@@ -937,7 +950,7 @@ class Router:
             outgoing_interface = abr_prefixes_dictionary[prefix][3]
             next_hop_address = abr_prefixes_dictionary[prefix][4]
             complete_routing_table.get_entry(conf.DESTINATION_TYPE_NETWORK, prefix, prefix_area).add_path(
-                path_type, cost, 0, outgoing_interface, next_hop_address, '')
+                path_type, cost, 0, outgoing_interface, next_hop_address, '', validate=False)
 
         return complete_routing_table
 
@@ -954,6 +967,10 @@ class Router:
                 kernel_table.KernelTable.add_ospf_route(
                     prefix, prefix_length, next_hop_address, outgoing_interface, interface_ids)
 
+    #  Returns copies of the LSAs in provided area LSDB originated by this router
+    def get_own_lsa_list(self, area_lsdb):
+        return area_lsdb.get_lsdb([], area_lsdb.get_lsa_identifiers([], 0, self.router_id))
+
     #  Creates paths in kernel routing table to all known prefixes in network
     #  Updates own extension LSAs and inter-area LSAs and floods changes as required
     #  Sets kernel routing table according to area LSDBs and extension LSDB
@@ -1021,9 +1038,8 @@ class Router:
                                     ls_update_packet.create_header_v2(
                                         conf.PACKET_TYPE_LS_UPDATE, self.router_id, area_id, 0, 0)
                                     ls_update_packet.create_ls_update_packet_body(conf.VERSION_IPV4)
-                                    for query_lsa in lsdb_dict[area_id].get_lsdb([], None):
-                                        if query_lsa.header.advertising_router == self.router_id:
-                                            ls_update_packet.add_lsa(query_lsa)
+                                    for query_lsa in self.get_own_lsa_list(lsdb_dict[area_id]):
+                                        ls_update_packet.add_lsa(query_lsa)
                                     for interface_id in self.areas[area_id].interfaces:
                                         self.areas[area_id].interfaces[interface_id][area.INTERFACE_OBJECT].send_packet(
                                             ls_update_packet, conf.ALL_OSPF_ROUTERS_IPV4, '')
@@ -1035,9 +1051,8 @@ class Router:
                                             conf.PACKET_TYPE_LS_UPDATE, self.router_id, area_id, 0, source_address,
                                             conf.ALL_OSPF_ROUTERS_IPV6)
                                         ls_update_packet.create_ls_update_packet_body(conf.VERSION_IPV6)
-                                        for query_lsa in lsdb_dict[area_id].get_lsdb([], None):
-                                            if query_lsa.header.advertising_router == self.router_id:
-                                                ls_update_packet.add_lsa(query_lsa)
+                                        for query_lsa in self.get_own_lsa_list(lsdb_dict[area_id]):
+                                            ls_update_packet.add_lsa(query_lsa)
                                         self.areas[area_id].interfaces[interface_id][area.INTERFACE_OBJECT].send_packet(
                                             ls_update_packet, conf.ALL_OSPF_ROUTERS_IPV6, '')
                             time.sleep(10)
@@ -1120,6 +1135,11 @@ class Router:
             print("\tNumber of interfaces in this area is", len(self.areas[a].interfaces))
             for i in self.areas[a].interfaces:
                 print("\t\t" + i)
+            print("\tNumber of LSA", self.areas[a].database.get_lsa_count(None))
+        for p in self.receiving_pipelines:
+            dropped_packets = self.receiving_pipelines[p].get_dropped()
+            if dropped_packets > 0:
+                print("Receiving process", p, "dropped", dropped_packets, "packets - Receiving buffer was full")
 
     #  Prints interface information
     def show_interface_data(self):
@@ -1144,8 +1164,12 @@ class Router:
                     cost = self.interfaces[i][0].cost
                     print("\tNetwork Type BROADCAST, Cost:", cost)
 
-                print("\tTimer intervals configured, Hello " + str(conf.HELLO_INTERVAL) + ", Dead",
-                      conf.ROUTER_DEAD_INTERVAL)
+                query_interface = self.interfaces[i][0]
+                hello_interval = str(query_interface.hello_interval)
+                if query_interface.hello_multiplier != 0:  # Minimal Hello mode
+                    hello_interval = str(round(query_interface.hello_timer_seconds * 1000)) + " msec"
+                print("\tTimer intervals configured, Hello " + hello_interval + ", Dead",
+                      query_interface.router_dead_interval)
                 if self.areas[a].is_interface_operating(i):
                     time_to_hello = self.interfaces[i][0].hello_timer.get_timer_time()
                     print("\t\tHello due in", str(datetime.timedelta(seconds=time_to_hello)))
@@ -1308,6 +1332,9 @@ class Router:
             self.socket_shutdown_events[s].set()
         for t in self.socket_processes:
             self.socket_processes[t].join()
+        for p in self.receiving_pipelines:
+            self.receiving_pipelines[p].close()
+            self.receiving_pipelines[p].unlink()
         kernel_table.KernelTable.delete_all_ospf_routes(self.ospf_version)
 
         try:
@@ -1327,6 +1354,12 @@ class Router:
     #  Auxiliary methods  #
     #  #  #  #  #  #  #  #
 
+    #  Decodes packet received from the network and sends it to the receiving interface
+    def deliver_packet(self, interface_id, packet_bytes, source_ip):
+        received_packet = packet.Packet.unpack_packet(packet_bytes)
+        interface_pipeline = self.interfaces[interface_id][area.PIPELINE]
+        interface_pipeline.put([received_packet, source_ip])
+
     #  Given a list, returns its unique values
     @staticmethod
     def get_unique_values(input_list):
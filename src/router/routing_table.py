@@ -18,6 +18,7 @@ path
 
 
 class RoutingTable:
+    __slots__ = ('entries',)
 
     def __init__(self):
         self.entries = []
@@ -29,10 +30,15 @@ class RoutingTable:
                 return entry
         return None
 
-    def add_entry(self, destination_type, destination_id, prefix_length, options, area):
+    #  Entry parameters are not validated if validate is False - Intended for values produced by the route calculation
+    def add_entry(self, destination_type, destination_id, prefix_length, options, area, validate=True):
         entry = self.get_entry(destination_type, destination_id, area)
         if entry is None:
-            entry = RoutingTableEntry(destination_type, destination_id, prefix_length, options, area)
+            if validate:
+                entry = RoutingTableEntry(destination_type, destination_id, prefix_length, options, area)
+            else:
+                entry = RoutingTableEntry.create_unchecked(
+                    destination_type, destination_id, prefix_length, options, area)
             self.entries.append(entry)
 
     def delete_entry(self, destination_type, destination_id, area):
@@ -56,11 +62,23 @@ class RoutingTable:
 
 
 class RoutingTableEntry:
+    __slots__ = ('destination_type', 'destination_id', 'prefix_length', 'options', 'area', 'paths')
 
     def __init__(self, destination_type, destination_id, prefix_length, options, area):
         is_valid, message = self.parameter_validation(destination_type, destination_id, prefix_length, options, area)
         if not is_valid:  # At least one of the parameters failed validation
             raise ValueError(message)
+        self.set_entry_fields(destination_type, destination_id, prefix_length, options, area)
+
+    #  Creates routing table entry from trusted values, skipping parameter validation
+    @staticmethod
+    def create_unchecked(destination_type, destination_id, prefix_length, options, area):
+        entry = RoutingTableEntry.__new__(RoutingTableEntry)
+        entry.set_entry_fields(destination_type, destination_id, prefix_length, options, area)
+        return entry
+
+    #  Sets entry fields without validating them
+    def set_entry_fields(self, destination_type, destination_id, prefix_length, options, area):
         self.destination_type = destination_type
         self.destination_id = destination_id
         self.prefix_length = prefix_length
@@ -75,13 +93,20 @@ class RoutingTableEntry:
                 return path
         return None
 
-    def add_path(self, path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router):
+    #  Path parameters are not validated if validate is False - Intended for values produced by the route calculation
+    def add_path(self, path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router,
+                 validate=True):
         warning = False
         if len(self.paths) > 0:
             if (self.paths[0].path_type != path_type) | (self.paths[0].cost != cost):
                 warnings.warn("All paths for same routing table entry must have same path type and cost")
                 warning = True
-        path = RoutingTablePath(path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router)
+        if validate:
+            path = RoutingTablePath(
+                path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router)
+        else:
+            path = RoutingTablePath.create_unchecked(
+                path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router)
         if (not warning) & (self.get_path(outgoing_interface, next_hop_address, advertising_router) is None):
             self.paths.append(path)
 
@@ -125,12 +150,24 @@ class RoutingTableEntry:
 
 
 class RoutingTablePath:
+    __slots__ = ('path_type', 'cost', 'type_2_cost', 'outgoing_interface', 'next_hop_address', 'advertising_router')
 
     def __init__(self, path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router):
         is_valid, message = self.parameter_validation(
             path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router)
         if not is_valid:  # At least one of the parameters failed validation
             raise ValueError(message)
+        self.set_path_fields(path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router)
+
+    #  Creates routing table path from trusted values, skipping parameter validation
+    @staticmethod
+    def create_unchecked(path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router):
+        path = RoutingTablePath.__new__(RoutingTablePath)
+        path.set_path_fields(path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router)
+        return path
+
+    #  Sets path fields without validating them
+    def set_path_fields(self, path_type, cost, type_2_cost, outgoing_interface, next_hop_address, advertising_router):
         self.path_type = path_type
         self.cost = cost
         self.type_2_cost = type_2_cost
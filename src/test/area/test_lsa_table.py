@@ -0,0 +1,188 @@
+import unittest
+import copy
+import time
+
+import conf.conf as conf
+import area.lsa_table as lsa_table
+import lsa.header as header
+import test.benchmark.message_generator as message_generator
+
+'''
+This class tests the columnar table with the header fields of the LSAs in an area LSDB
+'''
+
+SEED = 7
+#  Tables below the threshold are scanned in pure Python, the others with NumPy if it is available
+TABLE_SIZES = [10, lsa_table.NUMPY_TABLE_THRESHOLD + 36]
+ROUTER_ID = '1.1.1.1'
+
+
+#  Full successful run - Instant
+class TestLsaTable(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = message_generator.get_generator(SEED)
+
+    #  Successful run - Instant
+    def test_add_delete_lsa(self):
+        table = lsa_table.LsaTable()
+        lsa_list = self.create_lsa_list(4)
+        for query_lsa in lsa_list:
+            table.add_lsa(TestLsaTable.get_key(query_lsa), query_lsa)
+        self.assertEqual(4, len(table))
+        self.check_table(table, lsa_list)
+
+        #  Row is updated with the new instance of the LSA
+        new_instance = copy.deepcopy(lsa_list[1])
+        new_instance.header.ls_sequence_number = 0x80000001
+        new_instance.header.ls_age = 5
+        table.add_lsa(TestLsaTable.get_key(new_instance), new_instance)
+        lsa_list[1] = new_instance
+        self.assertEqual(4, len(table))
+        self.check_table(table, lsa_list)
+        self.assertEqual(-0x7FFFFFFF, table.columns['ls_sequence_number'][table.rows[TestLsaTable.get_key(
+            new_instance)]])
+
+        #  Last row takes the place of the deleted one
+        table.delete_lsa(TestLsaTable.get_key(lsa_list[0]))
+        self.assertEqual(3, len(table))
+        self.assertEqual(TestLsaTable.get_key(lsa_list[3]), table.keys[0])
+        self.check_table(table, lsa_list[1:])
+        table.delete_lsa(TestLsaTable.get_key(lsa_list[0]))
+        self.assertEqual(3, len(table))
+        table.delete_lsa(TestLsaTable.get_key(lsa_list[2]))
+        table.delete_lsa(TestLsaTable.get_key(lsa_list[1]))
+        table.delete_lsa(TestLsaTable.get_key(lsa_list[3]))
+        self.assertEqual(0, len(table))
+        self.assertEqual({}, table.rows)
+        for name in lsa_table.COLUMNS:
+            self.assertEqual(0, len(table.columns[name]))
+
+    #  Successful run - Instant
+    def test_update_ls_ages(self):
+        for table_size in TABLE_SIZES:
+            current_time = time.perf_counter()
+            lsa_list = self.create_lsa_list(table_size)
+            for query_lsa in lsa_list:
+                query_lsa.system_time = current_time - self.generator.uniform(0, 2 * conf.MAX_AGE)
+            table = TestLsaTable.create_table(lsa_list)
+            changed_rows = dict(table.update_ls_ages(current_time))
+            for query_lsa in lsa_list:
+                ls_age = min(query_lsa.header.ls_age + int(current_time - query_lsa.system_time), conf.MAX_AGE)
+                row = table.rows[TestLsaTable.get_key(query_lsa)]
+                self.assertEqual(ls_age, table.columns['ls_age'][row])
+                if ls_age != query_lsa.header.ls_age:
+                    self.assertEqual(ls_age, changed_rows[TestLsaTable.get_key(query_lsa)])
+                else:
+                    self.assertNotIn(TestLsaTable.get_key(query_lsa), changed_rows)
+            self.assertEqual([], table.update_ls_ages(current_time))  # No LS Age changed since previous call
+            changed_rows = dict(table.update_ls_ages(current_time + 1))
+            for lsa_key in table.keys:
+                ls_age = table.columns['ls_age'][table.rows[lsa_key]]
+                if ls_age < conf.MAX_AGE:
+                    self.assertEqual(ls_age, changed_rows[lsa_key])
+                else:
+                    self.assertNotIn(lsa_key, changed_rows)
+
+    #  Successful run - Instant
+    def test_get_keys(self):
+        for table_size in TABLE_SIZES:
+            lsa_list = self.create_lsa_list(table_size)
+            table = TestLsaTable.create_table(lsa_list)
+            for minimum_ls_age in [0, conf.LS_REFRESH_TIME, conf.MAX_AGE]:
+                for advertising_router in [None, ROUTER_ID]:
+                    expected_keys = []
+                    for query_lsa in lsa_list:
+                        if (query_lsa.header.ls_age >= minimum_ls_age) & (
+                                (advertising_router is None) | (query_lsa.header.advertising_router == ROUTER_ID)):
+                            expected_keys.append(TestLsaTable.get_key(query_lsa))
+                    self.assertEqual(sorted(expected_keys), sorted(table.get_keys(minimum_ls_age, advertising_router)))
+            self.assertNotEqual(0, len(table.get_keys(0, ROUTER_ID)))
+            self.assertNotEqual(0, len(table.get_keys(conf.MAX_AGE, None)))
+
+    #  Successful run - Instant
+    def test_get_lsa_count(self):
+        for table_size in TABLE_SIZES:
+            lsa_list = self.create_lsa_list(table_size)
+            table = TestLsaTable.create_table(lsa_list)
+            self.assertEqual(table_size, table.get_lsa_count(None))
+            for ls_type in [conf.LSA_TYPE_ROUTER, conf.LSA_TYPE_NETWORK, conf.LSA_TYPE_INTRA_AREA_PREFIX]:
+                expected_count = 0
+                for query_lsa in lsa_list:
+                    if header.Header.get_ls_type(query_lsa.header.ls_type) == ls_type:
+                        expected_count += 1
+                self.assertEqual(expected_count, table.get_lsa_count(ls_type))
+                self.assertEqual(expected_count, table.get_lsa_count(ls_type + 0x2000))  # S1 and S2 bits are ignored
+
+    #  Successful run - Instant
+    def test_get_fresher_positions(self):
+        for table_size in TABLE_SIZES:
+            lsa_list = self.create_lsa_list(table_size)
+            table = TestLsaTable.create_table(lsa_list[:table_size // 2])  # Other half of LSAs is not in table
+
+            #  Received instances differ from stored ones in Sequence Number, checksum or LS Age
+            lsa_headers = []
+            for query_lsa in lsa_list:
+                lsa_header = copy.copy(query_lsa.header)
+                field = self.generator.randint(0, 3)
+                if field == 0:
+                    lsa_header.ls_sequence_number = self.generator.choice([
+                        0x80000001, 0x7FFFFFFF, 0, (lsa_header.ls_sequence_number + 1) & conf.MAX_VALUE_32_BITS])
+                    if lsa_header.ls_sequence_number == 0x80000000:
+                        lsa_header.ls_sequence_number = 0x80000001
+                elif field == 1:
+                    lsa_header.ls_checksum = self.generator.randint(0, conf.MAX_VALUE_16_BITS)
+                elif field == 2:
+                    lsa_header.ls_age = self.generator.choice([0, conf.MAX_AGE_DIFF, conf.MAX_AGE - 1, conf.MAX_AGE])
+                lsa_headers.append(lsa_header)
+            keys = [TestLsaTable.get_key(query_lsa) for query_lsa in lsa_list]
+
+            expected_positions = []
+            for position in range(len(lsa_list)):
+                if position >= table_size // 2:
+                    expected_positions.append(position)
+                elif header.Header.get_fresher_lsa_header(
+                        lsa_headers[position], lsa_list[position].header) == header.FIRST:
+                    expected_positions.append(position)
+            self.assertEqual(expected_positions, table.get_fresher_positions(keys, lsa_headers))
+            self.assertNotEqual(len(lsa_list), len(expected_positions))
+            self.assertNotEqual(table_size - table_size // 2, len(expected_positions))
+
+    #  Returns LSAs with random header fields, some of them originated by this router and some of them with MaxAge
+    def create_lsa_list(self, lsa_number):
+        lsa_list = []
+        for i in range(lsa_number):
+            new_lsa = message_generator.create_random_lsa(self.generator, 1, conf.VERSION_IPV6)
+            new_lsa.header.link_state_id = '0.0.0.' + str(i)  # Ensures every LSA has a different key
+            if i % 3 == 0:
+                new_lsa.header.advertising_router = ROUTER_ID
+            if i % 4 == 0:
+                new_lsa.header.ls_age = conf.MAX_AGE
+            lsa_list.append(new_lsa)
+        return lsa_list
+
+    #  Asserts that table rows match the header fields of provided LSAs
+    def check_table(self, table, lsa_list):
+        for query_lsa in lsa_list:
+            row = table.rows[TestLsaTable.get_key(query_lsa)]
+            self.assertEqual(TestLsaTable.get_key(query_lsa), table.keys[row])
+            self.assertEqual(query_lsa.header.ls_type, table.columns['ls_type'][row])
+            self.assertEqual(query_lsa.header.ls_checksum, table.columns['ls_checksum'][row])
+            self.assertEqual(query_lsa.header.ls_age, table.columns['ls_age'][row])
+            self.assertEqual(query_lsa.system_time, table.columns['installation_time'][row])
+
+    @staticmethod
+    def create_table(lsa_list):
+        table = lsa_table.LsaTable()
+        for query_lsa in lsa_list:
+            table.add_lsa(TestLsaTable.get_key(query_lsa), query_lsa)
+        return table
+
+    @staticmethod
+    def get_key(query_lsa):
+        return header.Header.get_ls_type(query_lsa.header.ls_type), query_lsa.header.link_state_id, \
+               query_lsa.header.advertising_router
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import queue
 import threading
 import time
+import copy
 
 import conf.conf as conf
 import general.utils as utils
@@ -114,6 +115,9 @@ class TestLsdb(unittest.TestCase):
         self.assertIsNone(retrieved_lsa)
         retrieved_lsa = self.lsdb_ospfv2.get_lsa(1, '1.1.1.1', '1.1.1.1', [self.interface_ospfv2])
         self.assertEqual(1, retrieved_lsa.header.ls_type)
+        retrieved_lsa.header.ls_age = 100  # Returned LSA is a copy
+        self.assertEqual(0, self.lsdb_ospfv2.get_lsa(1, '1.1.1.1', '1.1.1.1', []).header.ls_age)
+        self.assertIsNone(self.lsdb_ospfv2.get_lsa(2, '1.1.1.1', '1.1.1.1', []))
         self.assertFalse(self.lsdb_ospfv2.is_modified.is_set())
 
         retrieved_lsa = self.lsdb_ospfv3.get_lsa(8, '0.0.0.0', '0.0.0.0', [self.interface_ospfv3])
@@ -320,6 +324,90 @@ class TestLsdb(unittest.TestCase):
         self.assertTrue(self.lsdb_ospfv3.is_modified.is_set())
         self.lsdb_ospfv3.is_modified.clear()
 
+    #  Successful run - Instant
+    def test_lsa_index(self):
+        self.lsdb_ospfv3.add_lsa(self.lsa_ospfv3_1, None)
+        self.lsdb_ospfv3.add_lsa(self.lsa_ospfv3_2, None)
+        self.lsdb_ospfv3.add_lsa(self.lsa_ospfv3_4, self.interface_ospfv3)
+        self.assertEqual(2, len(self.lsdb_ospfv3.lsa_index))
+        self.assertIs(self.lsa_ospfv3_1, self.lsdb_ospfv3.lsa_index[(1, '0.0.0.0', '2.2.2.2')])
+        self.assertIs(self.lsa_ospfv3_2, self.lsdb_ospfv3.lsa_index[(2, '0.0.0.5', '2.2.2.2')])
+
+        #  Returned headers are copies, and the LS Type must match the one of the stored LSA including S1 and S2 bits
+        retrieved_headers = self.lsdb_ospfv3.get_lsa_headers(
+            [self.interface_ospfv3], [[0x2001, '0.0.0.0', '2.2.2.2'], [1, '0.0.0.5', '2.2.2.2'],
+                                      [8, '0.0.0.4', '1.1.1.1']])
+        self.assertEqual(2, len(retrieved_headers))
+        self.assertEqual(0x2001, retrieved_headers[0].ls_type)
+        self.assertEqual(8, retrieved_headers[1].ls_type)
+        self.assertIsNot(self.lsa_ospfv3_1.header, retrieved_headers[0])
+        self.assertIsNot(self.lsa_ospfv3_4.header, retrieved_headers[1])
+        retrieved_headers[0].ls_age = conf.MAX_AGE
+        self.assertEqual(0, self.lsdb_ospfv3.get_lsa_header(1, '0.0.0.0', '2.2.2.2', []).ls_age)
+        self.assertIsNot(self.lsa_ospfv3_1.header, self.lsdb_ospfv3.get_lsa_header(1, '0.0.0.0', '2.2.2.2', []))
+
+        #  Stored LSA is aged in place, so index returns its current header
+        self.lsa_ospfv3_1.set_ls_age_max()
+        self.assertEqual(conf.MAX_AGE, self.lsdb_ospfv3.get_lsa_header(0x2001, 0, '2.2.2.2', []).ls_age)
+
+        #  Index follows LSA replacement, deletion and LSDB cleaning
+        lsa_ospfv3_5 = lsa.Lsa()
+        lsa_ospfv3_5.create_header(1, 0, 1, '0.0.0.0', '2.2.2.2', 10000, conf.VERSION_IPV6)
+        lsa_ospfv3_5.create_router_lsa_body(False, False, False, 51, conf.VERSION_IPV6)
+        self.lsdb_ospfv3.add_lsa(lsa_ospfv3_5, None)
+        self.assertEqual(2, len(self.lsdb_ospfv3.lsa_index))
+        self.assertEqual(10000, self.lsdb_ospfv3.get_lsa_header(1, '0.0.0.0', '2.2.2.2', []).ls_sequence_number)
+        self.lsdb_ospfv3.delete_lsa(0x2002, '0.0.0.5', '2.2.2.2', [])
+        self.assertEqual(1, len(self.lsdb_ospfv3.lsa_index))
+        self.assertIsNone(self.lsdb_ospfv3.get_lsa_header(2, '0.0.0.5', '2.2.2.2', []))
+        self.assertEqual(0, len(self.lsdb_ospfv3.get_lsa_headers([], [[0x2002, '0.0.0.5', '2.2.2.2']])))
+        lsdb_copy = copy.deepcopy(self.lsdb_ospfv3)
+        self.assertEqual(1, len(lsdb_copy.lsa_index))
+        self.assertIs(lsdb_copy.router_lsa_list[0], lsdb_copy.lsa_index[(1, '0.0.0.0', '2.2.2.2')])
+        self.lsdb_ospfv3.clean_lsdb([self.interface_ospfv3])
+        self.assertEqual(0, len(self.lsdb_ospfv3.lsa_index))
+        self.assertEqual(0, len(self.lsdb_ospfv3.get_lsa_headers([self.interface_ospfv3], None)))
+        self.assertEqual(1, len(lsdb_copy.get_lsa_headers([], None)))
+
+    #  Successful run - Instant
+    def test_lsa_table_queries(self):
+        self.populate_lsdb()
+        self.lsa_ospfv3_2.set_ls_age_max()
+        self.lsdb_ospfv3.build_lsa_index()
+
+        #  LSAs by LS Age and Advertising Router
+        self.assertEqual([[0x2002, '0.0.0.5', '2.2.2.2']],
+                         self.lsdb_ospfv3.get_lsa_identifiers([self.interface_ospfv3], conf.MAX_AGE, None))
+        self.assertEqual(4, len(self.lsdb_ospfv3.get_lsa_identifiers([self.interface_ospfv3], 0, None)))
+        self.assertEqual([[8, '0.0.0.4', '1.1.1.1']],
+                         self.lsdb_ospfv3.get_lsa_identifiers([self.interface_ospfv3], 0, '1.1.1.1'))
+        self.assertEqual([], self.lsdb_ospfv3.get_lsa_identifiers([], 0, '1.1.1.1'))
+        own_lsa_list = self.lsdb_ospfv2.get_lsdb([], self.lsdb_ospfv2.get_lsa_identifiers([], 0, '1.1.1.1'))
+        self.assertEqual(1, len(own_lsa_list))
+        self.assertEqual(self.lsa_ospfv2_1.pack_lsa(), own_lsa_list[0].pack_lsa())
+        self.assertIsNot(self.lsa_ospfv2_1, own_lsa_list[0])
+
+        #  LSA count
+        self.assertEqual(2, self.lsdb_ospfv2.get_lsa_count(None))
+        self.assertEqual(1, self.lsdb_ospfv2.get_lsa_count(conf.LSA_TYPE_NETWORK))
+        self.assertEqual(0, self.lsdb_ospfv2.get_lsa_count(conf.LSA_TYPE_SUMMARY_TYPE_3))
+        self.assertEqual(3, self.lsdb_ospfv3.get_lsa_count(None))  # Link-LSAs are stored in the interface
+        self.assertEqual(1, self.lsdb_ospfv3.get_lsa_count(0x2009))
+
+        #  Received LSA headers fresher than LSDB instance
+        newer_header = copy.copy(self.lsa_ospfv2_1.header)
+        newer_header.ls_sequence_number += 1
+        older_header = copy.copy(self.lsa_ospfv2_2.header)
+        older_header.ls_sequence_number -= 1
+        unknown_header = copy.copy(self.lsa_ospfv2_2.header)
+        unknown_header.link_state_id = '222.222.4.2'
+        lsa_headers = [newer_header, older_header, copy.copy(self.lsa_ospfv2_2.header), unknown_header]
+        self.assertEqual([newer_header, unknown_header], self.lsdb_ospfv2.get_fresher_lsa_headers(lsa_headers))
+        max_age_header = copy.copy(self.lsa_ospfv3_1.header)
+        max_age_header.ls_age = conf.MAX_AGE
+        self.assertEqual([max_age_header], self.lsdb_ospfv3.get_fresher_lsa_headers(
+            [max_age_header, copy.copy(self.lsa_ospfv3_2.header)]))
+
     #  Successful run - 2 s
     def test_increase_lsa_age(self):
         self.populate_lsdb()
@@ -344,6 +432,17 @@ class TestLsdb(unittest.TestCase):
             for query_lsa in query_lsdb:
                 self.assertEqual(2, query_lsa.header.ls_age)
 
+    #  Successful run - Instant
+    def test_add_lsa_ls_age(self):
+        #  Installed LSA keeps aging from the time its LS Age was last set, not from its installation time
+        self.lsa_ospfv2_1.header.ls_age = 10
+        self.lsa_ospfv2_1.system_time = time.perf_counter() - 5.5
+        self.lsdb_ospfv2.add_lsa(self.lsa_ospfv2_1, None)
+        self.lsdb_ospfv2.increase_lsa_age([])
+        self.assertEqual(15, self.lsdb_ospfv2.get_lsa(
+            self.lsa_ospfv2_1.header.ls_type, self.lsa_ospfv2_1.header.link_state_id,
+            self.lsa_ospfv2_1.header.advertising_router, []).header.ls_age)
+
     def populate_lsdb(self):
         self.lsdb_ospfv2.router_lsa_list.append(self.lsa_ospfv2_1)
         self.lsdb_ospfv2.network_lsa_list.append(self.lsa_ospfv2_2)
@@ -351,6 +450,8 @@ class TestLsdb(unittest.TestCase):
         self.lsdb_ospfv3.network_lsa_list.append(self.lsa_ospfv3_2)
         self.lsdb_ospfv3.intra_area_prefix_lsa_list.append(self.lsa_ospfv3_3)
         self.interface_ospfv3.link_local_lsa_list.append(self.lsa_ospfv3_4)
+        self.lsdb_ospfv2.build_lsa_index()
+        self.lsdb_ospfv3.build_lsa_index()
 
 
 if __name__ == '__main__':
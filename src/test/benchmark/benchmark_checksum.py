@@ -0,0 +1,30 @@
+import timeit
+import os
+
+import general.utils as utils
+
+'''
+This script measures the time taken to compute the OSPF packet and LSA checksums for typical message sizes
+Run from the "src" directory with "python -m test.benchmark.benchmark_checksum"
+'''
+
+MESSAGE_SIZES = [44, 576, 1500, 9000, 65535]  # Bytes
+REPETITIONS = 1000
+
+
+#  Prints the average time in microseconds taken to compute the checksum of a message with each of the sizes
+def main():
+    print("NumPy available:", utils.numpy is not None)
+    for size in MESSAGE_SIZES:
+        message = os.urandom(size)
+        ospfv2_time = timeit.timeit(lambda: utils.Utils.create_checksum_ospfv2(message), number=REPETITIONS)
+        ospfv3_time = timeit.timeit(lambda: utils.Utils.create_checksum_ospfv3(
+            message, 'fe80::1', 'ff02::5'), number=REPETITIONS)
+        fletcher_time = timeit.timeit(lambda: utils.Utils.create_fletcher_checksum(message), number=REPETITIONS)
+        print("{} bytes - OSPFv2: {:.2f} us - OSPFv3: {:.2f} us - Fletcher: {:.2f} us".format(
+            size, ospfv2_time / REPETITIONS * 1000000, ospfv3_time / REPETITIONS * 1000000,
+            fletcher_time / REPETITIONS * 1000000))
+
+
+if __name__ == '__main__':
+    main()
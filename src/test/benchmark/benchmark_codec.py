@@ -0,0 +1,114 @@
+import timeit
+import tracemalloc
+import sys
+
+import lsa.lsa as lsa
+import packet.packet as packet
+import general.utils as utils
+import conf.conf as conf
+import test.benchmark.message_generator as message_generator
+
+'''
+This script measures the throughput of the LSA and packet codecs, and of the checksums computed over their byte streams,
+for every LSA type and every packet type of both OSPF versions with a growing number of records
+Encoding includes setting length and checksum, and decoding includes the bodies of LSAs carried in LS Updates
+Allocations are the memory blocks still held by the decoded object and the peak memory used while decoding it
+Run from the "src" directory with "python -m test.benchmark.benchmark_codec"
+'''
+
+SEED = 1
+RECORD_NUMBERS = [1, 10, 100]  # Links, prefixes, routers, LSA headers, LSA identifiers or LSAs in each message
+MEGABYTE = 1000000
+
+
+#  Returns operations per second of the provided function, timed for at least 0.2 s
+def get_rate(function):
+    number, total_time = timeit.Timer(function).autorange()
+    return number / total_time
+
+
+#  Returns memory blocks held by the result of the provided function, and peak memory in bytes used while running it
+def get_allocations(function):
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    result = function()
+    blocks = sys.getallocatedblocks() - blocks_before
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return blocks, peak
+
+
+#  Prints encode, decode and checksum throughput, and decode allocations, of one message
+def print_results(name, message_length, encode, decode, checksum):
+    encode_rate = get_rate(encode)
+    decode_rate = get_rate(decode)
+    checksum_rate = get_rate(checksum)
+    blocks, peak = get_allocations(decode)
+    print("{} ({} B) - Encode: {:.0f}/s {:.1f} MB/s - Decode: {:.0f}/s {:.1f} MB/s - Checksum: {:.1f} MB/s - "
+          "Decode allocations: {} blocks, {:.1f} KB peak".format(
+              name, message_length, encode_rate, encode_rate * message_length / MEGABYTE, decode_rate,
+              decode_rate * message_length / MEGABYTE, checksum_rate * message_length / MEGABYTE, blocks, peak / 1000))
+
+
+#  Measures LSA of the provided type - Fletcher checksum is computed over the LSA without the LS Age field
+def measure_lsa(generator, lsa_type_name, record_number, version):
+    new_lsa = message_generator.LSA_CREATORS[version][lsa_type_name](generator, record_number, version)
+    lsa_bytes = new_lsa.pack_lsa()
+    checksum_bytes = lsa_bytes[2:]
+
+    def encode():
+        new_lsa.finalize_lsa()
+        return new_lsa.pack_lsa()
+
+    def decode():
+        unpacked_lsa = lsa.Lsa.unpack_lsa(lsa_bytes, version)
+        unpacked_lsa.body
+        return unpacked_lsa
+
+    print_results("OSPFv{} {} x{}".format(version, lsa_type_name, record_number), len(lsa_bytes), encode, decode,
+                  lambda: utils.Utils.create_fletcher_checksum(checksum_bytes))
+
+
+#  Measures packet of the provided type - Internet checksum of OSPFv3 includes the IPv6 pseudo-header
+def measure_packet(generator, packet_type_name, record_number, version):
+    new_packet = message_generator.PACKET_CREATORS[packet_type_name](generator, record_number, version)
+    packet_bytes = new_packet.pack_packet()
+
+    def encode():
+        new_packet.is_finalized = False
+        return new_packet.pack_packet()
+
+    def decode():
+        unpacked_packet = packet.Packet.unpack_packet(packet_bytes)
+        if packet_type_name == 'LS Update':
+            for unpacked_lsa in unpacked_packet.body.lsa_list:
+                unpacked_lsa.body
+        return unpacked_packet
+
+    if version == conf.VERSION_IPV4:
+        def checksum():
+            return utils.Utils.create_checksum_ospfv2(packet_bytes)
+    else:
+        def checksum():
+            return utils.Utils.create_checksum_ospfv3(
+                packet_bytes, new_packet.source_ipv6_address, new_packet.destination_ipv6_address)
+
+    print_results("OSPFv{} {} x{}".format(version, packet_type_name, record_number), len(packet_bytes), encode,
+                  decode, checksum)
+
+
+def main():
+    print("NumPy available:", utils.numpy is not None)
+    generator = message_generator.get_generator(SEED)
+    for version in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+        for lsa_type_name in message_generator.LSA_CREATORS[version]:
+            for record_number in RECORD_NUMBERS:
+                measure_lsa(generator, lsa_type_name, record_number, version)
+        for packet_type_name in message_generator.PACKET_CREATORS:
+            for record_number in RECORD_NUMBERS:
+                measure_packet(generator, packet_type_name, record_number, version)
+
+
+if __name__ == '__main__':
+    main()
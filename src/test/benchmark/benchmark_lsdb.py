@@ -0,0 +1,58 @@
+import timeit
+import time
+
+import conf.conf as conf
+import area.lsa_table as lsa_table
+import area.lsdb as lsdb
+import test.benchmark.message_generator as message_generator
+
+'''
+This script measures the time taken by the scans of an area LSDB over its LSA table, for growing numbers of LSAs
+Aging writes only the LSAs whose LS Age changed, and MaxAge and self-originated LSAs are found without copying LSAs
+Run from the "src" directory with "python -m test.benchmark.benchmark_lsdb"
+'''
+
+SEED = 1
+LSA_NUMBERS = [100, 1000, 10000, 100000]
+REPETITIONS = 20
+ROUTER_ID = '1.1.1.1'
+
+
+#  Returns area LSDB with provided number of Router-LSAs, one in every 100 of them originated by this router
+def create_lsdb(generator, lsa_number):
+    area_lsdb = lsdb.Lsdb(conf.VERSION_IPV4, conf.BACKBONE_AREA)
+    for i in range(lsa_number):
+        new_lsa = message_generator.create_router_lsa(generator, 1, conf.VERSION_IPV4)
+        if i % 100 == 0:
+            new_lsa.header.advertising_router = ROUTER_ID
+        area_lsdb.router_lsa_list.append(new_lsa)
+    area_lsdb.build_lsa_index()
+    return area_lsdb
+
+
+#  Prints the average time in milliseconds taken by each LSDB scan
+def main():
+    print("NumPy available:", lsa_table.numpy is not None)
+    generator = message_generator.get_generator(SEED)
+    for lsa_number in LSA_NUMBERS:
+        area_lsdb = create_lsdb(generator, lsa_number)
+        area_lsdb.increase_lsa_age([])
+        aging_time = timeit.timeit(lambda: area_lsdb.increase_lsa_age([]), number=REPETITIONS)
+        max_age_time = timeit.timeit(lambda: area_lsdb.get_lsa_identifiers([], conf.MAX_AGE, None),
+                                     number=REPETITIONS)
+        own_lsa_time = timeit.timeit(lambda: area_lsdb.get_lsa_identifiers([], 0, ROUTER_ID), number=REPETITIONS)
+        count_time = timeit.timeit(lambda: area_lsdb.get_lsa_count(conf.LSA_TYPE_ROUTER), number=REPETITIONS)
+        lsa_headers = area_lsdb.get_lsa_headers([], None)[:1000]
+        fresher_time = timeit.timeit(lambda: area_lsdb.get_fresher_lsa_headers(lsa_headers), number=REPETITIONS)
+        start_time = time.perf_counter()
+        area_lsdb.get_lsdb([], None)
+        copy_time = time.perf_counter() - start_time
+        print("{} LSAs - Aging: {:.3f} ms - MaxAge: {:.3f} ms - Self-originated: {:.3f} ms - Count: {:.3f} ms - "
+              "Fresher of {} headers: {:.3f} ms - Full LSDB copy: {:.1f} ms".format(
+                  lsa_number, aging_time / REPETITIONS * 1000, max_age_time / REPETITIONS * 1000,
+                  own_lsa_time / REPETITIONS * 1000, count_time / REPETITIONS * 1000, len(lsa_headers),
+                  fresher_time / REPETITIONS * 1000, copy_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
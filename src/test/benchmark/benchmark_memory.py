@@ -0,0 +1,84 @@
+import tracemalloc
+
+import lsa.lsa as lsa
+import router.routing_table as routing_table
+import general.utils as utils
+import conf.conf as conf
+
+'''
+This script measures the memory taken by LSAs and routing table entries kept by the router
+Run from the "src" directory with "python -m test.benchmark.benchmark_memory"
+'''
+
+LSA_NUMBER = 10000
+LINKS_PER_LSA = 4
+ENTRY_NUMBER = 10000
+FIRST_ADDRESS = 0x0A000000  # 10.0.0.0
+
+
+#  Returns a list with the provided number of OSPFv2 Router-LSAs, each with distinct advertising router
+def create_router_lsas(lsa_number):
+    lsa_list = []
+    for i in range(lsa_number):
+        router_id = utils.Utils.decimal_to_ipv4(FIRST_ADDRESS + i + 1)
+        new_lsa = lsa.Lsa()
+        new_lsa.create_header(conf.INITIAL_LS_AGE, conf.OPTIONS_V2, conf.LSA_TYPE_ROUTER, router_id, router_id,
+                              conf.INITIAL_SEQUENCE_NUMBER, conf.VERSION_IPV4)
+        new_lsa.create_router_lsa_body(False, False, False, conf.OPTIONS_V2, conf.VERSION_IPV4)
+        with new_lsa.edit():
+            for j in range(LINKS_PER_LSA):
+                new_lsa.add_link_info_v2('222.222.' + str(j) + '.0', '255.255.255.0', conf.LINK_TO_STUB_NETWORK,
+                                         conf.DEFAULT_TOS, 10)
+        lsa_list.append(new_lsa)
+    return lsa_list
+
+
+#  Returns a list with the LSAs in the provided byte streams
+def unpack_lsas(lsa_bytes_list):
+    return [lsa.Lsa.unpack_lsa(lsa_bytes, conf.VERSION_IPV4) for lsa_bytes in lsa_bytes_list]
+
+
+#  Decodes the body of all provided LSAs
+def decode_lsa_bodies(lsa_list):
+    return [lsa_instance.body for lsa_instance in lsa_list]
+
+
+#  Returns a list with the provided number of routing table entries, each with one path
+def create_routing_table_entries(entry_number):
+    entry_list = []
+    for i in range(entry_number):
+        prefix = utils.Utils.decimal_to_ipv4(FIRST_ADDRESS + i)
+        entry = routing_table.RoutingTableEntry(conf.DESTINATION_TYPE_NETWORK, prefix, 32, 0, conf.BACKBONE_AREA)
+        entry.add_path(conf.INTRA_AREA_PATH, 10, 0, 'eth0', '192.0.2.1', '1.1.1.1')
+        entry_list.append(entry)
+    return entry_list
+
+
+#  Returns the memory in bytes still allocated after the provided function returns, and its result
+def measure(function, argument):
+    tracemalloc.start()
+    result = function(argument)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated, result
+
+
+#  Prints the average memory in bytes taken by each LSA and each routing table entry
+def main():
+    built_size, lsa_list = measure(create_router_lsas, LSA_NUMBER)
+    print("Built Router-LSA: {:.0f} bytes".format(built_size / LSA_NUMBER))
+
+    lsa_bytes_list = [lsa_instance.pack_lsa() for lsa_instance in lsa_list]
+    del lsa_list
+    received_size, lsa_list = measure(unpack_lsas, lsa_bytes_list)
+    print("Received Router-LSA: {:.0f} bytes".format(received_size / LSA_NUMBER))
+    decoded_size, _ = measure(decode_lsa_bodies, lsa_list)
+    print("Received Router-LSA with decoded body: {:.0f} bytes".format((received_size + decoded_size) / LSA_NUMBER))
+    del lsa_list
+
+    entry_size, _ = measure(create_routing_table_entries, ENTRY_NUMBER)
+    print("Routing table entry with one path: {:.0f} bytes".format(entry_size / ENTRY_NUMBER))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+import random
+
+import lsa.lsa as lsa
+import packet.packet as packet
+import general.utils as utils
+import conf.conf as conf
+
+'''
+This script creates valid OSPFv2 and OSPFv3 LSAs of every known type and packets of every type, with random field
+values and a chosen number of records, used by the codec benchmark and by the codec fuzz tests
+'''
+
+AREA = '0.0.0.0'
+MAX_METRIC = 0xFFFFFF  # 24-bit metric of the prefix LSAs
+LINK_LOCAL_PREFIX = 0xFE80 << 112
+
+
+#  Returns random OSPF Router ID - Address 0.0.0.0 is not a valid Router ID
+def random_router_id(generator):
+    return utils.Utils.decimal_to_ipv4(generator.randint(1, conf.MAX_VALUE_32_BITS))
+
+
+def random_ipv4_address(generator):
+    return utils.Utils.decimal_to_ipv4(generator.getrandbits(32))
+
+
+#  Returns random IPv4 network mask and random subnet address with that mask
+def random_ipv4_subnet(generator):
+    prefix_length = generator.randint(0, 32)
+    decimal_mask = (conf.MAX_VALUE_32_BITS << (32 - prefix_length)) & conf.MAX_VALUE_32_BITS
+    return [utils.Utils.decimal_to_ipv4(decimal_mask),
+            utils.Utils.decimal_to_ipv4(generator.getrandbits(32) & decimal_mask)]
+
+
+#  Returns random prefix length and random IPv6 prefix with that length - Bits beyond prefix length are not sent
+def random_ipv6_prefix(generator):
+    prefix_length = generator.randint(0, 128)
+    decimal_prefix = generator.getrandbits(128) >> (128 - prefix_length) << (128 - prefix_length)
+    return [prefix_length, utils.Utils.decimal_to_ipv6(decimal_prefix)]
+
+
+#  Returns random LS Sequence Number - 0x80000000 is reserved
+def random_sequence_number(generator):
+    ls_sequence_number = generator.getrandbits(32)
+    if ls_sequence_number == 0x80000000:
+        return conf.INITIAL_SEQUENCE_NUMBER
+    return ls_sequence_number
+
+
+#  Returns LSA with random header fields of the provided type, without body
+def create_lsa_with_header(generator, ls_type, link_state_id, version):
+    new_lsa = lsa.Lsa()
+    new_lsa.create_header(generator.randint(0, conf.MAX_AGE), conf.OPTIONS_V2 if version == conf.VERSION_IPV4 else 0,
+                          ls_type, link_state_id, random_router_id(generator),
+                          random_sequence_number(generator), version)
+    return new_lsa
+
+
+#  Returns extension LSA with random header fields of the provided type, without body
+def create_extension_lsa_with_header(generator, opaque_type, ls_type, version):
+    new_lsa = lsa.Lsa()
+    new_lsa.create_extension_header(generator.randint(0, conf.MAX_AGE), 0, opaque_type, ls_type,
+                                    random_router_id(generator),
+                                    random_sequence_number(generator), version)
+    return new_lsa
+
+
+#  #  #  #  #  #  #  #  #  #  #
+#  LSA creation, by LSA type  #
+#  #  #  #  #  #  #  #  #  #  #
+
+def create_router_lsa(generator, record_number, version):
+    if version == conf.VERSION_IPV4:
+        new_lsa = create_lsa_with_header(generator, conf.LSA_TYPE_ROUTER, random_router_id(generator), version)
+        new_lsa.create_router_lsa_body(False, bool(generator.getrandbits(1)), bool(generator.getrandbits(1)),
+                                       conf.OPTIONS_V2, version)
+        with new_lsa.edit():
+            for _ in range(record_number):
+                subnet_mask, subnet_address = random_ipv4_subnet(generator)
+                new_lsa.add_link_info_v2(subnet_address, subnet_mask, conf.LINK_TO_STUB_NETWORK, conf.DEFAULT_TOS,
+                                         generator.randint(1, conf.MAX_VALUE_16_BITS))
+    else:
+        new_lsa = create_lsa_with_header(generator, conf.LSA_TYPE_ROUTER, '0.0.0.0', version)
+        new_lsa.create_router_lsa_body(False, bool(generator.getrandbits(1)), bool(generator.getrandbits(1)),
+                                       conf.OPTIONS_V3, version)
+        with new_lsa.edit():
+            for _ in range(record_number):
+                new_lsa.add_link_info_v3(
+                    generator.choice([conf.POINT_TO_POINT_LINK, conf.LINK_TO_TRANSIT_NETWORK]),
+                    generator.randint(1, conf.MAX_VALUE_16_BITS), generator.getrandbits(32), generator.getrandbits(32),
+                    random_router_id(generator))
+    return new_lsa
+
+
+def create_network_lsa(generator, record_number, version):
+    attached_routers = [random_router_id(generator) for _ in range(record_number)]
+    if version == conf.VERSION_IPV4:
+        new_lsa = create_lsa_with_header(generator, conf.LSA_TYPE_NETWORK, random_ipv4_address(generator), version)
+        new_lsa.create_network_lsa_body(random_ipv4_subnet(generator)[0], 0, attached_routers, version)
+    else:
+        new_lsa = create_lsa_with_header(generator, conf.LSA_TYPE_NETWORK, random_ipv4_address(generator), version)
+        new_lsa.create_network_lsa_body('', conf.OPTIONS_V3, attached_routers, version)
+    return new_lsa
+
+
+#  Summary-LSAs of types 3 and 4 carry a single network, regardless of the number of records
+def create_summary_lsa(generator, record_number, version):
+    subnet_mask, subnet_address = random_ipv4_subnet(generator)
+    new_lsa = create_lsa_with_header(generator, generator.choice(
+        [conf.LSA_TYPE_SUMMARY_TYPE_3, conf.LSA_TYPE_SUMMARY_TYPE_4]), subnet_address, version)
+    new_lsa.create_summary_lsa_body(subnet_mask, generator.randint(0, MAX_METRIC))
+    return new_lsa
+
+
+#  Inter-Area-Prefix-LSAs carry a single prefix, regardless of the number of records
+def create_inter_area_prefix_lsa(generator, record_number, version):
+    prefix_length, prefix = random_ipv6_prefix(generator)
+    new_lsa = create_lsa_with_header(
+        generator, conf.LSA_TYPE_INTER_AREA_PREFIX, random_ipv4_address(generator), version)
+    new_lsa.create_inter_area_prefix_lsa_body(generator.randint(0, MAX_METRIC), prefix_length, 0, prefix)
+    return new_lsa
+
+
+def create_intra_area_prefix_lsa(generator, record_number, version):
+    new_lsa = create_lsa_with_header(
+        generator, conf.LSA_TYPE_INTRA_AREA_PREFIX, random_ipv4_address(generator), version)
+    new_lsa.create_intra_area_prefix_lsa_body(conf.LSA_TYPE_ROUTER, '0.0.0.0', random_router_id(generator))
+    with new_lsa.edit():
+        for _ in range(record_number):
+            prefix_length, prefix = random_ipv6_prefix(generator)
+            new_lsa.add_prefix_info(prefix_length, 0, generator.randint(0, conf.MAX_VALUE_16_BITS), prefix,
+                                    conf.LSA_TYPE_INTRA_AREA_PREFIX)
+    return new_lsa
+
+
+def create_link_lsa(generator, record_number, version):
+    new_lsa = create_lsa_with_header(generator, conf.LSA_TYPE_LINK, random_ipv4_address(generator), version)
+    link_local_address = utils.Utils.decimal_to_ipv6(LINK_LOCAL_PREFIX + generator.getrandbits(64))
+    new_lsa.create_link_lsa_body(generator.randint(0, conf.MAX_VALUE_8_BITS), conf.OPTIONS_V3, link_local_address)
+    with new_lsa.edit():
+        for _ in range(record_number):
+            prefix_length, prefix = random_ipv6_prefix(generator)
+            new_lsa.add_prefix_info(prefix_length, 0, 0, prefix, conf.LSA_TYPE_LINK)
+    return new_lsa
+
+
+def create_extension_abr_lsa(generator, record_number, version):
+    new_lsa = create_extension_lsa_with_header(
+        generator, conf.OPAQUE_TYPE_ABR_LSA, conf.LSA_TYPE_EXTENSION_ABR_LSA, version)
+    new_lsa.create_extension_abr_lsa_body()
+    with new_lsa.edit():
+        for _ in range(max(1, record_number)):  # LSA with empty body is rejected when received
+            new_lsa.add_abr_info(generator.randint(0, MAX_METRIC), random_router_id(generator))
+    return new_lsa
+
+
+def create_extension_prefix_lsa(generator, record_number, version):
+    new_lsa = create_extension_lsa_with_header(
+        generator, conf.OPAQUE_TYPE_PREFIX_LSA, conf.LSA_TYPE_EXTENSION_PREFIX_LSA, version)
+    new_lsa.create_extension_prefix_lsa_body(version)
+    with new_lsa.edit():
+        for _ in range(max(1, record_number)):
+            if version == conf.VERSION_IPV4:
+                subnet_mask, subnet_address = random_ipv4_subnet(generator)
+                new_lsa.add_subnet_info(generator.randint(0, MAX_METRIC), subnet_mask, subnet_address)
+            else:
+                prefix_length, prefix = random_ipv6_prefix(generator)
+                new_lsa.add_prefix_info_extension(generator.randint(0, MAX_METRIC), prefix_length, 0, prefix)
+    return new_lsa
+
+
+#  Functions creating each LSA type known by each OSPF version, by LSA type name
+LSA_CREATORS = {
+    conf.VERSION_IPV4: {'Router-LSA': create_router_lsa, 'Network-LSA': create_network_lsa,
+                        'Summary-LSA': create_summary_lsa, 'Extension ABR-LSA': create_extension_abr_lsa,
+                        'Extension Prefix-LSA': create_extension_prefix_lsa},
+    conf.VERSION_IPV6: {'Router-LSA': create_router_lsa, 'Network-LSA': create_network_lsa,
+                        'Inter-Area-Prefix-LSA': create_inter_area_prefix_lsa,
+                        'Intra-Area-Prefix-LSA': create_intra_area_prefix_lsa, 'Link-LSA': create_link_lsa,
+                        'Extension ABR-LSA': create_extension_abr_lsa,
+                        'Extension Prefix-LSA': create_extension_prefix_lsa}}
+
+
+#  Returns LSA of random known type for the provided OSPF version
+def create_random_lsa(generator, record_number, version):
+    return generator.choice(list(LSA_CREATORS[version].values()))(generator, record_number, version)
+
+
+#  #  #  #  #  #  #  #  #  #  #  #  #
+#  Packet creation, by packet type  #
+#  #  #  #  #  #  #  #  #  #  #  #  #
+
+#  Returns packet with random header fields of the provided type, without body
+def create_packet_with_header(generator, packet_type, version):
+    new_packet = packet.Packet()
+    if version == conf.VERSION_IPV4:
+        new_packet.create_header_v2(packet_type, random_router_id(generator), AREA, conf.NULL_AUTHENTICATION,
+                                    conf.DEFAULT_AUTH)
+    else:
+        new_packet.create_header_v3(packet_type, random_router_id(generator), AREA, 0, 'fe80::1',
+                                    conf.ALL_OSPF_ROUTERS_IPV6)
+    return new_packet
+
+
+def create_hello_packet(generator, record_number, version):
+    new_packet = create_packet_with_header(generator, conf.PACKET_TYPE_HELLO, version)
+    neighbors = [random_router_id(generator) for _ in range(record_number)]
+    designated_router = random_ipv4_address(generator)
+    backup_designated_router = random_ipv4_address(generator)
+    if version == conf.VERSION_IPV4:
+        new_packet.create_hello_v2_packet_body(
+            random_ipv4_subnet(generator)[0], conf.HELLO_INTERVAL, conf.OPTIONS_V2,
+            generator.randint(0, conf.MAX_VALUE_8_BITS), conf.ROUTER_DEAD_INTERVAL, designated_router,
+            backup_designated_router, neighbors)
+    else:
+        new_packet.create_hello_v3_packet_body(
+            generator.getrandbits(32), conf.HELLO_INTERVAL, conf.OPTIONS_V3,
+            generator.randint(0, conf.MAX_VALUE_8_BITS), conf.ROUTER_DEAD_INTERVAL, designated_router,
+            backup_designated_router, neighbors)
+    return new_packet
+
+
+def create_db_description_packet(generator, record_number, version):
+    new_packet = create_packet_with_header(generator, conf.PACKET_TYPE_DB_DESCRIPTION, version)
+    lsa_headers = tuple(create_random_lsa(generator, 0, version).header for _ in range(record_number))
+    options = conf.OPTIONS_V2 if version == conf.VERSION_IPV4 else conf.OPTIONS_V3
+    new_packet.create_db_description_packet_body(
+        conf.MTU, options, False, bool(generator.getrandbits(1)), bool(generator.getrandbits(1)),
+        generator.randint(0, conf.MAX_VALUE_32_BITS), lsa_headers, version)
+    return new_packet
+
+
+def create_ls_request_packet(generator, record_number, version):
+    new_packet = create_packet_with_header(generator, conf.PACKET_TYPE_LS_REQUEST, version)
+    new_packet.create_ls_request_packet_body(version)
+    for _ in range(max(1, record_number)):  # Packet with empty body is rejected when received
+        lsa_header = create_random_lsa(generator, 0, version).header
+        new_packet.add_lsa_info(lsa_header.ls_type, lsa_header.link_state_id, lsa_header.advertising_router)
+    return new_packet
+
+
+#  LS Update carries the provided number of LSAs, of random types and with up to 10 records each
+def create_ls_update_packet(generator, record_number, version):
+    new_packet = create_packet_with_header(generator, conf.PACKET_TYPE_LS_UPDATE, version)
+    new_packet.create_ls_update_packet_body(version)
+    for _ in range(record_number):
+        new_packet.add_lsa(create_random_lsa(generator, generator.randint(0, 10), version))
+    return new_packet
+
+
+def create_ls_acknowledgement_packet(generator, record_number, version):
+    new_packet = create_packet_with_header(generator, conf.PACKET_TYPE_LS_ACKNOWLEDGMENT, version)
+    new_packet.create_ls_acknowledgement_packet_body(version)
+    for _ in range(max(1, record_number)):
+        new_packet.add_lsa_header(create_random_lsa(generator, 0, version))
+    return new_packet
+
+
+#  Functions creating each packet type, by packet type name
+PACKET_CREATORS = {'Hello': create_hello_packet, 'Database Description': create_db_description_packet,
+                   'LS Request': create_ls_request_packet, 'LS Update': create_ls_update_packet,
+                   'LS Acknowledgment': create_ls_acknowledgement_packet}
+
+
+#  Returns random generator with the provided seed, so that created messages can be reproduced
+def get_generator(seed):
+    return random.Random(seed)
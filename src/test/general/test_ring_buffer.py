@@ -0,0 +1,117 @@
+import unittest
+import multiprocessing
+
+import general.ring_buffer as ring_buffer
+
+'''
+This class tests the shared memory ring buffer used between the receiving processes and the router
+'''
+
+PACKET_1 = b'\x02\x01\x00\x30' + bytes(range(44))
+PACKET_2 = b'\x03\x04\x00\x24' + bytes(range(32))
+SOURCE_IPV4_ADDRESS = '222.222.1.1'
+SOURCE_IPV6_ADDRESS = 'fe80::c001:18ff:fe34:10'
+INTERFACE = 'eth0'
+
+
+#  Full successful run - Instant
+class RingBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        self.buffer = ring_buffer.RingBuffer(1024)
+
+    #  Successful run - Instant
+    def test_put_get_successful(self):
+        self.assertTrue(self.buffer.empty())
+        self.assertEqual([], self.buffer.get())
+
+        self.assertEqual(2, self.buffer.put([[INTERFACE, PACKET_1, SOURCE_IPV4_ADDRESS],
+                                             ['eth1', PACKET_2, SOURCE_IPV6_ADDRESS]]))
+        self.assertFalse(self.buffer.empty())
+        batch = self.buffer.get()
+        self.assertTrue(self.buffer.empty())
+        self.assertEqual(2, len(batch))
+        self.assertEqual(INTERFACE, batch[0][0])
+        self.assertIsInstance(batch[0][1], memoryview)
+        self.assertEqual(PACKET_1, batch[0][1])
+        self.assertEqual(SOURCE_IPV4_ADDRESS, batch[0][2])
+        self.assertEqual(['eth1', PACKET_2, SOURCE_IPV6_ADDRESS], [batch[1][0], bytes(batch[1][1]), batch[1][2]])
+        batch = None
+        self.buffer.release()
+        self.assertEqual([], self.buffer.get())
+
+    #  Successful run - Instant
+    def test_full_buffer_and_wrap_around(self):
+        #  Unreleased records keep their space - Buffer eventually becomes full
+        written = 0
+        while self.buffer.put_packet(INTERFACE, PACKET_1, SOURCE_IPV4_ADDRESS):
+            written += 1
+        self.assertTrue(written > 0)
+        self.assertEqual(0, self.buffer.put([[INTERFACE, PACKET_1, SOURCE_IPV4_ADDRESS]]))
+        self.assertEqual(0, self.buffer.get_dropped())
+        self.buffer.add_dropped(1)
+        self.buffer.add_dropped(2)
+        self.assertEqual(3, self.buffer.get_dropped())
+        self.assertEqual(written, len(self.buffer.get()))
+        self.buffer.release()
+
+        #  Records written across the end of the buffer are read back intact
+        for i in range(10 * written):
+            packet_bytes = PACKET_2 + bytes([i % 256]) * (i % 7)
+            self.assertTrue(self.buffer.put_packet(INTERFACE, packet_bytes, SOURCE_IPV6_ADDRESS))
+            batch = self.buffer.get()
+            self.assertEqual(1, len(batch))
+            self.assertEqual(packet_bytes, batch[0][1])
+            batch = None
+            self.buffer.release()
+
+    #  Successful run - Instant
+    def test_large_packets(self):
+        #  Packet larger than the buffer is dropped instead of raising an error
+        self.assertFalse(self.buffer.put_packet(INTERFACE, bytes(2048), SOURCE_IPV4_ADDRESS))
+        self.assertEqual(1, self.buffer.put([[INTERFACE, bytes(2048), SOURCE_IPV4_ADDRESS],
+                                             [INTERFACE, PACKET_1, SOURCE_IPV4_ADDRESS]]))
+        self.assertEqual(PACKET_1, self.buffer.get()[0][1])
+        self.buffer.release()
+
+        #  Largest IPv4 datagram fits in a large enough buffer
+        large_buffer = ring_buffer.RingBuffer(0x20000)
+        self.assertTrue(large_buffer.put_packet(INTERFACE, bytes(0xFFFF), SOURCE_IPV4_ADDRESS))
+        batch = large_buffer.get()
+        self.assertEqual(0xFFFF, len(batch[0][1]))
+        batch = None
+        large_buffer.close()
+        large_buffer.unlink()
+
+    #  Successful run - Instant
+    def test_other_process(self):
+        process = multiprocessing.Process(target=RingBufferTest.produce, args=(self.buffer, 10))
+        process.start()
+        process.join()
+        batch = self.buffer.get()
+        self.assertEqual(10, len(batch))
+        self.assertEqual(1, self.buffer.get_dropped())
+        for i in range(10):
+            self.assertEqual([INTERFACE, PACKET_1 + bytes([i]), SOURCE_IPV4_ADDRESS],
+                             [batch[i][0], bytes(batch[i][1]), batch[i][2]])
+        batch = None
+        self.buffer.release()
+
+    #  Successful run - Instant
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            ring_buffer.RingBuffer(0)
+
+    @staticmethod
+    def produce(buffer, packet_number):
+        for i in range(packet_number):
+            buffer.put_packet(INTERFACE, PACKET_1 + bytes([i]), SOURCE_IPV4_ADDRESS)
+        buffer.add_dropped(1)
+
+    def tearDown(self):
+        self.buffer.close()
+        self.buffer.unlink()
+
+
+if __name__ == '__main__':
+    unittest.main()
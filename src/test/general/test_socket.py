@@ -1,5 +1,6 @@
 import unittest
 import timeout_decorator
+import socket
 import threading
 import queue
 import time
@@ -188,6 +189,31 @@ class SocketTest(unittest.TestCase):
             sock.Socket.receive_ipv6(sock.Socket(), self.pipeline, self.shutdown, '        ',
                                      self.accept_self_packets, is_dr, False)
 
+    #  Successful run - Instant
+    def test_receive_interfaces_invalid_parameters(self):
+        is_dr_events = {INTERFACE: threading.Event()}
+        with self.assertRaises(ValueError):
+            sock.Socket.receive_interfaces(sock.Socket(), None, self.shutdown, [INTERFACE], self.accept_self_packets,
+                                           is_dr_events, conf.VERSION_IPV4, False)
+        with self.assertRaises(ValueError):
+            sock.Socket.receive_interfaces(sock.Socket(), self.pipeline, None, [INTERFACE], self.accept_self_packets,
+                                           is_dr_events, conf.VERSION_IPV4, False)
+        with self.assertRaises(ValueError):
+            sock.Socket.receive_interfaces(sock.Socket(), self.pipeline, self.shutdown, None,
+                                           self.accept_self_packets, is_dr_events, conf.VERSION_IPV4, False)
+        with self.assertRaises(ValueError):
+            sock.Socket.receive_interfaces(sock.Socket(), self.pipeline, self.shutdown, [],
+                                           self.accept_self_packets, is_dr_events, conf.VERSION_IPV4, False)
+        with self.assertRaises(ValueError):
+            sock.Socket.receive_interfaces(sock.Socket(), self.pipeline, self.shutdown, ['        '],
+                                           self.accept_self_packets, is_dr_events, conf.VERSION_IPV4, False)
+        with self.assertRaises(ValueError):
+            sock.Socket.receive_interfaces(sock.Socket(), self.pipeline, self.shutdown, [INTERFACE],
+                                           self.accept_self_packets, {}, conf.VERSION_IPV4, False)
+        with self.assertRaises(ValueError):
+            sock.Socket.receive_interfaces(sock.Socket(), self.pipeline, self.shutdown, [INTERFACE],
+                                           self.accept_self_packets, is_dr_events, 1, False)
+
     #  Successful run - 10 s
     @timeout_decorator.timeout(TIMEOUT_SECONDS)
     def test_send_data_successful_ipv4(self):
@@ -305,6 +331,208 @@ class SocketTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             sock.Socket.send_ipv6(sock.Socket(), DATA_TO_SEND_OSPFV2, conf.ALL_OSPF_ROUTERS_IPV6, '        ', False)
 
+    #  Successful run - Instant
+    def test_drain_socket(self):
+        receiving_socket = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
+        receiving_socket.bind(('::1', 0))
+        receiving_socket.setblocking(False)
+        sending_socket = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
+        self.assertEqual([], sock.Socket.drain_socket(receiving_socket, 'lo', conf.VERSION_IPV6, True))
+
+        for _ in range(3):
+            sending_socket.sendto(DATA_TO_SEND_OSPFV3, receiving_socket.getsockname())
+        time.sleep(0.1)
+        batch = sock.Socket.drain_socket(receiving_socket, 'lo', conf.VERSION_IPV6, True)
+        self.assertEqual(3, len(batch))
+        for packet_data in batch:
+            self.assertEqual(['lo', DATA_TO_SEND_OSPFV3, '::1'], packet_data)
+        self.assertEqual([], sock.Socket.drain_socket(receiving_socket, 'lo', conf.VERSION_IPV6, True))
+
+        sending_socket.sendto(DATA_TO_SEND_OSPFV3, receiving_socket.getsockname())
+        time.sleep(0.1)
+        self.assertEqual([], sock.Socket.drain_socket(receiving_socket, 'lo', conf.VERSION_IPV6, False))  # Own packet
+
+        #  Own addresses looked up for the batch are used instead of querying them for every packet
+        self.assertIn('::1', sock.Socket.get_own_addresses('lo', conf.VERSION_IPV6))
+        for own_addresses in [[], ['::1']]:
+            sending_socket.sendto(DATA_TO_SEND_OSPFV3, receiving_socket.getsockname())
+            time.sleep(0.1)
+            array = sock.Socket.read_packet(receiving_socket, 'lo', conf.VERSION_IPV6, False, conf.MTU, own_addresses)
+            if len(own_addresses) == 0:
+                self.assertEqual([DATA_TO_SEND_OSPFV3, '::1'], array)
+            else:
+                self.assertIsNone(array)
+
+        receiving_socket.close()
+        sending_socket.close()
+
+    #  Successful run - Instant
+    def test_validate_packet(self):
+        packet_v2 = packet.Packet()
+        packet_v2.create_header_v2(conf.PACKET_TYPE_HELLO, OTHER_ROUTER_ID, AREA, conf.NULL_AUTHENTICATION,
+                                   conf.DEFAULT_AUTH)
+        packet_v2.create_hello_v2_packet_body('255.255.255.0', conf.HELLO_INTERVAL, conf.OPTIONS_V2,
+                                              conf.ROUTER_PRIORITY, conf.ROUTER_DEAD_INTERVAL, '0.0.0.0', '0.0.0.0',
+                                              [ROUTER_ID])
+        packet_v2_bytes = packet_v2.pack_packet()
+        packet_v3 = packet.Packet()
+        packet_v3.create_header_v3(conf.PACKET_TYPE_HELLO, OTHER_ROUTER_ID, AREA, 0, 'fe80::1',
+                                   conf.ALL_OSPF_ROUTERS_IPV6)
+        packet_v3.create_hello_v3_packet_body(1, conf.HELLO_INTERVAL, conf.OPTIONS_V3, conf.ROUTER_PRIORITY,
+                                              conf.ROUTER_DEAD_INTERVAL, '0.0.0.0', '0.0.0.0', [ROUTER_ID])
+        packet_v3_bytes = packet_v3.pack_packet()
+
+        packet_object = sock.Socket.validate_packet(
+            'lo', packet_v2_bytes, OTHER_ROUTER_IPV4_ADDRESS, conf.VERSION_IPV4, ROUTER_ID, AREA, False)
+        self.assertEqual(packet_v2_bytes, packet_object.pack_packet())
+        packet_object = sock.Socket.validate_packet(
+            'lo', packet_v3_bytes, 'fe80::1', conf.VERSION_IPV6, ROUTER_ID, AREA, False)
+        self.assertEqual(packet_v3_bytes, packet_object.pack_packet())
+        batch = sock.Socket.validate_packets([['lo', packet_v2_bytes, OTHER_ROUTER_IPV4_ADDRESS]], conf.VERSION_IPV4,
+                                             ROUTER_ID, AREA, False)
+        self.assertEqual(1, len(batch))
+        self.assertEqual([['lo', packet_v2_bytes, OTHER_ROUTER_IPV4_ADDRESS]], batch)
+
+        #  Wrong version, area, checksum or source address
+        self.assertIsNone(sock.Socket.validate_packet(
+            'lo', packet_v2_bytes, OTHER_ROUTER_IPV4_ADDRESS, conf.VERSION_IPV6, ROUTER_ID, AREA, False))
+        self.assertIsNone(sock.Socket.validate_packet(
+            'lo', packet_v2_bytes, OTHER_ROUTER_IPV4_ADDRESS, conf.VERSION_IPV4, ROUTER_ID, '0.0.0.1', False))
+        self.assertIsNone(sock.Socket.validate_packet(
+            'lo', packet_v2_bytes[:-1] + b'\x02', OTHER_ROUTER_IPV4_ADDRESS, conf.VERSION_IPV4, ROUTER_ID, AREA,
+            False))
+        self.assertIsNone(sock.Socket.validate_packet(
+            'lo', packet_v3_bytes, 'fe80::2', conf.VERSION_IPV6, ROUTER_ID, AREA, False))
+        self.assertIsNone(sock.Socket.validate_packet(
+            'lo', packet_v2_bytes[:10], OTHER_ROUTER_IPV4_ADDRESS, conf.VERSION_IPV4, ROUTER_ID, AREA, False))
+
+        #  Packet from itself
+        self.assertIsNone(sock.Socket.validate_packet(
+            'lo', packet_v2_bytes, OTHER_ROUTER_IPV4_ADDRESS, conf.VERSION_IPV4, OTHER_ROUTER_ID, AREA, False))
+        self.assertIsNotNone(sock.Socket.validate_packet(
+            'lo', packet_v2_bytes, OTHER_ROUTER_IPV4_ADDRESS, conf.VERSION_IPV4, OTHER_ROUTER_ID, AREA, True))
+
+    #  Successful run - Instant
+    def test_filter_program(self):
+        for version in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+            if version == conf.VERSION_IPV4:
+                family = socket.AF_INET
+                destination_address = '127.0.0.1'
+            else:
+                family = socket.AF_INET6
+                destination_address = '::1'
+            receiving_socket = socket.socket(family, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
+            sock.Socket.attach_filter(receiving_socket, sock.Socket.create_filter_program(
+                version, AREA, ROUTER_ID, False))
+            receiving_socket.setblocking(False)
+            sending_socket = socket.socket(family, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
+
+            #  Only packets from other routers in the same area and, in OSPFv3, with Instance ID 0 reach the socket
+            #  Interface ID of first OSPFv3 packet sets the byte right after the OSPFv3 header, which is not checked
+            for router_id, area_id, instance_id in [[OTHER_ROUTER_ID, AREA, 0], [ROUTER_ID, AREA, 0],
+                                                    [OTHER_ROUTER_ID, '0.0.0.1', 0], [OTHER_ROUTER_ID, AREA, 1]]:
+                packet_to_send = packet.Packet()
+                if version == conf.VERSION_IPV4:
+                    if instance_id != 0:
+                        continue
+                    packet_to_send.create_header_v2(conf.PACKET_TYPE_HELLO, router_id, area_id,
+                                                    conf.NULL_AUTHENTICATION, conf.DEFAULT_AUTH)
+                    packet_to_send.create_hello_v2_packet_body('255.0.0.0', conf.HELLO_INTERVAL, conf.OPTIONS_V2,
+                                                               conf.ROUTER_PRIORITY, conf.ROUTER_DEAD_INTERVAL,
+                                                               '0.0.0.0', '0.0.0.0', [])
+                else:
+                    packet_to_send.create_header_v3(
+                        conf.PACKET_TYPE_HELLO, router_id, area_id, instance_id, '::1', '::1')
+                    packet_to_send.create_hello_v3_packet_body(0x01000001, conf.HELLO_INTERVAL, conf.OPTIONS_V3,
+                                                               conf.ROUTER_PRIORITY, conf.ROUTER_DEAD_INTERVAL,
+                                                               '0.0.0.0', '0.0.0.0', [])
+                sending_socket.sendto(packet_to_send.pack_packet(), (destination_address, sock.PORT))
+            time.sleep(0.1)
+
+            batch = sock.Socket.drain_socket(receiving_socket, 'lo', version, True)
+            self.assertEqual(1, len(batch))
+            received_packet = packet.Packet.unpack_packet(batch[0][1])
+            self.assertEqual(OTHER_ROUTER_ID, received_packet.header.router_id)
+            if version == conf.VERSION_IPV6:
+                self.assertEqual(0, received_packet.header.instance_id)
+                self.assertEqual(0x01, batch[0][1][conf.OSPFV3_PACKET_HEADER_LENGTH])
+            receiving_socket.close()
+            sending_socket.close()
+
+    #  Successful run - Instant
+    def test_kernel_checksum(self):
+        packet_to_send = packet.Packet()
+        packet_to_send.create_header_v3(conf.PACKET_TYPE_HELLO, OTHER_ROUTER_ID, AREA, 0, '::1', '::1')
+        packet_to_send.create_hello_v3_packet_body(1, conf.HELLO_INTERVAL, conf.OPTIONS_V3, conf.ROUTER_PRIORITY,
+                                                   conf.ROUTER_DEAD_INTERVAL, '0.0.0.0', '0.0.0.0', [])
+        packet_bytes = packet_to_send.pack_packet()
+        invalid_packet_bytes = bytearray(packet_bytes)
+        invalid_packet_bytes[sock.OSPFV3_CHECKSUM_OFFSET] ^= 1
+        self.assertEqual(packet_bytes, sock.Socket.set_ospfv3_checksum(invalid_packet_bytes, '::1', '::1'))
+
+        receiving_socket = socket.socket(socket.AF_INET6, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
+        self.assertFalse(sock.Socket.is_kernel_checksum_enabled(receiving_socket))
+        self.assertTrue(sock.Socket.enable_kernel_checksum(receiving_socket))
+        self.assertTrue(sock.Socket.is_kernel_checksum_enabled(receiving_socket))
+        receiving_socket.setblocking(False)
+        sending_socket = socket.socket(socket.AF_INET6, socket.SOCK_RAW, conf.OSPF_PROTOCOL_NUMBER)
+
+        #  Kernel drops packet with invalid checksum
+        sending_socket.sendto(bytes(invalid_packet_bytes), ('::1', sock.PORT))
+        time.sleep(0.1)
+        self.assertEqual([], sock.Socket.drain_socket(receiving_socket, 'lo', conf.VERSION_IPV6, True))
+
+        #  Kernel computes checksum of packet sent without it
+        self.assertTrue(sock.Socket.enable_kernel_checksum(sending_socket))
+        invalid_packet_bytes[sock.OSPFV3_CHECKSUM_OFFSET:sock.OSPFV3_CHECKSUM_OFFSET + 2] = b'\x00\x00'
+        sending_socket.sendto(bytes(invalid_packet_bytes), ('::1', sock.PORT))
+        time.sleep(0.1)
+        batch = sock.Socket.drain_socket(receiving_socket, 'lo', conf.VERSION_IPV6, True)
+        self.assertEqual(1, len(batch))
+        self.assertEqual(packet_bytes, batch[0][1])
+
+        receiving_socket.close()
+        sending_socket.close()
+
+    #  Successful run - Instant
+    def test_is_packet_checksum_valid(self):
+        packet_v2 = packet.Packet()
+        packet_v2.create_header_v2(conf.PACKET_TYPE_HELLO, OTHER_ROUTER_ID, AREA, conf.NULL_AUTHENTICATION,
+                                   conf.DEFAULT_AUTH)
+        packet_v2.create_hello_v2_packet_body('255.255.255.0', conf.HELLO_INTERVAL, conf.OPTIONS_V2,
+                                              conf.ROUTER_PRIORITY, conf.ROUTER_DEAD_INTERVAL, '0.0.0.0', '0.0.0.0',
+                                              [ROUTER_ID])
+        packet_v2_bytes = packet_v2.pack_packet()
+        packet_v3 = packet.Packet()
+        packet_v3.create_header_v3(conf.PACKET_TYPE_HELLO, OTHER_ROUTER_ID, AREA, 0, 'fe80::1',
+                                   conf.ALL_OSPF_ROUTERS_IPV6)
+        packet_v3.create_hello_v3_packet_body(1, conf.HELLO_INTERVAL, conf.OPTIONS_V3, conf.ROUTER_PRIORITY,
+                                              conf.ROUTER_DEAD_INTERVAL, '0.0.0.0', '0.0.0.0', [ROUTER_ID])
+        packet_v3_bytes = packet_v3.pack_packet()
+
+        #  Valid packets are returned as they are
+        self.assertEqual(packet_v2_bytes, sock.Socket.is_packet_checksum_valid(
+            packet_v2_bytes, conf.VERSION_IPV4, '', ''))
+        self.assertEqual(packet_v3_bytes, sock.Socket.is_packet_checksum_valid(
+            packet_v3_bytes, conf.VERSION_IPV6, 'fe80::1', conf.ALL_OSPF_ROUTERS_IPV6))
+
+        #  Packets with invalid checksum are corrected
+        invalid_packet_bytes = bytearray(packet_v2_bytes)
+        invalid_packet_bytes[sock.OSPFV3_CHECKSUM_OFFSET] ^= 1  # Checksum offset is the same in OSPFv2
+        self.assertEqual(packet_v2_bytes, sock.Socket.is_packet_checksum_valid(
+            bytes(invalid_packet_bytes), conf.VERSION_IPV4, '', ''))
+        invalid_packet_bytes = bytearray(packet_v3_bytes)
+        invalid_packet_bytes[sock.OSPFV3_CHECKSUM_OFFSET] ^= 1
+        self.assertEqual(packet_v3_bytes, sock.Socket.is_packet_checksum_valid(
+            bytes(invalid_packet_bytes), conf.VERSION_IPV6, 'fe80::1', conf.ALL_OSPF_ROUTERS_IPV6))
+
+        #  OSPFv3 checksum depends on source and destination addresses
+        corrected_packet_bytes = sock.Socket.is_packet_checksum_valid(
+            packet_v3_bytes, conf.VERSION_IPV6, 'fe80::2', conf.ALL_OSPF_ROUTERS_IPV6)
+        self.assertNotEqual(packet_v3_bytes, corrected_packet_bytes)
+        self.assertTrue(packet.Packet.is_packet_bytes_checksum_valid(
+            corrected_packet_bytes, 'fe80::2', conf.ALL_OSPF_ROUTERS_IPV6))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -11,91 +11,168 @@ This class tests the timer operations in the router
 
 TIMEOUT_SECONDS = 3
 OFFSET = 1
+TIMER_NUMBER = 1000
+MINIMAL_HELLO_SECONDS = 0.25
 
 
-#  Full successful run - 11-12 s
+#  Full successful run - 19-20 s
 class TimerTest(unittest.TestCase):
 
     def setUp(self):
-        self.reset = threading.Event()
         self.timeout = threading.Event()
-        self.shutdown = threading.Event()
         self.timer = timer.Timer()
 
     #  Successful run - 3 s
     @timeout_decorator.timeout(TIMEOUT_SECONDS + 1)
     def test_one_shot_timer_successful_timeout(self):
-        thread = threading.Thread(target=self.timer.single_shot_timer, args=(self.reset, self.timeout, self.shutdown,
-                                                                             TIMEOUT_SECONDS))
+        self.timer.single_shot_timer(self.timeout, TIMEOUT_SECONDS)
         self.assertFalse(self.timeout.is_set())
-        thread.start()
-        thread.join()
-        self.assertTrue(self.timeout.is_set())
+        self.assertTrue(self.timer.is_running())
+        self.assertTrue(self.timeout.wait(TIMEOUT_SECONDS + 0.5))
+        self.assertFalse(self.timer.is_running())
+        self.assertEqual(0, self.timer.get_timer_time())
 
-    #  Successful run - 3 s
-    @timeout_decorator.timeout(TIMEOUT_SECONDS + 1)
+    #  Successful run - 5 s
+    @timeout_decorator.timeout(TIMEOUT_SECONDS + 3)
     def test_one_shot_timer_successful_reset(self):
-        thread = threading.Thread(target=self.timer.single_shot_timer, args=(self.reset, self.timeout, self.shutdown,
-                                                                             TIMEOUT_SECONDS))
-        self.assertFalse(self.reset.is_set())
-        thread.start()
-        self.reset.set()
-        time.sleep(TIMEOUT_SECONDS)
-        self.assertFalse(self.reset.is_set())
-        thread.join()
+        self.timer.single_shot_timer(self.timeout, TIMEOUT_SECONDS)
+        time.sleep(TIMEOUT_SECONDS - 1)
+        self.timer.reset_timer()
+        self.assertIn(self.timer.get_timer_time(), [TIMEOUT_SECONDS - 1, TIMEOUT_SECONDS])
+        self.assertFalse(self.timeout.wait(TIMEOUT_SECONDS - 0.5))  # Timeout is delayed by reset
+        self.assertTrue(self.timeout.wait(1))
 
     #  Successful run - 1 s
-    @timeout_decorator.timeout(1)
-    def test_one_shot_timer_successful_shutdown(self):
-        thread = threading.Thread(target=self.timer.single_shot_timer, args=(self.reset, self.timeout, self.shutdown,
-                                                                             TIMEOUT_SECONDS))
-        thread.start()
-        self.shutdown.set()
-        thread.join()
+    @timeout_decorator.timeout(TIMEOUT_SECONDS)
+    def test_one_shot_timer_successful_stop(self):
+        self.timer.single_shot_timer(self.timeout, 1)
+        self.timer.stop_timer()
+        self.assertFalse(self.timer.is_running())
+        self.assertTrue(self.timeout.is_set())  # Anything waiting for timeout is released on shutdown
+        self.timeout.clear()
+        self.assertFalse(self.timeout.wait(1.5))  # Stopped timer does not fire
+        self.timer.reset_timer()  # Stopped timer is not restarted
+        self.assertFalse(self.timer.is_running())
+        self.timer.stop_timer()
+        self.assertFalse(self.timeout.is_set())  # Timer was no longer running
 
     #  Successful run - Instant
     def test_one_shot_timer_invalid_parameters(self):
         with self.assertRaises(ValueError):
-            self.timer.single_shot_timer(None, self.timeout, self.shutdown, TIMEOUT_SECONDS)
-        with self.assertRaises(ValueError):
-            self.timer.single_shot_timer(self.reset, None, self.shutdown, TIMEOUT_SECONDS)
-        with self.assertRaises(ValueError):
-            self.timer.single_shot_timer(self.reset, self.timeout, None, TIMEOUT_SECONDS)
+            self.timer.single_shot_timer(None, TIMEOUT_SECONDS)
         with self.assertRaises(ValueError):
-            self.timer.single_shot_timer(self.reset, self.timeout, self.shutdown, 0.99)
+            self.timer.single_shot_timer(self.timeout, 0.0009)
         with self.assertRaises(ValueError):
-            self.timer.single_shot_timer(self.reset, self.timeout, self.shutdown, 0)
+            self.timer.single_shot_timer(self.timeout, 0)
         with self.assertRaises(ValueError):
-            self.timer.single_shot_timer(self.reset, self.timeout, self.shutdown, -1)
+            self.timer.single_shot_timer(self.timeout, -1)
+        self.assertFalse(self.timer.is_running())
 
-    #  Successful run - 6 s
-    @timeout_decorator.timeout(2*TIMEOUT_SECONDS+1)
+    #  Successful run - 7 s
+    @timeout_decorator.timeout(2*TIMEOUT_SECONDS+2)
     def test_interval_timer_successful(self):
-        thread = threading.Thread(target=self.timer.interval_timer, args=(OFFSET, self.timeout, self.shutdown,
-                                                                          TIMEOUT_SECONDS))
-        thread.start()
+        self.timer.interval_timer(OFFSET, self.timeout, TIMEOUT_SECONDS)
+        self.assertFalse(self.timeout.wait(OFFSET + TIMEOUT_SECONDS - 0.5))
         for i in range(2):
-            self.assertFalse(self.timeout.is_set())
-            time.sleep(TIMEOUT_SECONDS)
-            self.assertTrue(self.timeout.is_set())
+            self.assertTrue(self.timeout.wait(1))
+            self.assertTrue(self.timer.is_running())
             self.timeout.clear()
-        self.shutdown.set()
-        thread.join()
+            if i == 0:
+                self.assertFalse(self.timeout.wait(TIMEOUT_SECONDS - 0.5))
+        self.timer.stop_timer()
+        self.assertFalse(self.timer.is_running())
+        self.assertFalse(self.timeout.is_set())  # Stopping an interval timer does not set its timeout event
 
     #  Successful run - Instant
     def test_interval_timer_invalid_parameters(self):
         with self.assertRaises(ValueError):
-            self.timer.interval_timer(-1, self.timeout, self.shutdown, TIMEOUT_SECONDS)
+            self.timer.interval_timer(-1, self.timeout, TIMEOUT_SECONDS)
         with self.assertRaises(ValueError):
-            self.timer.interval_timer(OFFSET, None, self.shutdown, TIMEOUT_SECONDS)
+            self.timer.interval_timer(OFFSET, None, TIMEOUT_SECONDS)
         with self.assertRaises(ValueError):
-            self.timer.interval_timer(OFFSET, self.timeout, None, TIMEOUT_SECONDS)
+            self.timer.interval_timer(-0.5, self.timeout, TIMEOUT_SECONDS)
         with self.assertRaises(ValueError):
-            self.timer.interval_timer(OFFSET, self.timeout, self.shutdown, 0.99)
+            self.timer.interval_timer(OFFSET, self.timeout, 0.0009)
         with self.assertRaises(ValueError):
-            self.timer.interval_timer(OFFSET, self.timeout, self.shutdown, 0)
+            self.timer.interval_timer(OFFSET, self.timeout, 0)
         with self.assertRaises(ValueError):
-            self.timer.interval_timer(OFFSET, self.timeout, self.shutdown, -1)
+            self.timer.interval_timer(OFFSET, self.timeout, -1)
+
+    #  Successful run - 1 s
+    @timeout_decorator.timeout(TIMEOUT_SECONDS)
+    def test_sub_second_timers(self):
+        #  Single-shot timer fires at its deadline with millisecond resolution
+        start_time = time.perf_counter()
+        self.timer.single_shot_timer(self.timeout, 0.05)
+        self.assertTrue(0 < self.timer.get_timer_time() <= 0.05)
+        self.assertTrue(self.timeout.wait(1))
+        self.assertTrue(0.05 <= time.perf_counter() - start_time < 0.1)
+
+        #  Interval timer of minimal Hello mode fires several times per second
+        self.timeout.clear()
+        firing_times = []
+        start_time = time.perf_counter()
+        self.timer.interval_timer(0, self.timeout, MINIMAL_HELLO_SECONDS)
+        for i in range(3):
+            self.assertTrue(self.timeout.wait(1))
+            firing_times.append(time.perf_counter() - start_time)
+            self.timeout.clear()
+        self.timer.stop_timer()
+        for i in range(3):
+            self.assertTrue((i + 1) * MINIMAL_HELLO_SECONDS <= firing_times[i] < (i + 1) * MINIMAL_HELLO_SECONDS + 0.05)
+
+    #  Successful run - 2 s
+    @timeout_decorator.timeout(TIMEOUT_SECONDS)
+    def test_timer_service(self):
+        self.assertIs(timer.get_timer_service(), self.timer.service)  # Timers share a single service and thread
+        thread_number = threading.active_count()
+        timeout_events = []
+        timers = []
+        for i in range(TIMER_NUMBER):
+            timeout_events.append(threading.Event())
+            timers.append(timer.Timer())
+            timers[i].single_shot_timer(timeout_events[i], 1 + (i % 2) * 100)
+        self.assertEqual(thread_number, threading.active_count())
+        for i in range(0, TIMER_NUMBER, 4):  # Stops half of the timers that would fire
+            timers[i].stop_timer()
+        time.sleep(1.5)
+        for i in range(TIMER_NUMBER):
+            self.assertEqual((i % 2) == 0, timeout_events[i].is_set())
+            self.assertEqual((i % 2) == 1, timers[i].is_running())
+            timers[i].stop_timer()
+
+    #  Successful run - Instant
+    def test_timer_service_wake_time(self):
+        service = timer.TimerService()
+        long_timer = timer.Timer(service)
+        short_timer = timer.Timer(service)
+
+        #  Service thread sleeps until the deadline of the only timer, however far it is
+        long_timer.single_shot_timer(threading.Event(), 100)
+        time.sleep(0.05)
+        with service.condition:
+            self.assertEqual(long_timer.initial_time + 100, service.wake_time)
+
+        #  Service thread is woken up by a timer with a closer deadline
+        short_timer.interval_timer(0, self.timeout, 1)
+        time.sleep(0.05)
+        with service.condition:
+            self.assertEqual(short_timer.initial_time + 1, service.wake_time)
+
+        #  Entries left behind by resets are discarded, so that the heap stays bounded
+        for i in range(1000):
+            short_timer.reset_timer()
+        with service.condition:
+            self.assertEqual(2, service.timer_number)
+            self.assertTrue(len(service.heap) <= 2 * service.timer_number + 65)
+        long_timer.stop_timer()
+        short_timer.stop_timer()
+        with service.condition:
+            self.assertEqual(0, service.timer_number)
+        self.assertFalse(self.timeout.is_set())
+
+    def tearDown(self):
+        self.timer.stop_timer()
 
 
 if __name__ == '__main__':
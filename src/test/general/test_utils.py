@@ -1,4 +1,10 @@
 import unittest
+import netifaces
+import os
+import random
+import ipaddress
+import struct
+import errno
 
 import general.utils as utils
 import conf.conf as conf
@@ -16,6 +22,8 @@ PREFIX_IPV4 = '222.222.1.0'  # Must be changed if IPv4 network prefix of interfa
 PREFIX_IPV4_LENGTH = 24  # Must be changed if length of IPv4 network prefix of interface is changed
 PREFIX_IPV6 = '2001:db8:cafe:1::'  # Must be changed if IPv6 network prefix of interface is changed
 PREFIX_IPV6_LENGTH = 64  # Must be changed if length of IPv6 network prefix of interface is changed
+RTM_NEWADDR = 20  # Netlink message type notifying a new interface address
+NETLINK_HEADER_FORMAT_STRING = "= L H H L L"  # Length, type, flags, sequence number, port ID
 
 
 #  Full successful run - Instant
@@ -112,6 +120,29 @@ class UtilsTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             utils.Utils.decimal_to_ipv6(conf.MAX_VALUE_128_BITS + 1)
 
+    #  Successful run - Instant
+    def test_address_conversion_matches_ipaddress(self):
+        for _ in range(1000):
+            decimal = random.getrandbits(32)
+            address = str(ipaddress.IPv4Address(decimal))
+            self.assertEqual(address, utils.Utils.decimal_to_ipv4(decimal))
+            self.assertEqual(decimal, utils.Utils.ipv4_to_decimal(address))
+            self.assertTrue(utils.Utils.is_ipv4_address(address))
+            self.assertFalse(utils.Utils.is_ipv6_address(address))
+            decimal = random.getrandbits(128) >> random.randrange(128)
+            for address in [str(ipaddress.IPv6Address(decimal)), ipaddress.IPv6Address(decimal).exploded]:
+                self.assertEqual(decimal, utils.Utils.ipv6_to_decimal(address))
+                self.assertTrue(utils.Utils.is_ipv6_address(address))
+                self.assertFalse(utils.Utils.is_ipv4_address(address))
+
+        #  Arguments not in standard notation
+        self.assertEqual(int(ipaddress.IPv6Address('fe80::1%eth0')), utils.Utils.ipv6_to_decimal('fe80::1%eth0'))
+        self.assertTrue(utils.Utils.is_ipv6_address('fe80::1%eth0'))
+        self.assertEqual(16909060, utils.Utils.ipv4_to_decimal(b'\x01\x02\x03\x04'))
+        self.assertFalse(utils.Utils.is_ipv4_address('1.1.1.1\x00'))
+        with self.assertRaises(ValueError):
+            utils.Utils.ipv4_to_decimal('01.1.1.1')
+
     #  Successful run - Instant
     def test_create_checksum_ospfv2_successful(self):
         self.assertEqual(65535, utils.Utils.create_checksum_ospfv2(b'\x00'))
@@ -135,6 +166,17 @@ class UtilsTest(unittest.TestCase):
             b'\x00\x00\n\x12\x01\x00\x00\x00(\xde\xde\x01\x01\x00\x00\x00\x00\xff\xf6\x00\x03\x00\x01\x00\x04\x00\x00'
             b'\x00\x01'))
 
+    #  Successful run - Instant
+    def test_create_checksum_ospfv2_large_message(self):
+        for size in [1399, 1400, utils.NUMPY_CHECKSUM_THRESHOLD + 1, 65535]:
+            message = os.urandom(size)
+            expected = UtilsTest.create_reference_checksum(message)
+            self.assertEqual(expected, utils.Utils.create_checksum_ospfv2(message))
+            self.assertEqual(expected, utils.Utils.create_checksum_ospfv2(bytearray(message)))
+            self.assertEqual(expected, utils.Utils.create_checksum_ospfv2(memoryview(message)))
+            self.assertEqual(size, len(message))
+        self.assertEqual(0, utils.Utils.create_checksum_ospfv2(b'\xff' * 65536))
+
     #  Successful run - Instant
     def test_create_checksum_ospfv3_successful(self):
         self.assertEqual(8768, utils.Utils.create_checksum_ospfv3(
@@ -155,6 +197,17 @@ class UtilsTest(unittest.TestCase):
                       b'\x00\x00\x00\x04\x00\x00\x00\x04\x07\x07\x07\x07'
         self.assertEqual(19299, utils.Utils.create_fletcher_checksum(byte_stream))
 
+    #  Successful run - Instant
+    def test_create_fletcher_checksum_large_message(self):
+        for size in [0, 1, 16, 1400, utils.NUMPY_CHECKSUM_THRESHOLD + 1, 65535]:
+            message = os.urandom(size)
+            expected = UtilsTest.create_reference_fletcher_checksum(message)
+            self.assertEqual(expected, utils.Utils.create_fletcher_checksum(message))
+            self.assertEqual(expected, utils.Utils.create_fletcher_checksum(memoryview(message)))
+        message = b'\xff' * 65535
+        self.assertEqual(UtilsTest.create_reference_fletcher_checksum(message),
+                         utils.Utils.create_fletcher_checksum(message))
+
     #  Successful run - Instant
     def test_interface_name_to_ipv4_address(self):
         self.assertEqual(INTERFACE_IPV4, utils.Utils.interface_name_to_ipv4_address(INTERFACE_NAME))
@@ -189,6 +242,42 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(
             [PREFIX_IPV6, PREFIX_IPV6_LENGTH], utils.Utils.interface_name_to_ipv6_prefix_and_length(INTERFACE_NAME))
 
+    #  Successful run - Instant
+    def test_interface_name_to_mtu(self):
+        with open('/sys/class/net/' + INTERFACE_NAME + '/mtu') as mtu_file:
+            self.assertEqual(int(mtu_file.read()), utils.Utils.interface_name_to_mtu(INTERFACE_NAME))
+        self.assertEqual(conf.MTU, utils.Utils.interface_name_to_mtu('invalid interface'))
+
+    #  Successful run - Instant
+    def test_get_interface_addresses(self):
+        interface_name = 'lo'
+        netlink_socket = utils.Utils.netlink_socket
+        netlink_process_id = utils.Utils.netlink_process_id
+        fake_socket = FakeNetlinkSocket()
+        utils.Utils.netlink_socket = fake_socket  # Address changes are notified by the test instead of the kernel
+        utils.Utils.netlink_process_id = os.getpid()
+        utils.Utils.address_cache = {}
+        try:
+            addresses = utils.Utils.get_interface_addresses(interface_name)
+            self.assertEqual(netifaces.ifaddresses(interface_name), addresses)
+            self.assertIs(addresses, utils.Utils.get_interface_addresses(interface_name))  # Result is cached
+            self.assertEqual(2, fake_socket.recv_calls)  # Pending notifications are checked on every lookup
+
+            #  Cache is refreshed once an address change is notified
+            fake_socket.messages.append(struct.pack(NETLINK_HEADER_FORMAT_STRING, 16, RTM_NEWADDR, 0, 0, 0))
+            new_addresses = utils.Utils.get_interface_addresses(interface_name)
+            self.assertIsNot(addresses, new_addresses)
+            self.assertEqual(netifaces.ifaddresses(interface_name), new_addresses)
+            self.assertIs(new_addresses, utils.Utils.get_interface_addresses(interface_name))
+
+            #  Cache is refreshed if notifications were lost
+            fake_socket.error = OSError(errno.ENOBUFS, "No buffer space available")
+            self.assertIsNot(new_addresses, utils.Utils.get_interface_addresses(interface_name))
+        finally:
+            utils.Utils.netlink_socket = netlink_socket
+            utils.Utils.netlink_process_id = netlink_process_id
+            utils.Utils.address_cache = {}
+
     #  Successful run - Instant
     def test_is_ipv4_address_successful(self):
         self.assertTrue(utils.Utils.is_ipv4_address('0.0.0.0'))
@@ -393,6 +482,52 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(24, utils.Utils.prefix_to_prefix_length('222.222.1.0'))
         self.assertEqual(64, utils.Utils.prefix_to_prefix_length('2001:db8:cafe:1::'))
 
+    #  Computes the Internet checksum by summing the message 16 bits at a time
+    @staticmethod
+    def create_reference_checksum(message):
+        if (len(message) % 2) != 0:
+            message += b'\x00'
+        content_chunk_sum = 0
+        for i in range(0, len(message), 2):
+            content_chunk_sum += message[i] * 256 + message[i + 1]
+        quotient, remainder = divmod(content_chunk_sum, conf.MAX_VALUE_16_BITS + 1)
+        result = quotient + remainder
+        if result > conf.MAX_VALUE_16_BITS:
+            result = divmod(result, conf.MAX_VALUE_16_BITS + 1)[0] + 1
+        return result ^ conf.MAX_VALUE_16_BITS
+
+    #  Computes the Fletcher's checksum one byte at a time
+    @staticmethod
+    def create_reference_fletcher_checksum(message):
+        c0 = 0
+        c1 = 0
+        for byte in message:
+            c0 = (byte + c0) % conf.MAX_VALUE_8_BITS
+            c1 = (c0 + c1) % conf.MAX_VALUE_8_BITS
+        x = (-c1 + (len(message) - 15) * c0) % conf.MAX_VALUE_8_BITS
+        y = (c1 - (len(message) - 15 + 1) * c0) % conf.MAX_VALUE_8_BITS
+        return (x << conf.BYTE_SIZE) + y
+
+
+
+#  Netlink socket that returns the notifications provided by the test
+class FakeNetlinkSocket:
+
+    def __init__(self):
+        self.messages = []
+        self.error = None
+        self.recv_calls = 0
+
+    def recv(self, buffer_size, flags):
+        self.recv_calls += 1
+        if self.error is not None:
+            error = self.error
+            self.error = None
+            raise error
+        if len(self.messages) == 0:
+            raise BlockingIOError
+        return self.messages.pop(0)[:buffer_size]
+
 
 if __name__ == '__main__':
     unittest.main()
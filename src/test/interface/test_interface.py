@@ -1033,6 +1033,92 @@ class InterfaceTest(unittest.TestCase):
         new_packet = self.interface_ospfv2.create_hello_packet().pack_packet()
         self.assertEqual(PACKET_BYTES, new_packet)
 
+    #  Successful run - Instant
+    def test_hello_packet_cache(self):
+        self.assertIsNone(self.interface_ospfv2.hello_packet_parameters)
+        self.interface_ospfv2.create_hello_packet()
+        self.assertEqual(PACKET_BYTES, self.interface_ospfv2.hello_packet_bytes)
+        self.assertEqual(self.interface_ospfv2.get_hello_packet_parameters(),
+                         self.interface_ospfv2.hello_packet_parameters)
+
+        #  Cached Hello packet becomes outdated when its content changes
+        self.interface_ospfv2.router_priority = 0
+        self.assertNotEqual(self.interface_ospfv2.get_hello_packet_parameters(),
+                            self.interface_ospfv2.hello_packet_parameters)
+        self.interface_ospfv2.create_hello_packet()
+        self.assertNotEqual(PACKET_BYTES, self.interface_ospfv2.hello_packet_bytes)
+        self.interface_ospfv2.neighbors['10.10.10.10'] = None
+        self.assertNotEqual(self.interface_ospfv2.get_hello_packet_parameters(),
+                            self.interface_ospfv2.hello_packet_parameters)
+
+        self.interface_ospfv3.create_hello_packet()
+        self.assertTrue(packet.Packet.is_packet_bytes_checksum_valid(
+            self.interface_ospfv3.hello_packet_bytes, self.ipv6_address, conf.ALL_OSPF_ROUTERS_IPV6))
+
+        #  OSPFv3 Hello packet becomes outdated when the link-local address changes
+        self.interface_ospfv3.ipv6_address = 'fe80::abcd'
+        self.assertNotEqual(self.interface_ospfv3.get_hello_packet_parameters(),
+                            self.interface_ospfv3.hello_packet_parameters)
+        self.interface_ospfv3.create_hello_packet()
+        self.assertTrue(packet.Packet.is_packet_bytes_checksum_valid(
+            self.interface_ospfv3.hello_packet_bytes, 'fe80::abcd', conf.ALL_OSPF_ROUTERS_IPV6))
+
+    #  Successful run - 1 s
+    def test_set_timer_intervals(self):
+        for query_interface in [self.interface_ospfv2, self.interface_ospfv3]:
+            self.assertEqual(conf.HELLO_INTERVAL, query_interface.hello_interval)
+            self.assertEqual(conf.ROUTER_DEAD_INTERVAL, query_interface.router_dead_interval)
+            self.assertEqual(0, query_interface.hello_multiplier)
+            self.assertEqual(conf.HELLO_INTERVAL, query_interface.hello_timer_seconds)
+            self.assertEqual(conf.ROUTER_DEAD_INTERVAL, query_interface.waiting_timer_seconds)
+
+            query_interface.set_timer_intervals(2, 8, 0)
+            self.assertEqual(2, query_interface.hello_interval)
+            self.assertEqual(8, query_interface.router_dead_interval)
+            self.assertEqual(2, query_interface.hello_timer_seconds)
+            self.assertEqual(8, query_interface.waiting_timer_seconds)
+
+            #  Minimal Hello mode - Hello packets advertise Hello Interval of 0 and Router Dead Interval of 1 s
+            query_interface.set_timer_intervals(conf.HELLO_INTERVAL, conf.ROUTER_DEAD_INTERVAL, 4)
+            self.assertEqual(0, query_interface.hello_interval)
+            self.assertEqual(conf.MINIMAL_ROUTER_DEAD_INTERVAL, query_interface.router_dead_interval)
+            self.assertEqual(4, query_interface.hello_multiplier)
+            self.assertEqual(0.25, query_interface.hello_timer_seconds)
+            self.assertEqual(conf.MINIMAL_ROUTER_DEAD_INTERVAL, query_interface.waiting_timer_seconds)
+            hello_packet = query_interface.create_hello_packet()
+            self.assertEqual(0, hello_packet.body.hello_interval)
+            self.assertEqual(conf.MINIMAL_ROUTER_DEAD_INTERVAL, hello_packet.body.router_dead_interval)
+            self.assertFalse(query_interface.hello_timer.is_running())  # Interface is not operating
+
+            with self.assertRaises(ValueError):
+                query_interface.set_timer_intervals(conf.HELLO_INTERVAL, conf.ROUTER_DEAD_INTERVAL, 2)
+            with self.assertRaises(ValueError):
+                query_interface.set_timer_intervals(conf.HELLO_INTERVAL, conf.ROUTER_DEAD_INTERVAL, 21)
+            with self.assertRaises(ValueError):
+                query_interface.set_timer_intervals(0, conf.ROUTER_DEAD_INTERVAL, 0)
+            with self.assertRaises(ValueError):
+                query_interface.set_timer_intervals(conf.HELLO_INTERVAL, conf.HELLO_INTERVAL, 0)
+            with self.assertRaises(ValueError):
+                query_interface.set_timer_intervals(conf.HELLO_INTERVAL, conf.MAX_VALUE_16_BITS + 1, 0)
+            self.assertEqual(4, query_interface.hello_multiplier)  # Invalid values are not set
+
+            #  Hello timer of operating interface is restarted with new interval
+            query_interface.set_timer_intervals(2, 8, 0)
+            query_interface.hello_timer.interval_timer(0, query_interface.hello_timeout, 2)
+            query_interface.set_timer_intervals(conf.HELLO_INTERVAL, conf.ROUTER_DEAD_INTERVAL, 4)
+            self.assertTrue(query_interface.hello_timeout.wait(0.5))
+            query_interface.hello_timer.stop_timer()
+
+        #  Interface-specific intervals are read from configuration
+        conf.INTERFACE_TIMER_INTERVALS[self.interface_identifier] = [1, 3]
+        self.assertEqual((1, 3, 0), interface.Interface.get_configured_timer_intervals(self.interface_identifier))
+        conf.INTERFACE_HELLO_MULTIPLIERS[self.interface_identifier] = 5
+        self.assertEqual((1, 3, 5), interface.Interface.get_configured_timer_intervals(self.interface_identifier))
+        del conf.INTERFACE_TIMER_INTERVALS[self.interface_identifier]
+        del conf.INTERFACE_HELLO_MULTIPLIERS[self.interface_identifier]
+        self.assertEqual((conf.HELLO_INTERVAL, conf.ROUTER_DEAD_INTERVAL, 0),
+                         interface.Interface.get_configured_timer_intervals(self.interface_identifier))
+
     #  Successful run - Instant
     def test_get_flooding_ip_address(self):
         self.assertEqual('', self.interface_ospfv2.get_flooding_ip_address())
@@ -68,6 +68,29 @@ class TestHeader(unittest.TestCase):
             header.Header(self.ls_age, self.options, self.ls_type, self.link_state_id, self.advertising_router,
                           self.ls_sequence_number, -1)
 
+    #  Successful run - Instant
+    def test_from_wire(self):
+        header_ospfv2 = header.Header.from_wire(self.ls_age, self.options, self.ls_type, self.link_state_id,
+                                                self.advertising_router, self.ls_sequence_number, conf.VERSION_IPV4)
+        header_ospfv3 = header.Header.from_wire(self.ls_age, 0, self.ls_type, self.link_state_id,
+                                                self.advertising_router, self.ls_sequence_number, conf.VERSION_IPV6)
+        self.assertEqual(self.header_ospfv2.pack_header(), header_ospfv2.pack_header())
+        self.assertEqual(self.header_ospfv3.pack_header(), header_ospfv3.pack_header())
+
+        #  Fields that can be invalid in a byte stream with the correct format are still validated
+        with self.assertRaises(ValueError):
+            header.Header.from_wire(conf.MAX_AGE + 1, self.options, self.ls_type, self.link_state_id,
+                                    self.advertising_router, self.ls_sequence_number, conf.VERSION_IPV4)
+        with self.assertRaises(ValueError):
+            header.Header.from_wire(self.ls_age, self.options, 0x0f, self.link_state_id, self.advertising_router,
+                                    self.ls_sequence_number, conf.VERSION_IPV4)
+        with self.assertRaises(ValueError):
+            header.Header.from_wire(self.ls_age, self.options, self.ls_type, self.link_state_id, '0.0.0.0',
+                                    self.ls_sequence_number, conf.VERSION_IPV4)
+        with self.assertRaises(ValueError):
+            header.Header.from_wire(self.ls_age, self.options, self.ls_type, self.link_state_id,
+                                    self.advertising_router, 0x80000000, conf.VERSION_IPV4)
+
     #  Successful run - Instant
     def test_pack_header(self):
         header_bytes = b'\x00\x01"\x01\x01\x01\x01\x01\x01\x01\x01\x01\x80\x00\x00\x06\x00\x00\x00\x00'
@@ -324,6 +347,13 @@ class TestHeader(unittest.TestCase):
         with self.assertRaises(ValueError):
             header.Header.get_format_string(1)
 
+    #  Successful run - Instant
+    def test_get_struct(self):
+        self.assertEqual(header.OSPFV2_FORMAT_STRING, header.Header.get_struct(conf.VERSION_IPV4).format)
+        self.assertEqual(header.OSPFV3_FORMAT_STRING, header.Header.get_struct(conf.VERSION_IPV6).format)
+        with self.assertRaises(ValueError):
+            header.Header.get_struct(1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import copy
 
 import lsa.lsa as lsa
 import lsa.header as header
@@ -346,6 +347,41 @@ class TestLsa(unittest.TestCase):
                           [40, 96, 0, '2001:db8:cafe:1::'], [50, 128, 0, '2001:db8:cafe:1::']],
                          unpacked_lsa.body.prefix_list)
 
+    #  Successful run - Instant
+    def test_unpack_lsa_lazy_body(self):
+        lsa_bytes = bytearray(TestLsa.router_lsa_v2_bytes)
+        unpacked_lsa = lsa.Lsa.unpack_lsa(lsa_bytes, conf.VERSION_IPV4)
+        lsa_bytes[conf.LSA_HEADER_LENGTH:] = bytes(len(lsa_bytes) - conf.LSA_HEADER_LENGTH)  # Buffer is reused
+
+        #  LSA body is not decoded to pack LSA or to verify its checksum
+        self.assertIsNotNone(unpacked_lsa.body_bytes)
+        self.assertTrue(unpacked_lsa.has_body())
+        self.assertTrue(unpacked_lsa.is_lsa_checksum_valid())
+        self.assertEqual(TestLsa.router_lsa_v2_bytes, unpacked_lsa.pack_lsa())
+        self.assertIsNone(unpacked_lsa.decoded_body)
+
+        #  LSA body is decoded when accessed
+        self.assertEqual(5, unpacked_lsa.body.link_number)
+        self.assertIsNone(unpacked_lsa.body_bytes)
+        unpacked_lsa.add_link_info_v2('222.222.7.0', '255.255.255.0', 3, 0, 1)
+        self.assertEqual(96, len(unpacked_lsa.pack_lsa()))
+        self.assertTrue(unpacked_lsa.is_lsa_checksum_valid())
+
+        #  Invalid LSA body
+        lsa_bytes = TestLsa.router_lsa_v2_bytes[:conf.LSA_HEADER_LENGTH + 2]
+        unpacked_lsa = lsa.Lsa.unpack_lsa(lsa_bytes, conf.VERSION_IPV4)
+        self.assertTrue(unpacked_lsa.has_body())
+        self.assertIsNone(unpacked_lsa.body)
+        self.assertFalse(unpacked_lsa.has_body())
+
+        #  Unknown LSA type
+        lsa_bytes = bytearray(TestLsa.router_lsa_v2_bytes)
+        lsa_bytes[3] = conf.LSA_TYPE_AS_EXTERNAL
+        unpacked_lsa = lsa.Lsa.unpack_lsa(lsa_bytes, conf.VERSION_IPV4)
+        self.assertFalse(unpacked_lsa.has_body())
+        with self.assertRaises(ValueError):
+            unpacked_lsa.pack_lsa()
+
     #  Successful run - Instant
     def test_is_lsa_checksum_valid(self):
         new_lsa = lsa.Lsa()
@@ -365,6 +401,63 @@ class TestLsa(unittest.TestCase):
         new_lsa.set_lsa_checksum()
         self.assertTrue(new_lsa.is_lsa_checksum_valid())
 
+    #  Successful run - Instant
+    def test_is_lsa_checksum_valid_cache(self):
+        lsa.Lsa.verified_checksums.clear()
+        new_lsa = lsa.Lsa()
+        new_lsa.create_header(1, 2, 1, '0.0.0.0', '1.1.1.1', 0, conf.VERSION_IPV4)
+        new_lsa.create_router_lsa_body(False, False, False, 2, conf.VERSION_IPV4)
+        self.assertTrue(new_lsa.is_lsa_checksum_valid())
+        self.assertEqual(0, len(lsa.Lsa.verified_checksums))
+        self.assertTrue(new_lsa.is_lsa_checksum_valid(True))
+        self.assertEqual(1, len(lsa.Lsa.verified_checksums))
+
+        #  Duplicate instance is not verified again
+        duplicate_lsa = lsa.Lsa.unpack_lsa(new_lsa.pack_lsa(), conf.VERSION_IPV4)
+        duplicate_lsa.body.bit_v = True
+        self.assertTrue(duplicate_lsa.is_lsa_checksum_valid(True))
+        self.assertFalse(duplicate_lsa.is_lsa_checksum_valid())
+
+        #  Different instances are verified
+        new_lsa.header.ls_checksum += 1
+        self.assertFalse(new_lsa.is_lsa_checksum_valid(True))
+        new_lsa.set_lsa_checksum()
+        new_lsa.header.ls_sequence_number += 1
+        self.assertFalse(new_lsa.is_lsa_checksum_valid(True))
+        self.assertEqual(1, len(lsa.Lsa.verified_checksums))
+        lsa.Lsa.verified_checksums.clear()
+
+    #  Successful run - Instant
+    def test_edit(self):
+        incremental_lsa = lsa.Lsa()
+        incremental_lsa.create_header(1, 2, 1, '1.1.1.1', '1.1.1.1', 0, conf.VERSION_IPV4)
+        incremental_lsa.create_router_lsa_body(False, False, False, 2, conf.VERSION_IPV4)
+        edited_lsa = copy.deepcopy(incremental_lsa)
+        for i in range(200):
+            incremental_lsa.add_link_info_v2('10.0.' + str(i) + '.0', '255.255.255.0', 3, 0, i)
+
+        #  LSA length and checksum are only set when outermost edit block is closed
+        with edited_lsa.edit():
+            for i in range(100):
+                edited_lsa.add_link_info_v2('10.0.' + str(i) + '.0', '255.255.255.0', 3, 0, i)
+            with edited_lsa.edit():
+                for i in range(100, 200):
+                    edited_lsa.add_link_info_v2('10.0.' + str(i) + '.0', '255.255.255.0', 3, 0, i)
+            self.assertEqual(conf.LSA_HEADER_LENGTH + 4, edited_lsa.header.length)
+        self.assertEqual(incremental_lsa.header.length, edited_lsa.header.length)
+        self.assertEqual(incremental_lsa.header.ls_checksum, edited_lsa.header.ls_checksum)
+        self.assertEqual(incremental_lsa.pack_lsa(), edited_lsa.pack_lsa())
+        self.assertTrue(edited_lsa.is_lsa_checksum_valid())
+
+        #  LSA length and checksum are set even if edit is interrupted
+        with self.assertRaises(ValueError):
+            with edited_lsa.edit():
+                edited_lsa.delete_link_info_v2('10.0.0.0', '255.255.255.0', 3, 0, 0)
+                raise ValueError()
+        self.assertEqual(0, edited_lsa.edit_depth)
+        self.assertEqual(incremental_lsa.header.length - 12, edited_lsa.header.length)
+        self.assertTrue(edited_lsa.is_lsa_checksum_valid())
+
     #  Successful run - Instant
     def test_is_lsa_identifier_equal(self):
         first, second = self.reset_lsa_instances()
@@ -11,7 +11,7 @@ This class tests the neighbor operations in the router
 #  TODO: Implement validation and testing of None parameters
 
 
-#  Full successful run - 105-106 s
+#  Full successful run - 108-109 s
 class TestNeighbor(unittest.TestCase):
 
     def setUp(self):
@@ -59,20 +59,15 @@ class TestNeighbor(unittest.TestCase):
             self.assertIsNotNone(query_neighbor.ls_update_retransmit_timer)
             self.assertTrue(query_neighbor.inactivity_timer.initial_time > self.start_time)
 
-            self.assertTrue(query_neighbor.inactivity_thread.isAlive())
-            self.assertIsNone(query_neighbor.dd_packet_retransmit_thread)
-            self.assertIsNone(query_neighbor.ls_request_retransmit_thread)
-            self.assertIsNone(query_neighbor.ls_update_retransmit_thread)
+            self.assertTrue(query_neighbor.inactivity_timer.is_running())
+            self.assertFalse(query_neighbor.dd_packet_retransmit_timer.is_running())
+            self.assertFalse(query_neighbor.ls_request_retransmit_timer.is_running())
+            self.assertFalse(query_neighbor.ls_update_retransmit_timer.is_running())
 
-            self.assertFalse(query_neighbor.reset.is_set())
             self.assertFalse(query_neighbor.inactivity_timeout.is_set())
-            self.assertFalse(query_neighbor.inactivity_shutdown.is_set())
             self.assertFalse(query_neighbor.dd_packet_retransmit_timeout.is_set())
             self.assertFalse(query_neighbor.ls_request_retransmit_timeout.is_set())
             self.assertFalse(query_neighbor.ls_update_retransmit_timeout.is_set())
-            self.assertFalse(query_neighbor.dd_packet_retransmit_shutdown.is_set())
-            self.assertFalse(query_neighbor.ls_request_retransmit_shutdown.is_set())
-            self.assertFalse(query_neighbor.ls_update_retransmit_shutdown.is_set())
 
     #  Successful run - 1 s
     def test_constructor_invalid_parameters(self):
@@ -89,9 +84,8 @@ class TestNeighbor(unittest.TestCase):
         time.sleep(conf.ROUTER_DEAD_INTERVAL + 1)
         self.assertTrue(self.neighbor_v2.is_expired())
 
-        self.assertFalse(self.neighbor_v2.reset.is_set())
         self.assertTrue(self.neighbor_v2.inactivity_timeout.is_set())
-        self.assertFalse(self.neighbor_v2.inactivity_shutdown.is_set())
+        self.assertFalse(self.neighbor_v2.inactivity_timer.is_running())
 
     #  Successful run - 42 s
     def test_reset_inactivity_timer(self):
@@ -101,9 +95,21 @@ class TestNeighbor(unittest.TestCase):
         time.sleep((conf.ROUTER_DEAD_INTERVAL / 2) + 1)
         self.assertFalse(self.neighbor_v2.is_expired())
 
-        self.assertFalse(self.neighbor_v2.reset.is_set())
         self.assertFalse(self.neighbor_v2.inactivity_timeout.is_set())
-        self.assertFalse(self.neighbor_v2.inactivity_shutdown.is_set())
+        self.assertTrue(self.neighbor_v2.inactivity_timer.is_running())
+
+    #  Successful run - 3 s
+    def test_minimal_router_dead_interval(self):
+        fast_neighbor = neighbor.Neighbor(
+            self.neighbor_id, self.neighbor_priority, 0, self.neighbor_ipv4_address, self.neighbor_options,
+            self.neighbor_dr, self.neighbor_bdr, conf.ROUTER_ID, conf.MINIMAL_ROUTER_DEAD_INTERVAL)
+        for i in range(6):  # Hello packets are received several times per second
+            time.sleep(conf.MINIMAL_ROUTER_DEAD_INTERVAL / 4)
+            fast_neighbor.reset_inactivity_timer()
+        self.assertFalse(fast_neighbor.is_expired())
+        time.sleep(conf.MINIMAL_ROUTER_DEAD_INTERVAL + 0.1)
+        self.assertTrue(fast_neighbor.is_expired())
+        fast_neighbor.delete_neighbor()
 
     #  Successful run - 15 s
     def test_retransmission_timer(self):
@@ -121,11 +127,11 @@ class TestNeighbor(unittest.TestCase):
                 self.assertFalse(query_neighbor.dd_packet_retransmit_timeout.is_set())
                 self.assertFalse(query_neighbor.ls_request_retransmit_timeout.is_set())
                 self.assertFalse(query_neighbor.ls_update_retransmit_timeout.is_set())
-                self.assertTrue(query_neighbor.dd_packet_retransmit_thread.isAlive())
-                self.assertTrue(query_neighbor.ls_request_retransmit_thread.isAlive())
-                self.assertTrue(query_neighbor.ls_update_retransmit_thread.isAlive())
+                self.assertTrue(query_neighbor.dd_packet_retransmit_timer.is_running())
+                self.assertTrue(query_neighbor.ls_request_retransmit_timer.is_running())
+                self.assertTrue(query_neighbor.ls_update_retransmit_timer.is_running())
 
-            time.sleep(5)
+            time.sleep(conf.RETRANSMISSION_INTERVAL + 0.1)  # Timer fires at its deadline, not before
             for query_neighbor in [self.neighbor_v2, self.neighbor_v3]:
                 self.assertTrue(query_neighbor.is_retransmission_time(neighbor.DB_DESCRIPTION))
                 self.assertTrue(query_neighbor.is_retransmission_time(neighbor.LS_REQUEST))
@@ -139,9 +145,9 @@ class TestNeighbor(unittest.TestCase):
                     query_neighbor.stop_retransmission_timer(neighbor.LS_REQUEST)
                     query_neighbor.stop_retransmission_timer(neighbor.LS_UPDATE)
                     time.sleep(1)
-                    self.assertFalse(query_neighbor.dd_packet_retransmit_thread.isAlive())
-                    self.assertFalse(query_neighbor.ls_request_retransmit_thread.isAlive())
-                    self.assertFalse(query_neighbor.ls_update_retransmit_thread.isAlive())
+                    self.assertFalse(query_neighbor.dd_packet_retransmit_timer.is_running())
+                    self.assertFalse(query_neighbor.ls_request_retransmit_timer.is_running())
+                    self.assertFalse(query_neighbor.ls_update_retransmit_timer.is_running())
                     query_neighbor.dd_packet_retransmit_timeout.set()
                     query_neighbor.ls_request_retransmit_timeout.set()
                     query_neighbor.ls_update_retransmit_timeout.set()
@@ -151,12 +157,12 @@ class TestNeighbor(unittest.TestCase):
 
     #  Successful run - 2 s
     def test_delete_neighbor(self):
-        self.assertFalse(self.neighbor_v2.inactivity_shutdown.is_set())
+        self.assertTrue(self.neighbor_v2.inactivity_timer.is_running())
         self.neighbor_v2.delete_neighbor()
         time.sleep(1)
-        self.assertFalse(self.neighbor_v2.reset.is_set())
-        self.assertTrue(self.neighbor_v2.inactivity_timeout.is_set())
-        self.assertTrue(self.neighbor_v2.inactivity_shutdown.is_set())
+        self.assertTrue(self.neighbor_v2.inactivity_timeout.is_set())  # Timeout event is set on shutdown
+        self.assertFalse(self.neighbor_v2.inactivity_timer.is_running())
+        self.assertFalse(self.neighbor_v2.dd_packet_retransmit_timer.is_running())
 
     #  Successful run - 1 s
     def test_parameter_validation_successful(self):
@@ -85,6 +85,24 @@ class TestDBDescription(unittest.TestCase):
             db_description.DBDescription(self.interface_mtu, self.options, self.i_bit, self.m_bit, self.ms_bit,
                                          self.dd_sequence_number, (), 1)
 
+    #  Successful run - Instant
+    def test_from_wire(self):
+        packet_body = db_description.DBDescription.from_wire(
+            self.interface_mtu, self.options, self.i_bit, self.m_bit, self.ms_bit, self.dd_sequence_number,
+            (self.lsa_header_3, self.lsa_header_4), conf.VERSION_IPV6)
+        self.assertEqual(self.db_description_ospfv3.pack_packet_body(), packet_body.pack_packet_body())
+
+        #  Fields that can be invalid in a byte stream with the correct format are still validated
+        with self.assertRaises(ValueError):
+            db_description.DBDescription.from_wire(
+                0, self.options, self.i_bit, self.m_bit, self.ms_bit, self.dd_sequence_number, (), conf.VERSION_IPV4)
+        with self.assertRaises(ValueError):
+            db_description.DBDescription.from_wire(self.interface_mtu, self.options, True, False, self.ms_bit,
+                                                   self.dd_sequence_number, (), conf.VERSION_IPV4)
+        with self.assertRaises(ValueError):
+            db_description.DBDescription.from_wire(self.interface_mtu, self.options, True, True, True,
+                                                   self.dd_sequence_number, (self.lsa_header_1,), conf.VERSION_IPV4)
+
     #  Successful run - Instant
     def test_pack_packet(self):
         packet_body_bytes = b'\x00\x01\x02\x07\x00\x00\x00\x03'
@@ -223,6 +241,15 @@ class TestDBDescription(unittest.TestCase):
         with self.assertRaises(ValueError):
             db_description.DBDescription.get_format_string(-1)
 
+    #  Successful run - Instant
+    def test_get_struct(self):
+        self.assertEqual(
+            db_description.OSPFV2_BASE_FORMAT_STRING, db_description.DBDescription.get_struct(conf.VERSION_IPV4).format)
+        self.assertEqual(
+            db_description.OSPFV3_BASE_FORMAT_STRING, db_description.DBDescription.get_struct(conf.VERSION_IPV6).format)
+        with self.assertRaises(ValueError):
+            db_description.DBDescription.get_struct(-1)
+
     #  Successful run - Instant
     def test_parameter_validation_successful(self):
         #  Correct Interface MTU
@@ -0,0 +1,101 @@
+import unittest
+import struct
+
+import packet.packet as packet
+import lsa.lsa as lsa
+import conf.conf as conf
+import test.benchmark.message_generator as message_generator
+
+'''
+This class round-trips randomly generated LSAs and packets through the codecs, and feeds them corrupted byte streams
+'''
+
+SEED = 2024  # Fixed, so that failures can be reproduced
+ITERATIONS = 20  # Messages created for each LSA or packet type, OSPF version and number of records
+RECORD_NUMBERS = [0, 1, 7, 40]
+CORRUPTIONS = 2000  # Corrupted byte streams decoded for each OSPF version
+SOURCE_ADDRESS = 'fe80::1'  # Used by the message generator in OSPFv3 packets
+
+
+#  Full successful run - 2-5 s
+class TestFuzz(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = message_generator.get_generator(SEED)
+
+    #  Successful run - 1-2 s
+    def test_lsa_round_trip(self):
+        for version in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+            for lsa_type_name, create_lsa in message_generator.LSA_CREATORS[version].items():
+                for record_number in RECORD_NUMBERS:
+                    for _ in range(ITERATIONS):
+                        original_lsa = create_lsa(self.generator, record_number, version)
+                        lsa_bytes = original_lsa.pack_lsa()
+                        self.check_lsa(original_lsa, lsa.Lsa.unpack_lsa(lsa_bytes, version), lsa_type_name)
+
+    #  Successful run - 1-2 s
+    def test_packet_round_trip(self):
+        for version in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+            for packet_type_name, create_packet in message_generator.PACKET_CREATORS.items():
+                for record_number in RECORD_NUMBERS:
+                    for _ in range(ITERATIONS // 4):
+                        original_packet = create_packet(self.generator, record_number, version)
+                        packet_bytes = original_packet.pack_packet()
+                        self.assertTrue(packet.Packet.is_packet_bytes_checksum_valid(
+                            packet_bytes, SOURCE_ADDRESS, conf.ALL_OSPF_ROUTERS_IPV6), packet_type_name)
+                        unpacked_packet = packet.Packet.unpack_packet(packet_bytes)
+                        self.assertEqual(packet_bytes, unpacked_packet.pack_packet(), packet_type_name)
+                        self.assertEqual(original_packet.header.router_id, unpacked_packet.header.router_id)
+                        if packet_type_name == 'LS Update':
+                            self.assertEqual(len(original_packet.body.lsa_list), len(unpacked_packet.body.lsa_list))
+                            for original_lsa, unpacked_lsa in zip(
+                                    original_packet.body.lsa_list, unpacked_packet.body.lsa_list):
+                                self.check_lsa(original_lsa, unpacked_lsa, packet_type_name)
+
+    #  Successful run - 1-2 s
+    def test_corrupted_packets(self):
+        for version in [conf.VERSION_IPV4, conf.VERSION_IPV6]:
+            packet_creators = list(message_generator.PACKET_CREATORS.values())
+            for _ in range(CORRUPTIONS):
+                create_packet = self.generator.choice(packet_creators)
+                new_packet = create_packet(self.generator, self.generator.choice([1, 3]), version)
+                corrupted_bytes = self.corrupt(bytearray(new_packet.pack_packet()))
+
+                #  Decoding either succeeds or fails with one of the errors by which malformed packets are discarded
+                try:
+                    unpacked_packet = packet.Packet.unpack_packet(corrupted_bytes)
+                except (ValueError, IndexError, struct.error):
+                    continue
+                if unpacked_packet.header.packet_type == conf.PACKET_TYPE_LS_UPDATE:
+                    for unpacked_lsa in unpacked_packet.body.lsa_list:
+                        unpacked_lsa.body  # LSA body with invalid content is discarded, without raising exception
+
+    #  Asserts that provided LSAs have the same content, and that decoded LSA has valid checksum
+    def check_lsa(self, original_lsa, unpacked_lsa, message):
+        self.assertEqual(original_lsa.pack_lsa(), unpacked_lsa.pack_lsa(), message)
+        self.assertEqual(original_lsa.header.get_lsa_identifier(), unpacked_lsa.header.get_lsa_identifier(), message)
+        self.assertEqual(original_lsa.header.ls_sequence_number, unpacked_lsa.header.ls_sequence_number, message)
+        self.assertTrue(unpacked_lsa.is_lsa_checksum_valid(), message)
+
+        #  Decoded body is encoded back into the same byte stream
+        self.assertIsNotNone(unpacked_lsa.body, message)
+        self.assertEqual(original_lsa.body.pack_lsa_body(), unpacked_lsa.body.pack_lsa_body(), message)
+
+    #  Returns provided byte stream with random bytes changed, truncated or extended
+    def corrupt(self, byte_stream):
+        corruption = self.generator.randint(0, 3)
+        if corruption == 0:  # Random bytes are changed
+            for _ in range(self.generator.randint(1, 4)):
+                byte_stream[self.generator.randrange(len(byte_stream))] = self.generator.getrandbits(8)
+        elif corruption == 1:  # Byte stream is truncated
+            byte_stream = byte_stream[:self.generator.randrange(len(byte_stream))]
+        elif corruption == 2:  # Random bytes are appended
+            byte_stream += bytes(self.generator.getrandbits(8) for _ in range(self.generator.randint(1, 40)))
+        else:  # Random 16-bit field, such as an LSA length, is set to a boundary value
+            offset = self.generator.randrange(max(1, len(byte_stream) - 1))
+            byte_stream[offset:offset + 2] = struct.pack("> H", self.generator.choice([0, 1, 19, 20, 21, 0xFFFF]))
+        return bytes(byte_stream)
+
+
+if __name__ == '__main__':
+    unittest.main()
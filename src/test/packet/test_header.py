@@ -75,6 +75,23 @@ class TestHeader(unittest.TestCase):
             header.Header(conf.VERSION_IPV6, self.packet_type, self.router_id, self.area_id, self.auth_type,
                           self.authentication, instance_id)
 
+    #  Successful run - Instant
+    def test_header_from_wire(self):
+        header_ospfv2 = header.Header.from_wire(
+            conf.VERSION_IPV4, self.packet_type, self.router_id, self.area_id, self.auth_type, self.authentication, 0)
+        header_ospfv3 = header.Header.from_wire(
+            conf.VERSION_IPV6, self.packet_type, self.router_id, self.area_id, 0, 0, self.instance_id)
+        self.assertEqual(self.header_ospfv2.pack_header(), header_ospfv2.pack_header())
+        self.assertEqual(self.header_ospfv3.pack_header(), header_ospfv3.pack_header())
+
+        #  Fields that can be invalid in a byte stream with the correct format are still validated
+        with self.assertRaises(ValueError):
+            header.Header.from_wire(1, self.packet_type, self.router_id, self.area_id, self.auth_type, 0, 0)
+        with self.assertRaises(ValueError):
+            header.Header.from_wire(conf.VERSION_IPV4, 6, self.router_id, self.area_id, self.auth_type, 0, 0)
+        with self.assertRaises(ValueError):
+            header.Header.from_wire(conf.VERSION_IPV4, self.packet_type, self.router_id, self.area_id, 3, 0, 0)
+
     #  Successful run - Instant
     def test_pack_header(self):
         header_bytes = b'\x02\x01\x00\x00\x01\x01\x01\x01\x02\x02\x02\x02\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00' \
@@ -341,6 +358,13 @@ class TestHeader(unittest.TestCase):
         with self.assertRaises(ValueError):
             header.Header.get_format_string(1)
 
+    #  Successful run - Instant
+    def test_get_struct(self):
+        self.assertEqual(header.OSPFV2_FORMAT_STRING, header.Header.get_struct(conf.VERSION_IPV4).format)
+        self.assertEqual(header.OSPFV3_FORMAT_STRING, header.Header.get_struct(conf.VERSION_IPV6).format)
+        with self.assertRaises(ValueError):
+            header.Header.get_struct(1)
+
 
 if __name__ == '__main__':
     unittest.main()
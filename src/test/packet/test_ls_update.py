@@ -460,6 +460,33 @@ class TestLSUpdate(unittest.TestCase):
         self.assertEqual('3.3.3.3', unpacked_body.lsa_list[12].body.referenced_advertising_router)
         self.assertEqual([[64, 0, 0, '2001:db8:cafe:5::']], unpacked_body.lsa_list[12].body.prefixes)
 
+    #  Successful run - Instant
+    def test_unpack_packet_memoryview(self):
+        body_bytes = b'\x00\x00\x00\x02\x00\x05"\x01\x01\x01\x01\x01\x01\x01\x01\x01\x80\x00\x00\x04\x8c\xf3\x00T\x00' \
+                     b'\x00\x00\x05\x03\x03\x03\x03\xde\xde\x06\x01\x01\x00\x00@\xde\xde\x06\x00\xff\xff\xff\x00\x03' \
+                     b'\x00\x00@\xde\xde\x03\x00\xff\xff\xff\x00\x03\x00\x00\n\xde\xde\x02\x00\xff\xff\xff\x00\x03' \
+                     b'\x00\x00\n\xde\xde\x01\x00\xff\xff\xff\x00\x03\x00\x00\x01\x01!"\x02\xde\xde\x03\x02\x02\x02' \
+                     b'\x02\x02\x80\x00\x00\x01\xe0\x82\x00 \xff\xff\xff\x00\x02\x02\x02\x02\x01\x01\x01\x01'
+
+        #  Packet body is read from a larger buffer without being copied
+        buffer = bytearray(b'\xff' * 8 + body_bytes + b'\xff' * 8)
+        unpacked_body = ls_update.LSUpdate.unpack_packet_body(memoryview(buffer)[8:-8], conf.VERSION_IPV4)
+        self.assertEqual(2, len(unpacked_body.lsa_list))
+        self.assertEqual(body_bytes, unpacked_body.pack_packet_body())
+        self.assertEqual(5, len(unpacked_body.lsa_list[0].body.links))
+        self.assertEqual('222.222.3.2', unpacked_body.lsa_list[1].header.link_state_id)
+        self.assertEqual(['2.2.2.2', '1.1.1.1'], unpacked_body.lsa_list[1].body.attached_routers)
+
+        #  Unpacked packet keeps no references to the buffer
+        buffer.extend(b'\x00')
+
+        #  LSA with length shorter than an LSA header
+        for ls_length in [0, conf.LSA_HEADER_LENGTH - 1]:
+            invalid_body_bytes = bytearray(body_bytes)
+            invalid_body_bytes[22:24] = ls_length.to_bytes(2, byteorder='big')
+            with self.assertRaises(ValueError):
+                ls_update.LSUpdate.unpack_packet_body(bytes(invalid_body_bytes), conf.VERSION_IPV4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import copy
 
 import packet.packet as packet
+import lsa.header as header
 import conf.conf as conf
 
 '''
@@ -320,6 +321,52 @@ class PacketTest(unittest.TestCase):
         self.assertFalse(self.packet_v2.is_packet_checksum_valid('', ''))
         self.assertFalse(self.packet_v3.is_packet_checksum_valid('fe80::c001:18ff:fe34:10', 'ff02::5'))
 
+    #  Successful run - Instant
+    def test_pack_packet_to_send(self):
+        self.packet_v2.create_hello_v2_packet_body(
+            '255.255.255.0', 10, 2, 1, 40, '222.222.1.1', '0.0.0.0', ('1.1.1.1',))
+        self.packet_v3.create_hello_v3_packet_body(1, 10, 2, 1, 40, '222.222.1.1', '0.0.0.0', ('1.1.1.1',))
+        packet_v2_bytes = self.packet_v2.pack_packet()
+        packet_v3_bytes = self.packet_v3.pack_packet()
+
+        #  Packet built for the same addresses is sent as it is
+        self.assertEqual(packet_v2_bytes, self.packet_v2.pack_packet_to_send('', 'ff02::5'))
+        self.assertEqual(packet_v3_bytes, self.packet_v3.pack_packet_to_send(
+            self.source_ipv6_address, self.destination_ipv6_address))
+
+        #  OSPFv3 checksum is recomputed for other destination
+        new_packet_bytes = self.packet_v3.pack_packet_to_send(self.source_ipv6_address, 'ff02::6')
+        self.assertNotEqual(packet_v3_bytes, new_packet_bytes)
+        self.assertTrue(packet.Packet.is_packet_bytes_checksum_valid(
+            new_packet_bytes, self.source_ipv6_address, 'ff02::6'))
+        self.assertTrue(packet.Packet.is_packet_bytes_checksum_valid(packet_v2_bytes, '', ''))
+
+    #  Successful run - Instant
+    def test_finalize_packet(self):
+        lsa_header = header.Header(1, 2, 1, '1.1.1.1', '1.1.1.1', 0x80000001, conf.VERSION_IPV4)
+        self.packet_v2.header.packet_type = conf.PACKET_TYPE_LS_ACKNOWLEDGMENT
+        self.packet_v2.create_ls_acknowledgement_packet_body(conf.VERSION_IPV4)
+        self.assertTrue(self.packet_v2.is_finalized)
+        self.assertEqual(conf.OSPFV2_PACKET_HEADER_LENGTH, self.packet_v2.header.length)
+
+        #  Packet length and checksum are only set when packet is packed
+        for _ in range(100):
+            self.packet_v2.add_lsa_header(lsa_header)
+        self.assertFalse(self.packet_v2.is_finalized)
+        self.assertEqual(conf.OSPFV2_PACKET_HEADER_LENGTH, self.packet_v2.header.length)
+        packet_bytes = self.packet_v2.pack_packet()
+        self.assertTrue(self.packet_v2.is_finalized)
+        self.assertEqual(conf.OSPFV2_PACKET_HEADER_LENGTH + 100 * conf.LSA_HEADER_LENGTH,
+                         self.packet_v2.header.length)
+        self.assertEqual(len(packet_bytes), self.packet_v2.header.length)
+        self.assertTrue(packet.Packet.is_packet_bytes_checksum_valid(packet_bytes, '', ''))
+        self.assertEqual(packet_bytes, self.packet_v2.pack_packet())
+
+        #  Received packet is packed as it is
+        unpacked_packet = packet.Packet.unpack_packet(packet_bytes)
+        self.assertTrue(unpacked_packet.is_finalized)
+        self.assertEqual(packet_bytes, unpacked_packet.pack_packet())
+
     #  Successful run - Instant
     def test_deep_copy(self):
         self.packet_v2.create_hello_v2_packet_body('255.255.255.0', 10, 18, 1, 40, '222.222.1.1', '0.0.0.0', ())
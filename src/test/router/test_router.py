@@ -5,6 +5,7 @@ import multiprocessing
 import copy
 
 import router.router as router
+import general.utils as utils
 import conf.conf as conf
 import area.area as area
 import router.kernel_table as kernel_table
@@ -43,7 +44,10 @@ class RouterTest(unittest.TestCase):
                     router_interfaces.append(interface_id)
                     self.assertTrue(r.areas[area_id].is_interface_operating(interface_id))
         self.assertEqual(set(conf.INTERFACE_NAMES), set(router_interfaces))
-        self.assertEqual(conf.MTU, r.max_ip_datagram)
+        max_ip_datagram = 0
+        for interface_id in conf.INTERFACE_NAMES:
+            max_ip_datagram = max(max_ip_datagram, utils.Utils.interface_name_to_mtu(interface_id))
+        self.assertEqual(max_ip_datagram, r.max_ip_datagram)
 
         self.assertEqual(len(conf.INTERFACE_NAMES), len(r.packet_pipelines))
         self.assertEqual(len(conf.INTERFACE_NAMES), len(r.socket_shutdown_events))
@@ -374,6 +374,26 @@ class TestRoutingTable(unittest.TestCase):
         self.assertEqual(next_hop_address, path.next_hop_address)
         self.assertEqual(advertising_router, path.advertising_router)
 
+    #  Successful run - Instant
+    def test_create_unchecked(self):
+        table = routing_table.RoutingTable()
+        table.add_entry(conf.DESTINATION_TYPE_NETWORK, '222.222.1.0', 24, 0, '0.0.0.0', validate=False)
+        entry = table.get_entry(conf.DESTINATION_TYPE_NETWORK, '222.222.1.0', '0.0.0.0')
+        entry.add_path(conf.INTRA_AREA_PATH, 10, 0, 'ens33', '222.222.1.1', '', validate=False)
+        self.assertEqual(24, entry.prefix_length)
+        self.assertEqual(1, len(entry.paths))
+        self.assertEqual('ens33', entry.paths[0].outgoing_interface)
+        self.assertEqual(str(routing_table.RoutingTablePath(conf.INTRA_AREA_PATH, 10, 0, 'ens33', '222.222.1.1', '')),
+                         str(entry.paths[0]))
+
+        #  Validation is skipped
+        entry = routing_table.RoutingTableEntry.create_unchecked(
+            conf.DESTINATION_TYPE_NETWORK, '0.0.0.0', 0, 0, '0.0.0.0')
+        self.assertEqual('0.0.0.0', entry.destination_id)
+        self.assertEqual([], entry.paths)
+        with self.assertRaises(ValueError):
+            table.add_entry(conf.DESTINATION_TYPE_NETWORK, '0.0.0.0', 0, 0, '0.0.0.0')
+
     #  The following tests test the methods related to the creation of the routing table, regardless of their class
 
     #  Successful run - Instant